@@ -1,4 +1,5 @@
 # flake8: noqa
+from .batch import Call
 from .exceptions import ArrestHTTPException, RequestError
 from .handler import H
 from .http import Methods
@@ -18,6 +19,7 @@ OPTIONS = Methods.OPTIONS
 
 __all__ = [
     "ArrestHTTPException",
+    "Call",
     "H",
     "Methods",
     "RequestError",
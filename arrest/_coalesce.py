@@ -0,0 +1,65 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from arrest._config import ArrestConfig
+from arrest.http import Methods
+from arrest.params import RequestArgs
+
+T = TypeVar("T")
+
+# methods without side-effects, safe to answer with a shared response
+SAFE_METHODS = frozenset({Methods.GET, Methods.HEAD, Methods.OPTIONS})
+
+
+def coalesce_key(
+    method: Methods, url: str, args: RequestArgs, config: ArrestConfig
+) -> Hashable | None:
+    """Identify a request for coalescing, ``None`` if it must not be shared.
+
+    Only what changes the response is part of the key, ``raise_for_status``
+    is applied to the shared response by each caller.
+    """
+    if method not in SAFE_METHODS or args.body or args.files:
+        return None
+
+    headers = args.header.multi_items()
+    if config.coalesce_headers is not None:
+        selected = {name.lower() for name in config.coalesce_headers}
+        headers = [(name, value) for name, value in headers if name in selected]
+
+    return (
+        method,
+        url,
+        tuple(sorted(args.query.multi_items())),
+        tuple(sorted(headers)),
+        tuple(sorted((str(k), str(v)) for k, v in config.cookies.items())),
+        id(config.auth),
+        config.follow_redirects,
+    )
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, concurrent callers asking
+    for the same key await the call already in flight and share its result.
+
+    The call runs in its own task, so a caller being cancelled does not
+    cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, even if every caller went away
@@ -1,9 +1,16 @@
 import ssl
 from dataclasses import dataclass, field, fields
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Literal, Mapping
 
 from httpx import AsyncBaseTransport, AsyncClient, Limits, _types
 
+from arrest.breaker import CircuitBreaker
+from arrest.cache import ResponseCache
+from arrest.hedging import HedgePolicy
+from arrest.limiter import AdaptiveLimit
+from arrest.ratelimit import RateLimit
+from arrest.retry import RetryPolicy
+
 
 @dataclass(frozen=True, kw_only=True)
 class ArrestConfig:
@@ -15,14 +22,55 @@ class ArrestConfig:
     Dict fields (``headers``, ``cookies``, ``params``) merge additively.
     All other fields, including httpx client inputs and ``client``, are
     overridden by the highest-priority non-``None`` value.
+
+    Setting ``coalesce=True`` lets concurrent, identical ``GET`` / ``HEAD`` /
+    ``OPTIONS`` requests share a single in-flight call. Requests are identical
+    when their method, url, query params, cookies and headers match; restrict
+    the compared headers with ``coalesce_headers``.
+
+    Setting ``cache`` (e.g. ``arrest.cache.MemoryCache()``) caches the
+    responses of ``GET`` requests, honouring ``Cache-Control`` and
+    revalidating stale entries with their ``ETag`` / ``Last-Modified``.
+
+    Setting ``rate_limit`` (e.g. ``arrest.ratelimit.RateLimit(rps=200)``)
+    limits the rate of requests sent. The instance holds the limiter state,
+    so every request whose merged config holds it shares the same budget.
+
+    Setting ``adaptive_limit`` (``arrest.limiter.AdaptiveLimit()``) bounds
+    the number of concurrent requests per base url, with a limit adapted to
+    the latency and errors of the remote.
+
+    Setting ``circuit_breaker`` (``arrest.breaker.CircuitBreaker()``) fails
+    the calls to a handler immediately, with ``CircuitOpenError``, while its
+    upstream keeps failing.
+
+    Setting ``hedge`` (``arrest.hedging.HedgePolicy()``) sends a second
+    request when an idempotent one is slower than usual, the first answer
+    wins.
+
+    Setting ``retry`` (``arrest.retry.RetryPolicy()``) retries requests
+    failing with a transport error or a retryable status code (``429``,
+    ``502``, ``503``, ``504``), within a retry budget. It replaces
+    ``max_retries``, which only retries transport errors.
+
+    Setting ``deadline`` bounds the time a call may take in total, across
+    retries, backoff waits and the callback, while ``timeout`` applies to
+    each attempt.
+
+    Setting ``decode=False`` skips parsing response bodies (``data`` is
+    ``None``), ``decode="lazy"`` parses and validates a body on the first
+    access to ``Response.data``.
+
+    Setting ``json_encoders`` (e.g. ``{Decimal: str}``) encodes the values of
+    json request bodies that orjson cannot serialize itself, by type.
     """
 
-    headers: dict[str, str] = field(default_factory=dict)
-    cookies: dict[str, Any] = field(default_factory=dict)
-    params: dict[str, Any] = field(default_factory=dict)
-    timeout: float | None = None
-    auth: Any | None = None
-    follow_redirects: bool | None = None
+    headers: dict[str, str] = field(default_factory=dict, metadata={"request": True})
+    cookies: dict[str, Any] = field(default_factory=dict, metadata={"request": True})
+    params: dict[str, Any] = field(default_factory=dict, metadata={"request": True})
+    timeout: float | None = field(default=None, metadata={"request": True})
+    auth: Any | None = field(default=None, metadata={"request": True})
+    follow_redirects: bool | None = field(default=None, metadata={"request": True})
     raise_for_status: bool | None = None
     client: AsyncClient | None = None
     verify: ssl.SSLContext | bool | str | None = None
@@ -37,11 +85,32 @@ class ArrestConfig:
     default_encoding: str | Callable[[bytes], str] | None = None
 
     max_retries: int | None = field(default=None, metadata={"internal": True})
+    coalesce: bool | None = field(default=None, metadata={"internal": True})
+    coalesce_headers: tuple[str, ...] | None = field(
+        default=None, metadata={"internal": True}
+    )
+    cache: ResponseCache | None = field(default=None, metadata={"internal": True})
+    rate_limit: RateLimit | None = field(default=None, metadata={"internal": True})
+    adaptive_limit: AdaptiveLimit | None = field(
+        default=None, metadata={"internal": True}
+    )
+    circuit_breaker: CircuitBreaker | None = field(
+        default=None, metadata={"internal": True}
+    )
+    hedge: HedgePolicy | None = field(default=None, metadata={"internal": True})
+    retry: RetryPolicy | None = field(default=None, metadata={"internal": True})
+    deadline: float | None = field(default=None, metadata={"internal": True})
+    decode: bool | Literal["lazy"] | None = field(
+        default=None, metadata={"internal": True}
+    )
+    json_encoders: Mapping[type, Callable[[Any], Any]] | None = field(
+        default=None, metadata={"internal": True}
+    )
 
     def httpx_args(self) -> dict[str, Any]:
         """Return only fields valid as ``httpx.AsyncClient`` / request kwargs.
 
-        Excludes arrest-internal fields (``max_retries``) and user-facing
+        Excludes arrest-internal fields (``max_retries``, ...) and user-facing
         flags that are not httpx constructor args (``client``, ``raise_for_status``).
         """
         internal_fields = {
@@ -55,6 +124,23 @@ class ArrestConfig:
             if f.name not in internal_fields and getattr(self, f.name) is not None
         }
 
+    def client_args(self) -> dict[str, Any]:
+        """Return the subset of ``httpx_args`` that is fixed once an
+        ``httpx.AsyncClient`` is constructed (TLS, proxy, transport, limits...).
+
+        Request-level fields (``headers``, ``cookies``, ``params``, ``timeout``,
+        ``auth``, ``follow_redirects``) are sent along with every request instead,
+        so a single pooled client can serve calls that only differ in those.
+        """
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if not f.metadata.get("request")
+            and not f.metadata.get("internal")
+            and f.name not in {"client", "raise_for_status"}
+            and getattr(self, f.name) is not None
+        }
+
     def merge(self, overrides: "ArrestConfig | None") -> "ArrestConfig":
         """Return a new config with *overrides* layered on top of *self*."""
         if overrides is None:
@@ -74,3 +160,42 @@ class ArrestConfig:
                 )
 
         return ArrestConfig(**merged)
+
+    def overlay(self, **overrides: Any) -> "ArrestConfig":
+        """Return a config with per-call *overrides* layered on top of *self*.
+
+        A cheaper ``merge`` for the request path: only fields that do not
+        shape the ``httpx.AsyncClient`` can be overridden, ``None`` and empty
+        values are skipped, and *self* is returned as is when nothing is left.
+        Otherwise the fields are shared with *self*, along with what is
+        cached about its client (see ``arrest._pool.client_key``).
+        """
+        changes: dict[str, Any] = {}
+        for name, value in overrides.items():
+            if name not in _OVERLAY_FIELDS:
+                raise TypeError(f"{name!r} cannot be overridden per call")
+            if value is None or (name in _DICT_FIELDS and not value):
+                continue
+            changes[name] = (
+                {**getattr(self, name), **value} if name in _DICT_FIELDS else value
+            )
+
+        if not changes:
+            return self
+
+        config = object.__new__(ArrestConfig)
+        config.__dict__.update(self.__dict__)
+        config.__dict__.update(changes)
+        return config
+
+
+_DICT_FIELDS = frozenset({"headers", "cookies", "params"})
+
+# fields that are not part of `client_args`, changing them keeps the client
+_OVERLAY_FIELDS = frozenset(
+    config_field.name
+    for config_field in fields(ArrestConfig)
+    if config_field.metadata.get("request")
+    or config_field.metadata.get("internal")
+    or config_field.name in {"client", "raise_for_status"}
+)
@@ -0,0 +1,190 @@
+import asyncio
+import time
+from collections import OrderedDict
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Hashable, Mapping
+
+import httpx
+
+from arrest._config import ArrestConfig
+from arrest.defaults import CLIENT_IDLE_TIMEOUT, MAX_POOLED_CLIENTS
+from arrest.logging import logger
+
+
+def fingerprint(client_args: Mapping[str, Any]) -> Hashable:
+    """Build a hashable key out of ``ArrestConfig.client_args()``.
+
+    Values that cannot be hashed (dicts, lists, ``httpx.Limits``) are
+    frozen recursively, anything else falls back to its identity.
+    """
+    return tuple(
+        sorted(
+            ((name, _freeze(value)) for name, value in client_args.items()),
+            key=lambda item: item[0],
+        )
+    )
+
+
+def client_key(config: ArrestConfig | None) -> Hashable:
+    """The ``fingerprint`` of a config's ``client_args``, computed once per
+    config and shared with the per-call overlays built from it."""
+    if config is None:
+        return ()
+    # stored the way `functools.cached_property` does on frozen dataclasses
+    cached = config.__dict__
+    if (key := cached.get("_client_key")) is None:
+        key = cached["_client_key"] = fingerprint(config.client_args())
+    return key
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, httpx.Limits):
+        return (
+            httpx.Limits,
+            value.max_connections,
+            value.max_keepalive_connections,
+            value.keepalive_expiry,
+        )
+    if isinstance(value, Mapping):
+        return tuple(
+            sorted(
+                ((str(key), _freeze(val)) for key, val in value.items()),
+                key=lambda item: item[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), id(value))
+    return value
+
+
+class _RejectCookies(DefaultCookiePolicy):
+    """keeps a pooled client from storing the cookies set by a response, they
+    would be sent with the requests of every resource sharing the client"""
+
+    def set_ok(self, cookie: Any, request: Any) -> bool:
+        return False
+
+
+class _PooledClient:
+    __slots__ = ("client", "loop", "in_flight", "last_used", "evicted")
+
+    def __init__(
+        self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop, now: float
+    ) -> None:
+        self.client = client
+        self.loop = loop
+        self.in_flight = 0
+        self.last_used = now
+        self.evicted = False
+
+
+class ClientPool:
+    """Registry of the ``httpx.AsyncClient`` instances shared by every
+    resource bound to a ``Service``.
+
+    Clients are created lazily and keyed by the fingerprint of the
+    client-level fields of the merged config (``ArrestConfig.client_args``),
+    so resources and per-call overrides that agree on transport, TLS, proxy
+    and pool ``limits`` share one connection pool. Request-level settings are
+    sent with every request and never split the pool. Cookies set by responses
+    are not kept, as with the throwaway client of a request.
+
+    At most ``max_clients`` clients are kept, the least recently used one is
+    evicted first. Clients left unused for ``idle_timeout`` seconds are closed.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_clients: int = MAX_POOLED_CLIENTS,
+        idle_timeout: float = CLIENT_IDLE_TIMEOUT,
+    ) -> None:
+        self.base_url = base_url
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self._clients: OrderedDict[Hashable, _PooledClient] = OrderedDict()
+
+    @asynccontextmanager
+    async def lease(
+        self, config: ArrestConfig | None
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Borrow the client matching *config* for the duration of a request."""
+        entry = self._checkout(config)
+        entry.in_flight += 1
+        try:
+            await self._close_stale()
+            yield entry.client
+        finally:
+            entry.in_flight -= 1
+            entry.last_used = time.monotonic()
+            if entry.evicted and not entry.in_flight:
+                await self._close(entry)
+
+    async def aclose(self) -> None:
+        """Close every pooled client, new ones are created on the next request."""
+        entries = list(self._clients.values())
+        self._clients.clear()
+        for entry in entries:
+            await self._close(entry)
+
+    def _checkout(self, config: ArrestConfig | None) -> _PooledClient:
+        key = client_key(config)
+        loop = asyncio.get_running_loop()
+
+        entry = self._clients.get(key)
+        if entry is not None and (entry.client.is_closed or entry.loop is not loop):
+            # connections are bound to the event loop that opened them
+            logger.debug("discarding closed or stale pooled client")
+            del self._clients[key]
+            entry = None
+
+        if entry is None:
+            entry = _PooledClient(
+                client=httpx.AsyncClient(
+                    base_url=self.base_url,
+                    # only the cookies of the config and of the call are sent
+                    cookies=CookieJar(policy=_RejectCookies()),
+                    **(config.client_args() if config else {}),
+                ),
+                loop=loop,
+                now=time.monotonic(),
+            )
+            self._clients[key] = entry
+        else:
+            self._clients.move_to_end(key)
+
+        return entry
+
+    async def _close_stale(self) -> None:
+        now = time.monotonic()
+        stale: list[_PooledClient] = []
+
+        for key, entry in list(self._clients.items()):
+            if entry.in_flight:
+                continue
+            if (
+                len(self._clients) > self.max_clients
+                or now - entry.last_used > self.idle_timeout
+            ):
+                del self._clients[key]
+                stale.append(entry)
+
+        # still over capacity: evict the least recently used clients anyway,
+        # they are closed as soon as their in-flight requests are done
+        while len(self._clients) > self.max_clients:
+            _, entry = self._clients.popitem(last=False)
+            entry.evicted = True
+
+        for entry in stale:
+            await self._close(entry)
+
+    async def _close(self, entry: _PooledClient) -> None:
+        # a client opened on another (possibly closed) loop cannot be awaited here
+        if entry.loop is asyncio.get_running_loop():
+            await entry.client.aclose()
@@ -0,0 +1,167 @@
+from typing import Any
+
+from arrest.converters import (
+    FloatConverter,
+    IntegerConverter,
+    PathFormatter,
+    StrConverter,
+    UUIDConverter,
+)
+from arrest.handler import HandlerKey, ResourceHandler
+from arrest.http import Methods
+
+# built-in converters never match across a `/`, so their params always
+# fill exactly one path segment and can be indexed segment by segment
+_SEGMENT_CONVERTERS = (StrConverter, IntegerConverter, FloatConverter, UUIDConverter)
+
+
+class _Node:
+    __slots__ = ("children", "wildcard", "keys")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.wildcard: _Node | None = None
+        self.keys: list[HandlerKey] = []
+
+
+class RouteIndex:
+    """Lookup table for the handlers of a resource, built at bind time.
+
+    Handlers are indexed by method first. Routes without path params are
+    a plain dict hit on the path, parameterised routes live in a segment
+    trie where every segment holding a param is a wildcard edge. Lookups
+    only verify (with the handler's compiled regex) the few candidates
+    sharing the shape of the requested path, so the cost depends on the
+    number of path segments rather than the number of handlers.
+
+    Paths with params passed as kwargs are a segment-wise prefix of the
+    route (e.g. ``/posts`` or ``/posts/{post_id}`` for ``post_id=1``), they
+    walk the trie the same way and take every route below where they end,
+    among those having all the params passed.
+
+    If several handlers match, the one bound first wins, same as a linear
+    scan over `Resource.routes`.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[HandlerKey, ResourceHandler] = {}
+        self._formatters: dict[HandlerKey, PathFormatter] = {}
+        self._order: dict[HandlerKey, int] = {}
+        self._static: dict[Methods, dict[str, HandlerKey]] = {}
+        self._trees: dict[Methods, _Node] = {}
+        self._fallback: dict[Methods, list[HandlerKey]] = {}
+        self._params: dict[HandlerKey, frozenset[str]] = {}
+
+    def add(
+        self, key: HandlerKey, handler: ResourceHandler, formatter: PathFormatter
+    ) -> None:
+        """index a handler, replacing any handler bound to the same key,
+        `formatter` renders the resolved paths of the handler"""
+        if key in self._handlers:
+            self._discard(key)
+        else:
+            self._order[key] = len(self._order)
+        self._handlers[key] = handler
+        self._formatters[key] = formatter
+
+        method, path_format = key
+        param_types = handler._param_types or {}
+        self._params[key] = frozenset(param_types)
+
+        if not param_types:
+            self._static.setdefault(method, {})[path_format] = key
+            return
+
+        if not all(isinstance(c, _SEGMENT_CONVERTERS) for c in param_types.values()):
+            # custom converters may span several segments, scan these linearly
+            self._fallback.setdefault(method, []).append(key)
+            return
+
+        node = self._trees.setdefault(method, _Node())
+        for segment in path_format.split("/"):
+            if "{" in segment:
+                node.wildcard = node.wildcard or _Node()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(segment, _Node())
+        node.keys.append(key)
+
+    def match(
+        self, method: Methods, path: str, **kwargs: Any
+    ) -> tuple[ResourceHandler, str] | None:
+        """find the first bound handler matching `method` and `path`, returns
+        the handler along with the resolved path"""
+        candidates: list[HandlerKey] = []
+
+        if kwargs:
+            segments = path.split("/")
+            if len(segments) > 1 and not segments[-1]:
+                segments.pop()  # a prefix may end with a slash
+            if (tree := self._trees.get(method)) is not None:
+                self._collect(tree, segments, 0, candidates, prefix=True)
+            candidates.extend(self._fallback.get(method, ()))
+            candidates = [
+                key for key in candidates if kwargs.keys() <= self._params[key]
+            ]
+        else:
+            if (key := self._static.get(method, {}).get(path)) is not None:
+                candidates.append(key)
+            if (tree := self._trees.get(method)) is not None:
+                self._collect(tree, path.split("/"), 0, candidates)
+            candidates.extend(self._fallback.get(method, ()))
+
+        if len(candidates) > 1:
+            candidates.sort(key=self._order.__getitem__)
+
+        for key in candidates:
+            handler = self._handlers[key]
+            parsed_path = handler._parse_path(
+                method, path, kwargs, self._formatters[key]
+            )
+            if parsed_path is not None:
+                return handler, parsed_path
+
+        return None
+
+    def _collect(
+        self,
+        node: _Node,
+        segments: list[str],
+        idx: int,
+        out: list[HandlerKey],
+        prefix: bool = False,
+    ) -> None:
+        if idx == len(segments):
+            if prefix:
+                self._collect_below(node, out)
+            else:
+                out.extend(node.keys)
+            return
+
+        if (child := node.children.get(segments[idx])) is not None:
+            self._collect(child, segments, idx + 1, out, prefix)
+        # a param left in the path, like `{post_id}`, takes the wildcard edge
+        if node.wildcard is not None:
+            self._collect(node.wildcard, segments, idx + 1, out, prefix)
+
+    def _collect_below(self, node: _Node, out: list[HandlerKey]) -> None:
+        out.extend(node.keys)
+        for child in node.children.values():
+            self._collect_below(child, out)
+        if node.wildcard is not None:
+            self._collect_below(node.wildcard, out)
+
+    def _discard(self, key: HandlerKey) -> None:
+        method, path_format = key
+        self._static.get(method, {}).pop(path_format, None)
+
+        if key in (fallback := self._fallback.get(method, [])):
+            fallback.remove(key)
+
+        node: _Node | None = self._trees.get(method)
+        for segment in path_format.split("/"):
+            if node is None:
+                return
+            node = node.wildcard if "{" in segment else node.children.get(segment)
+        if node is not None and key in node.keys:
+            node.keys.remove(key)
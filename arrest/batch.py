@@ -0,0 +1,162 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Hashable,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from arrest.defaults import DEFAULT_CONCURRENCY
+from arrest.http import Methods
+from arrest.response import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from arrest.resource import Resource
+
+
+class Call:
+    """A single request of a batch, takes the same arguments as
+    [request][arrest.resource.Resource.request].
+
+    Usage:
+        ```python
+        >>> from arrest.batch import Call
+
+        >>> responses = await user_resource.gather(
+        ...     [Call("GET", "/", user_id=i) for i in range(100)],
+        ...     concurrency=16,
+        ... )
+        ```
+
+    Calls built with `Resource.call` are bound to that resource and can be
+    mixed in `Service.gather`.
+    """
+
+    __slots__ = ("method", "path", "options", "path_params", "resource")
+
+    def __init__(
+        self,
+        method: Methods | str,
+        path: str,
+        request: Union[BaseModel, Mapping[str, Any], None] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        query: Optional[Mapping[str, str]] = None,
+        cookies: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: Optional[bool] = None,
+        raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.method = Methods(method)
+        self.path = path
+        self.options: dict[str, Any] = {
+            "request": request,
+            "headers": headers,
+            "query": query,
+            "cookies": cookies,
+            "timeout": timeout,
+            "follow_redirects": follow_redirects,
+            "raise_for_status": raise_for_status,
+            "deadline": deadline,
+            "decode": decode,
+        }
+        self.path_params = kwargs
+        self.resource: "Resource | None" = None
+
+    def __repr__(self) -> str:
+        return f"Call({self.method.value} {self.path!r})"
+
+
+async def gather(
+    calls: Iterable[Call],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = True,
+    resource: "Resource | None" = None,
+) -> list[Response[Any] | Exception]:
+    """Run many calls concurrently, with at most `concurrency` in flight.
+
+    Results are returned in the order of `calls`. A failing call leaves its
+    exception in place of the response, or with `return_exceptions=False`
+    cancels the remaining calls and raises it.
+
+    Handler lookup and config merging are done once per distinct
+    `(resource, method, path, path params)` and reused by the other calls.
+    Calls that are not bound to a resource go to `resource`.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    calls = list(calls)
+    results: list[Any] = [None] * len(calls)
+    resolved: dict[Hashable, tuple[Any, ...]] = {}
+    pending = iter(enumerate(calls))
+
+    async def run(call: Call) -> Response[Any]:
+        target = call.resource or resource
+        if target is None:
+            raise ValueError(f"{call!r} is not bound to a resource")
+
+        key = _resolve_key(target, call)
+        if key is None or (plan := resolved.get(key)) is None:
+            handler, url, path_query_params = target._resolve(
+                call.method, call.path, call.path_params
+            )
+            plan = (handler, url, path_query_params, target._handler_config(handler))
+            if key is not None:
+                resolved[key] = plan
+
+        handler, url, path_query_params, base_config = plan
+        return await target._send(
+            call.method,
+            handler,
+            url,
+            path_query_params,
+            base_config=base_config,
+            **call.options,
+        )
+
+    async def worker() -> None:
+        # workers pull from a shared iterator, so at most `concurrency`
+        # tasks exist however many calls there are
+        for idx, call in pending:
+            try:
+                results[idx] = await run(call)
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                results[idx] = exc
+
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(calls)))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    return results
+
+
+def _resolve_key(resource: "Resource", call: Call) -> Hashable | None:
+    key = (
+        id(resource),
+        call.method,
+        call.path,
+        tuple(sorted(call.path_params.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
+
+import httpx
+
+from arrest.common import StrEnum
+from arrest.exceptions import CircuitOpenError
+from arrest.response import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from arrest.handler import HandlerKey
+
+T = TypeVar("T")
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "outcomes", "opened_at", "trials")
+
+    def __init__(self, window: int) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0  # consecutive
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """Fails calls to a handler immediately while its upstream is down.
+
+    Usage:
+        ```python
+        >>> ArrestConfig(circuit_breaker=CircuitBreaker(failure_threshold=5))
+        ```
+
+    Each handler, keyed by its `HandlerKey` (method and full route, e.g.
+    ``GET /users/{user_id}``), has its own circuit:
+
+    - **closed**: calls go through. Transport errors, timeouts and ``5xx``
+      responses are failures. The circuit opens after ``failure_threshold``
+      consecutive failures, or when ``failure_rate`` of the last ``window``
+      calls failed.
+    - **open**: calls raise `CircuitOpenError` without being sent, for
+      ``reset_timeout`` seconds.
+    - **half-open**: up to ``half_open_calls`` trial calls go through. The
+      circuit closes if they succeed and opens again if one fails.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int | None = 5,
+        failure_rate: float | None = None,
+        window: int = 20,
+        reset_timeout: float = 30,
+        half_open_calls: int = 1,
+    ) -> None:
+        if failure_threshold is None and failure_rate is None:
+            raise ValueError("set failure_threshold, failure_rate or both")
+        if failure_rate is not None and not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be between 0 and 1")
+
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self._circuits: dict["HandlerKey", _Circuit] = {}
+
+    def state(self, key: "HandlerKey") -> CircuitState:
+        """the state of the circuit of a handler"""
+        if (circuit := self._circuits.get(key)) is None:
+            return CircuitState.CLOSED
+        return self._current_state(circuit)
+
+    def states(self) -> dict["HandlerKey", CircuitState]:
+        """the state of every circuit used so far, e.g. for a health endpoint"""
+        return {
+            key: self._current_state(circuit) for key, circuit in self._circuits.items()
+        }
+
+    def reset(self) -> None:
+        """close every circuit"""
+        self._circuits.clear()
+
+    async def call(self, key: "HandlerKey", fn: Callable[[], Awaitable[T]]) -> T:
+        """make a call through the circuit of `key`"""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(self.window)
+
+        state = self._current_state(circuit)
+        if state == CircuitState.OPEN or (
+            state == CircuitState.HALF_OPEN and circuit.trials >= self.half_open_calls
+        ):
+            retry_after = circuit.opened_at + self.reset_timeout - time.monotonic()
+            raise CircuitOpenError(key, retry_after=max(0.0, retry_after))
+
+        trial = state == CircuitState.HALF_OPEN
+        if trial:
+            circuit.trials += 1
+
+        try:
+            result = await fn()
+        except (httpx.TimeoutException, httpx.TransportError):
+            self._record(circuit, trial, failed=True)
+            raise
+        except (asyncio.CancelledError, Exception):
+            # no answer to judge the upstream by, e.g. the request could not
+            # be built. An answer is judged by its status alone, below, its
+            # body is decoded and `raise_for_status` applied outside of the
+            # circuit
+            if trial and circuit.state == CircuitState.HALF_OPEN:
+                circuit.trials -= 1
+            raise
+
+        failed = isinstance(result, Response) and result.is_server_error
+        self._record(circuit, trial, failed=failed)
+        return result
+
+    def _current_state(self, circuit: _Circuit) -> CircuitState:
+        if (
+            circuit.state == CircuitState.OPEN
+            and time.monotonic() - circuit.opened_at >= self.reset_timeout
+        ):
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.trials = 0
+        return circuit.state
+
+    def _record(self, circuit: _Circuit, trial: bool, failed: bool) -> None:
+        if trial:
+            if circuit.state != CircuitState.HALF_OPEN:
+                return  # another trial call already reopened the circuit
+            circuit.trials -= 1
+            if failed:
+                self._open(circuit)
+            elif circuit.trials <= 0:
+                circuit.state = CircuitState.CLOSED
+                circuit.failures = 0
+                circuit.outcomes.clear()
+            return
+
+        if circuit.state != CircuitState.CLOSED:
+            return  # a call started before the circuit opened
+
+        circuit.failures = circuit.failures + 1 if failed else 0
+        circuit.outcomes.append(failed)
+
+        if (
+            self.failure_threshold is not None
+            and circuit.failures >= self.failure_threshold
+        ) or (
+            self.failure_rate is not None
+            and len(circuit.outcomes) == self.window
+            and sum(circuit.outcomes) >= self.failure_rate * self.window
+        ):
+            self._open(circuit)
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.trials = 0
@@ -0,0 +1,223 @@
+import abc
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Hashable
+
+import httpx
+
+from arrest.http import Methods
+from arrest.params import RequestArgs
+from arrest.response import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from arrest._config import ArrestConfig
+
+# request headers that always split the cache, a response for one set of
+# credentials must never be served to another
+_KEY_HEADERS = ("authorization", "cookie")
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """parses a `Cache-Control` header into a dict of lower-cased directives"""
+    directives: dict[str, str | None] = {}
+    if not value:
+        return directives
+
+    for directive in value.split(","):
+        name, _, arg = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+class CacheEntry:
+    """A validated `Response` stored in a `ResponseCache`, along with what is
+    needed to tell whether it is still fresh and to revalidate it."""
+
+    __slots__ = ("response", "expires_at", "etag", "last_modified", "vary", "size")
+
+    def __init__(
+        self,
+        response: Response[Any],
+        *,
+        expires_at: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        vary: tuple[tuple[str, str | None], ...] = (),
+        size: int = 0,
+    ) -> None:
+        self.response = response
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+        self.vary = vary
+        self.size = size
+
+    @classmethod
+    def from_response(
+        cls, response: Response[Any], request_headers: httpx.Headers
+    ) -> "CacheEntry | None":
+        """build an entry out of a response, `None` if it must not be cached"""
+        if response.status_code != 200:
+            return None
+
+        headers = response.raw.headers
+        directives = parse_cache_control(headers.get("cache-control"))
+        if "no-store" in directives:
+            return None
+
+        vary_header = headers.get("vary", "")
+        vary_names = [name.strip().lower() for name in vary_header.split(",")]
+        if "*" in vary_names:
+            return None
+
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        expires_at = _expires_at(headers, directives)
+        if expires_at is None and not (etag or last_modified):
+            # neither fresh for a while nor revalidatable, nothing to gain
+            return None
+
+        raw = response.raw
+        return cls(
+            response,
+            expires_at=expires_at or time.monotonic(),
+            etag=etag,
+            last_modified=last_modified,
+            vary=tuple(
+                (name, request_headers.get(name)) for name in vary_names if name
+            ),
+            size=len(raw.content) + sum(len(k) + len(v) for k, v in raw.headers.raw),
+        )
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def matches(self, request_headers: httpx.Headers) -> bool:
+        """checks the request against the `Vary` headers of the stored response"""
+        return all(request_headers.get(name) == value for name, value in self.vary)
+
+    def add_validators(self, request_headers: httpx.Headers) -> None:
+        """turns the request into a conditional request for this entry"""
+        if self.etag:
+            request_headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            request_headers["If-Modified-Since"] = self.last_modified
+
+    def revalidated(self, headers: httpx.Headers) -> "CacheEntry":
+        """a copy of this entry refreshed by the headers of a `304 Not Modified`"""
+        directives = parse_cache_control(headers.get("cache-control"))
+        return CacheEntry(
+            self.response,
+            expires_at=_expires_at(headers, directives) or time.monotonic(),
+            etag=headers.get("etag", self.etag),
+            last_modified=headers.get("last-modified", self.last_modified),
+            vary=self.vary,
+            size=self.size,
+        )
+
+
+def _expires_at(
+    headers: httpx.Headers, directives: dict[str, str | None]
+) -> float | None:
+    if "no-cache" in directives:
+        return None
+
+    ttl: float | None = None
+    if (max_age := directives.get("max-age")) is not None:
+        try:
+            ttl = int(max_age)
+        except ValueError:
+            return None
+    elif (expires := headers.get("expires")) and (date := headers.get("date")):
+        try:
+            ttl = (
+                parsedate_to_datetime(expires) - parsedate_to_datetime(date)
+            ).total_seconds()
+        except (TypeError, ValueError):
+            return None
+
+    if ttl is None:
+        return None
+
+    try:
+        ttl -= int(headers.get("age", 0))
+    except ValueError:
+        pass
+
+    return time.monotonic() + ttl if ttl > 0 else None
+
+
+def cache_key(
+    method: Methods, url: str, args: RequestArgs, config: "ArrestConfig"
+) -> Hashable | None:
+    """identify a request in the cache, `None` if it is not cacheable"""
+    if method != Methods.GET or args.body or args.files:
+        return None
+
+    directives = parse_cache_control(args.header.get("cache-control"))
+    if "no-store" in directives or "no-cache" in directives:
+        return None
+
+    return (
+        url,
+        tuple(sorted(args.query.multi_items())),
+        tuple(args.header.get(name) for name in _KEY_HEADERS),
+        # credentials httpx adds to the request, not found in `args.header`
+        tuple(sorted((str(k), str(v)) for k, v in config.cookies.items())),
+        id(config.auth),
+    )
+
+
+class ResponseCache(abc.ABC):
+    """Interface of the response cache used by `Resource.request`.
+
+    Set an instance as `ArrestConfig(cache=...)` to cache the responses of
+    `GET` requests honouring `Cache-Control`, `ETag` and `Last-Modified`.
+    """
+
+    @abc.abstractmethod
+    async def get(self, key: Hashable) -> CacheEntry | None: ...
+
+    @abc.abstractmethod
+    async def set(self, key: Hashable, entry: CacheEntry) -> None: ...
+
+    @abc.abstractmethod
+    async def delete(self, key: Hashable) -> None: ...
+
+
+class MemoryCache(ResponseCache):
+    """An in-process LRU `ResponseCache`, bounded by number of entries and by
+    the total size of the cached bodies."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024**2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+
+    async def get(self, key: Hashable) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: Hashable, entry: CacheEntry) -> None:
+        await self.delete(key)
+        if entry.size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self.size += entry.size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    async def delete(self, key: Hashable) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self.size -= entry.size
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
@@ -130,24 +130,121 @@ def compile_path(path: str) -> tuple[Pattern[str], str, dict[str, Converter[Any]
     return pattern, path_format, parsed_path_params
 
 
-def replace_params(
-    path: str,
-    path_params: dict[str, Any],
-    param_types: dict[str, Converter[Any]] | None,
-) -> tuple[str, dict[str, str]]:
-    for key, value in list(path_params.items()):
-        try:
-            if "{" + key + "}" in path:
-                if not param_types:
-                    strval = str(value)
-                else:
-                    strval = param_types[key].to_str(value)
-                path = path.replace("{" + key + "}", strval)
-                path_params.pop(key)
-        except (TypeError, ValueError) as exc:
-            raise ConversionError(*exc.args) from exc
-
-    return path, path_params
+def compile_path_prefix(path: str) -> Pattern[str]:
+    """
+    Given a path string, like: "/{username}/posts/{post_id:int}",
+    compile a regex matching any segment-wise prefix of it, used to resolve
+    path params from a partial path when the rest are passed as kwargs.
+    A param may also be left as is in the path ("{post_id}" or
+    "{post_id:int}"), to be passed as a kwarg.
+
+    Parameters:
+        path:
+            a backslash-escaped string to an http path
+
+    Returns:
+        regex:
+            "^(?:/(?:\\{username(?::\\w+)?\\}|(?P<username>[^/]+))"
+            "(?:/posts(?:/(?:\\{post_id(?::\\w+)?\\}|(?P<post_id>[0-9]+)))?)?)?/?$"
+    """
+    head, *segments = path.split("/")
+
+    path_regex = "^" + _segment_regex(head)
+    for segment in segments:
+        path_regex += "(?:/" + _segment_regex(segment)
+    path_regex += ")?" * len(segments) + "/?$"
+
+    return re.compile(path_regex)
+
+
+def _segment_regex(segment: str) -> str:
+    segment_regex = ""
+    idx = 0
+    for match in PARAM_REGEX.finditer(segment):
+        param_name, converter_type = match.groups("str")
+        converter = CONVERTER_REGEX[converter_type.lstrip(":").casefold()]
+
+        segment_regex += re.escape(segment[idx : match.start()])
+        # the param itself, left to be passed as a kwarg, or its value
+        segment_regex += (
+            f"(?:\\{{{param_name}(?::\\w+)?\\}}|(?P<{param_name}>{converter.regex}))"
+        )
+        idx = match.end()
+
+    return segment_regex + re.escape(segment[idx:])
+
+
+class PathFormatter:
+    """
+    A precompiled `path_format`, like "/posts/{post_id}/comments/{comment_id}",
+    that renders the path from its params with their converters.
+
+    With a `prefix` (the route of the resource the handler is bound to), the
+    rendered path is the full url of the handler, as `join_url(prefix, path)`
+    would build it, with the prefix joined once up front.
+    """
+
+    __slots__ = ("_parts", "_lead", "template")
+
+    def __init__(
+        self,
+        path_format: str,
+        param_types: dict[str, Converter[Any]],
+        prefix: str | None = None,
+    ) -> None:
+        # what a path relative to the prefix is appended to
+        self._lead = ""
+        if prefix is not None:
+            self._lead = prefix if not prefix or prefix.endswith("/") else prefix + "/"
+            path_format = self.join(path_format)
+        self.template = path_format
+
+        self._parts: list[
+            tuple[str, str, Converter[Any] | None, Pattern[str] | None]
+        ] = []
+        idx = 0
+        for match in PARAM_REGEX.finditer(path_format, len(self._lead)):
+            param_name = match.group(1)
+            converter = param_types.get(param_name)
+            self._parts.append(
+                (
+                    path_format[idx : match.start()],
+                    param_name,
+                    converter,
+                    re.compile(converter.regex) if converter else None,
+                )
+            )
+            idx = match.end()
+        self._parts.append((path_format[idx:], "", None, None))
+
+    def format(self, path_params: dict[str, Any]) -> str:
+        """
+        Raises:
+            KeyError: if a path param is missing
+            ConversionError: if a path param cannot be converted, or does not
+                match the regex of its converter
+        """
+        path = ""
+        for literal, param_name, converter, regex in self._parts:
+            path += literal
+            if not param_name:
+                continue
+            value = path_params[param_name]
+            try:
+                value = converter.to_str(value) if converter else str(value)
+            except (TypeError, ValueError) as exc:
+                raise ConversionError(*exc.args) from exc
+            if regex is not None and not regex.fullmatch(value):
+                raise ConversionError(f"{value!r} is not a valid {param_name}")
+            path += value
+        return path
+
+    def join(self, path: str) -> str:
+        """the full url of a literal `path`, same as `join_url(prefix, path)`"""
+        if relative := path.lstrip("/"):
+            return self._lead + relative
+        # an empty path keeps a trailing slash only if asked for one
+        return self._lead if path.endswith("/") else self._lead.rstrip("/")
 
 
 def get_converter(key: str) -> Converter[Any]:
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Coroutine, Iterator, TypeVar
+
+from arrest.exceptions import DeadlineExceeded
+
+T = TypeVar("T")
+
+# monotonic time by which the current call must be done
+_deadline: ContextVar[float | None] = ContextVar("arrest_deadline", default=None)
+
+
+def remaining() -> float | None:
+    """seconds left before the current deadline, `None` if there is none"""
+    if (at := _deadline.get()) is None:
+        return None
+    return at - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bounds the arrest calls made inside the block to `seconds` in total.
+
+    Usage:
+        ```python
+        >>> with deadline(2.0):
+        ...     user = await service.users.get("/1")
+        ...     orders = await service.orders.get("/", query={"user": 1})
+        ```
+
+    Retries, backoff waits and callbacks all count towards it. Deadlines
+    nest, the inner one can only be shorter than the outer one, and with
+    `seconds=None` the current deadline, if any, is kept.
+    """
+    if seconds is None:
+        yield
+        return
+
+    at = time.monotonic() + seconds
+    if (current := _deadline.get()) is not None:
+        at = min(at, current)
+
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+async def within_deadline(aw: Coroutine[Any, Any, T]) -> T:
+    """await `aw`, cancelling it with `DeadlineExceeded` once the deadline
+    is over"""
+    if (left := remaining()) is None:
+        return await aw
+    if left <= 0:
+        aw.close()  # never started
+        raise DeadlineExceeded()
+
+    try:
+        return await asyncio.wait_for(aw, left)
+    except asyncio.TimeoutError as exc:
+        raise DeadlineExceeded() from exc
@@ -1,5 +1,8 @@
 DEFAULT_TIMEOUT = 120  # sec
 MAX_RETRIES = 3
+MAX_POOLED_CLIENTS = 8
+CLIENT_IDLE_TIMEOUT = 300  # sec
+DEFAULT_CONCURRENCY = 64
 ROOT_RESOURCE = "root"
 
 OPENAPI_SCHEMA_FILENAME = "models.py"
@@ -25,12 +25,25 @@ class RequestError(ArrestError):
         super().__init__(message)
 
 
+class DeadlineExceeded(RequestError):
+    def __init__(self, message: str = "deadline exceeded"):
+        super().__init__(message)
+
+
 class ResponseError(ArrestError):
     def __init__(self, message: str):
         self.message = message
         super().__init__(message)
 
 
+class CircuitOpenError(ArrestError):
+    def __init__(self, key: Any, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        self.message = f"circuit open for {key.method} {key.route}"
+        super().__init__(self.message)
+
+
 class NotFoundException(ArrestError):
     def __init__(self, message: str):
         self.message = message
@@ -1,10 +1,9 @@
-import difflib
-import re
-from typing import Any, Callable, NamedTuple, Pattern, overload
+from typing import Any, Callable, Mapping, NamedTuple, Pattern, overload
 
-from pydantic import BaseModel, ConfigDict, PrivateAttr
+from pydantic import BaseModel, ConfigDict, InstanceOf, PrivateAttr
 
-from arrest.converters import replace_params
+from arrest._config import ArrestConfig
+from arrest.converters import PathFormatter
 from arrest.exceptions import ConversionError
 from arrest.http import Methods
 from arrest.logging import logger
@@ -34,6 +33,12 @@ class ResourceHandler(BaseModel):
         headers (dict, optional):
             default Headers for the handlers, can be overridden
             by runtime headers
+        config (ArrestConfig, optional):
+            handler-level config, layered on top of the resource config
+            and overridden by per-call kwargs
+        name (str, optional):
+            operation name, the handler is bound to the resource as a
+            method of that name, e.g. `await users.get_user(user_id=1)`
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -44,75 +49,89 @@ class ResourceHandler(BaseModel):
     response: Any | None = None
     callback: Callable | None = None
     headers: dict[str, str] | None = None
+    config: InstanceOf[ArrestConfig] | None = None
+    name: str | None = None
 
     _path_format: str | None = PrivateAttr(default=None)
     _path_regex: Pattern | None = PrivateAttr(default=None)
     _param_types: Any = PrivateAttr(default=None)
+    _path_prefix_regex: Pattern | None = PrivateAttr(default=None)
+    _path_formatter: PathFormatter | None = PrivateAttr(default=None)
 
     def parse_path(self, method: Methods, path: str, **kwargs) -> str | None:
+        return self._parse_path(method, path, kwargs)
+
+    def _parse_path(
+        self,
+        method: Methods,
+        path: str,
+        path_params: Mapping[str, Any],
+        formatter: PathFormatter | None = None,
+    ) -> str | None:
+        """(private) `parse_path`, with the path rendered by `formatter`
+        (e.g. one prefixed with the route of a resource) if given"""
         if method != self.method:
             return None
 
-        if kwargs:
-            return self.__resolve_path_param(path, **kwargs)
+        if path_params:
+            return self.__resolve_path_param(path, path_params, formatter)
 
-        return self.__parse_exact_path(path)
+        return self.__parse_exact_path(path, formatter)
 
-    def __parse_exact_path(self, path: str) -> str | None:
+    def __parse_exact_path(
+        self, path: str, formatter: PathFormatter | None
+    ) -> str | None:
         if not self._path_regex:
             return None
         if self._path_regex.fullmatch(path):
-            return path
-
-    def __resolve_path_param(self, path: str, **kwargs) -> str | None:
-        params = self.__extract_path_params(path)
-        if params is None:
+            return formatter.join(path) if formatter else path
+
+    def __resolve_path_param(
+        self,
+        path: str,
+        kwargs: Mapping[str, Any],
+        formatter: PathFormatter | None,
+    ) -> str | None:
+        if not self._param_types or not self._path_prefix_regex:
+            return None
+        formatter = formatter or self._path_formatter
+        if not formatter or not kwargs.keys() <= self._param_types.keys():
             return None
 
-        if not self._path_format or not self._param_types:
+        if not (match := self._path_prefix_regex.fullmatch(path)):
             return None
+
+        params = {k: v for k, v in match.groupdict().items() if v is not None}
         params |= kwargs
+        if len(params) < len(self._param_types):
+            return None
 
         try:
-            parsed_path, remaining_params = replace_params(
-                path=self._path_format,
-                path_params=params,
-                param_types=self._param_types,
-            )
+            # the converters check the values, no need to match the result
+            return formatter.format(params)
         except ConversionError as exc:
             logger.warning(str(exc), exc_info=True)
             return None
-        if remaining_params:
-            return None
-
-        return self.__parse_exact_path(parsed_path)
-
-    def __extract_path_params(self, path: str) -> dict | None:
-        if not self._path_format:
-            return None
-        differ = difflib.Differ()
-        diff = list(differ.compare(self._path_format.split("/"), path.split("/")))
-
-        left = [delta.lstrip("- ") for delta in diff if delta.startswith("- ")]
-        right = [delta.lstrip("+ ") for delta in diff if delta.startswith("+ ")]
-
-        params = dict(zip(left, right))
-        for key in list(params):
-            if not (match := re.match("{(.*)}", key)):
-                return None
-
-            params[match.group(1)] = params.pop(key)
-
-        return {k: v for k, v in params.items() if v}
 
 
 @overload
 def H(
-    method: Methods, route: str, *, headers: dict[str, str] | None = None
+    method: Methods,
+    route: str,
+    *,
+    headers: dict[str, str] | None = None,
+    config: ArrestConfig | None = None,
+    name: str | None = None,
 ) -> ResourceHandler: ...
 @overload
 def H(
-    method: Methods, route: str, request: Any, *, headers: dict[str, str] | None = None
+    method: Methods,
+    route: str,
+    request: Any,
+    *,
+    headers: dict[str, str] | None = None,
+    config: ArrestConfig | None = None,
+    name: str | None = None,
 ) -> ResourceHandler: ...
 @overload
 def H(
@@ -122,6 +141,8 @@ def H(
     response: Any,
     *,
     headers: dict[str, str] | None = None,
+    config: ArrestConfig | None = None,
+    name: str | None = None,
 ) -> ResourceHandler: ...
 @overload
 def H(
@@ -132,6 +153,8 @@ def H(
     callback: Callable[..., Any],
     *,
     headers: dict[str, str] | None = None,
+    config: ArrestConfig | None = None,
+    name: str | None = None,
 ) -> ResourceHandler: ...
 
 
@@ -143,6 +166,8 @@ def H(
     callback: Callable[..., Any] | None = None,
     *,
     headers: dict[str, str] | None = None,
+    config: ArrestConfig | None = None,
+    name: str | None = None,
 ) -> ResourceHandler:
     return ResourceHandler(
         method=method,
@@ -151,4 +176,6 @@ def H(
         response=response,
         callback=callback,
         headers=headers,
+        config=config,
+        name=name,
     )
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Latencies:
+    __slots__ = ("samples", "count", "delay")
+
+    def __init__(self, window: int) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.delay: float | None = None
+
+
+def _retrieve(task: asyncio.Future[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _start(fn: Callable[[], Awaitable[T]]) -> asyncio.Future[T]:
+    """run `fn` in a task whose failure is not logged if it loses the race"""
+    task = asyncio.ensure_future(fn())
+    task.add_done_callback(_retrieve)
+    return task
+
+
+class HedgePolicy:
+    """Sends a second, speculative request when the first one is slow.
+
+    Usage:
+        ```python
+        >>> ArrestConfig(hedge=HedgePolicy(percentile=0.95, max_ratio=0.05))
+        ```
+
+    Once a request to a handler has been waiting longer than the
+    ``percentile`` of the latencies recently seen for it (or a fixed
+    ``delay``), an identical request is sent. The first answer wins and
+    the other request is cancelled.
+
+    Only requests without a body to idempotent methods (``GET``, ``HEAD``,
+    ``OPTIONS``) are hedged, and at most ``max_ratio`` of them, so the extra
+    load stays bounded even when every request is slow.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float | None = 0.95,
+        delay: float | None = None,
+        max_ratio: float = 0.05,
+        min_samples: int = 20,
+        window: int = 1000,
+    ) -> None:
+        if percentile is None and delay is None:
+            raise ValueError("set percentile, delay or both")
+        if percentile is not None and not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 < max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1")
+
+        self.percentile = percentile
+        self.delay = delay
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies: dict[Hashable, _Latencies] = {}
+        # every request earns `max_ratio` of a hedge, a hedge spends a whole one
+        self._tokens = 0.0
+
+    def hedge_delay(self, key: Hashable) -> float | None:
+        """how long a request to `key` waits before being hedged, `None` if it
+        is not hedged (not enough latencies seen yet and no fixed `delay`)"""
+        latencies = self._latencies.get(key)
+        if latencies is None or latencies.delay is None:
+            return self.delay
+        return latencies.delay
+
+    async def call(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """make a call, hedged if it is slower than usual for `key`"""
+        self._tokens = min(self._tokens + self.max_ratio, 10.0)
+        delay = self.hedge_delay(key)
+        start = time.monotonic()
+
+        tasks = [_start(fn)]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._tokens >= 1:
+                    self._tokens -= 1
+                    tasks.append(_start(fn))
+
+            result = await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        self._record(key, time.monotonic() - start)
+        return result
+
+    @staticmethod
+    async def _first_success(tasks: list[asyncio.Future[Any]]) -> Any:
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # prefer a request that succeeded, fail only once both failed
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return task.result()
+            if not pending:
+                return done.pop().result()
+
+    def _record(self, key: Hashable, latency: float) -> None:
+        if self.percentile is None:
+            return
+
+        latencies = self._latencies.get(key)
+        if latencies is None:
+            latencies = self._latencies[key] = _Latencies(self.window)
+
+        latencies.samples.append(latency)
+        latencies.count += 1
+        # sorting the window on every request would cost more than it saves
+        if len(latencies.samples) >= self.min_samples and (
+            latencies.delay is None or latencies.count % 32 == 0
+        ):
+            ordered = sorted(latencies.samples)
+            latencies.delay = ordered[int(self.percentile * (len(ordered) - 1))]
@@ -0,0 +1,175 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    limit: int
+    in_flight: int
+    queued: int
+    queue_delay: float  # sec, moving average of the time spent waiting
+    min_rtt: float | None  # sec, latency baseline
+
+
+class _Sample:
+    __slots__ = ("dropped",)
+
+    def __init__(self) -> None:
+        self.dropped = False
+
+
+class _HostLimiter:
+    __slots__ = (
+        "policy",
+        "limit",
+        "in_flight",
+        "waiters",
+        "queue_delay",
+        "min_rtt",
+    )
+
+    def __init__(self, policy: "AdaptiveLimit") -> None:
+        self.policy = policy
+        self.limit = float(policy.initial_limit)
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.queue_delay = 0.0
+        self.min_rtt: float | None = None
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self.waiters:
+            self.in_flight += 1
+            return
+
+        start = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # the slot was handed over, pass it on
+            else:
+                self.waiters.remove(waiter)
+            raise
+        finally:
+            self.queue_delay += (time.monotonic() - start - self.queue_delay) * 0.1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def update(self, rtt: float, dropped: bool) -> None:
+        policy = self.policy
+        if dropped:
+            # errors and timeouts mean the remote is overloaded
+            self.limit = max(policy.min_limit, self.limit * policy.backoff)
+        elif self.min_rtt is None or rtt < self.min_rtt:
+            self.min_rtt = rtt
+        else:
+            # let the baseline drift up slowly so it follows lasting changes
+            self.min_rtt += (rtt - self.min_rtt) * 0.01
+
+        if not dropped:
+            if rtt > self.min_rtt * policy.tolerance:
+                # queueing upstream, latency rises before errors do
+                self.limit = max(policy.min_limit, self.limit * policy.backoff)
+            elif self.in_flight + 1 >= self.limit / 2:
+                # only grow while the limit is actually used
+                self.limit = min(policy.max_limit, self.limit + 1 / self.limit)
+
+        self._wake()
+
+    def _wake(self) -> None:
+        while self.waiters and self.in_flight < int(self.limit):
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            limit=int(self.limit),
+            in_flight=self.in_flight,
+            queued=len(self.waiters),
+            queue_delay=self.queue_delay,
+            min_rtt=self.min_rtt,
+        )
+
+
+class AdaptiveLimit:
+    """An adaptive limit on the number of concurrent requests per base url.
+
+    Usage:
+        ```python
+        >>> ArrestConfig(adaptive_limit=AdaptiveLimit(initial_limit=20))
+        ```
+
+    The limit follows an AIMD (additive increase, multiplicative decrease)
+    scheme driven by latency: it grows by about one for every ``limit``
+    requests answered as fast as the best latency seen, and is multiplied by
+    ``backoff`` when a request takes more than ``tolerance`` times that long,
+    fails with a ``5xx`` or times out. Requests over the limit wait in line.
+
+    Each base url gets its own limit, read them with `stats()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 1000,
+        backoff: float = 0.9,
+        tolerance: float = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self._hosts: dict[str, _HostLimiter] = {}
+
+    @asynccontextmanager
+    async def limit(self, base_url: str) -> AsyncIterator[_Sample]:
+        """hold a slot for the duration of a request to `base_url`
+
+        Set `dropped` on the yielded sample for a request that failed without
+        raising (e.g. a `5xx` response), an exception always counts as one.
+        """
+        host = self._hosts.get(base_url)
+        if host is None:
+            host = self._hosts[base_url] = _HostLimiter(self)
+
+        await host.acquire()
+        sample = _Sample()
+        start = time.monotonic()
+        try:
+            yield sample
+        except asyncio.CancelledError:
+            # abandoned by the caller, says nothing about the remote
+            host.release()
+            raise
+        except BaseException:
+            host.in_flight -= 1
+            host.update(time.monotonic() - start, dropped=True)
+            raise
+        else:
+            host.in_flight -= 1
+            host.update(time.monotonic() - start, dropped=sample.dropped)
+
+    def stats(self) -> dict[str, LimiterStats]:
+        """the current limit, in-flight requests and queueing of each base url"""
+        return {base_url: host.stats() for base_url, host in self._hosts.items()}
+
+    def __repr__(self) -> str:
+        return f"AdaptiveLimit(initial_limit={self.initial_limit})"
@@ -48,7 +48,8 @@ from arrest.openapi.resource_template import (
 )
 from arrest.openapi.service_template import ServiceSchema, ServiceTemplate
 from arrest.openapi.spec import OpenAPI, Operation, PathItem, Reference, Server
-from arrest.openapi.utils import convert_to_pascal, get_ref_schema
+from arrest.openapi.utils import convert_to_pascal, get_ref_schema, to_snake
+from arrest.resource import check_operation_name
 from arrest.utils import sanitize_name
 
 
@@ -260,6 +261,7 @@ class OpenAPIGenerator:
                 if key:
                     route = route.removeprefix(f"/{key}")
                 handlers.extend(self._build_handlers(route=route, path_item=path_item))
+            self._dedupe_operation_names(handlers)
             if key:
                 yield ResourceSchema(
                     name=sanitize_name(key), route=f"/{key}", handlers=handlers
@@ -288,11 +290,33 @@ class OpenAPIGenerator:
                         method=method,
                         request=request_to_pascal,
                         response=response_to_pascal,
+                        name=self.get_operation_name(operation),
                     )
                 )
 
         return handlers
 
+    def get_operation_name(self, operation: Operation) -> Optional[str]:
+        if not operation.operationId:
+            return None
+
+        name = to_snake(operation.operationId)
+        try:
+            check_operation_name(name)
+        except ValueError as exc:
+            logger.warning(f"operationId {operation.operationId} not used: {exc}")
+            return None
+        return name
+
+    @staticmethod
+    def _dedupe_operation_names(handlers: list[HandlerSchema]) -> None:
+        """leave unnamed the handlers of a resource sharing an operation name"""
+        names = [handler.name for handler in handlers if handler.name]
+        for handler in handlers:
+            if handler.name and names.count(handler.name) > 1:
+                logger.warning(f"duplicate operationId {handler.name}")
+                handler.name = None
+
     def get_request_schema(self, operation: Operation) -> Optional[str]:
         if not (request_body := operation.requestBody):
             logger.debug("no request body defined")
@@ -11,6 +11,7 @@ class HandlerSchema(BaseModel):
     method: str
     request: Optional[str] = None
     response: Optional[str] = None
+    name: Optional[str] = None
 
 
 class ResourceSchema(BaseModel):
@@ -23,6 +24,7 @@ class ResourceParams(BaseModel):
     schema_module: str
     schema_imports: set[str]
     resources: list[ResourceSchema]
+    named_handlers: bool = False
 
 
 class ResourceTemplate(TemplateBase):
@@ -47,6 +49,11 @@ class ResourceTemplate(TemplateBase):
                 schema_module=schema_module,
                 schema_imports=schema_imports,
                 resources=resources,
+                named_handlers=any(
+                    handler.name
+                    for resource in resources
+                    for handler in resource.handlers
+                ),
             ),
             destination_path=destination_path,
         )
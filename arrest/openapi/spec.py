@@ -47,6 +47,7 @@ class Response(Base):
 
 
 class Operation(Base):
+    operationId: Optional[str] = None
     responses: Optional[dict[str, Union[Reference, Response]]] = None
     requestBody: Optional[Union[Reference, RequestBody]] = None
 
@@ -2,6 +2,7 @@ import re
 from typing import Any
 
 from arrest.openapi.spec import Reference
+from arrest.utils import sanitize_name
 
 
 def get_ref_schema(reference: Reference | Any) -> str | None:
@@ -26,3 +27,10 @@ def convert_to_pascal(name: str | None):
 def to_pascal(name: str) -> str:
     """Convert a snake_case string to PascalCase."""
     return re.sub("([0-9A-Za-z])_(?=[0-9A-Z])", lambda m: m.group(1), name.title())
+
+
+def to_snake(name: str) -> str:
+    """Convert a camelCase or PascalCase string to snake_case."""
+    name = re.sub("([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
+    return sanitize_name(name).strip("_")
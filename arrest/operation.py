@@ -0,0 +1,127 @@
+import inspect
+from typing import TYPE_CHECKING, Any, Literal, Mapping, Optional, Union, get_args
+
+from httpx import QueryParams
+from pydantic import BaseModel
+
+from arrest.converters import Converter, PathFormatter
+from arrest.response import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from arrest.handler import ResourceHandler
+    from arrest.resource import Resource
+
+
+class Operation:
+    """A named handler, bound to its resource as a method.
+
+    Usage:
+        ```python
+        >>> users = Resource(
+        ...     route="/users",
+        ...     handlers=[H("GET", "/{user_id:int}", response=User, name="get_user")],
+        ... )
+
+        >>> response = await users.get_user(user_id=1)
+        ```
+
+    Calls go straight to the handler, the path is never matched against the
+    routes of the resource. Path params are keyword-only arguments, the
+    others are the ones of [request][arrest.resource.Resource.request].
+    """
+
+    def __init__(
+        self,
+        resource: "Resource",
+        handler: "ResourceHandler",
+        formatter: PathFormatter,
+    ) -> None:
+        self.resource = resource
+        self.handler = handler
+        self._formatter = formatter
+        self.__name__ = self.__qualname__ = handler.name
+        self._params = frozenset(handler._param_types or ())
+
+    async def __call__(
+        self,
+        request: Union[BaseModel, Mapping[str, Any], None] = None,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        query: Optional[Mapping[str, str]] = None,
+        cookies: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: Optional[bool] = None,
+        raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
+        **path_params: Any,
+    ) -> Response[Any]:
+        if path_params.keys() != self._params:
+            self._check_params(path_params)
+
+        handler = self.handler
+        return await self.resource._send(
+            handler.method,
+            handler,
+            self._formatter.format(path_params),
+            QueryParams(),
+            base_config=self.resource._handler_config(handler),
+            request=request,
+            headers=headers,
+            query=query,
+            cookies=cookies,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
+        )
+
+    def _check_params(self, path_params: Mapping[str, Any]) -> None:
+        if unexpected := path_params.keys() - self._params:
+            raise TypeError(
+                f"{self.__name__}() got unexpected path params: "
+                f"{', '.join(sorted(unexpected))}"
+            )
+        raise TypeError(
+            f"{self.__name__}() missing path params: "
+            f"{', '.join(sorted(self._params - path_params.keys()))}"
+        )
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        """the signature of `request`, with the path params of the handler
+        as keyword-only arguments typed after their converters"""
+        parameters = list(inspect.signature(Operation.__call__).parameters.values())
+        parameters = parameters[1:-1]  # without self and **path_params
+        request = parameters[0]
+        if self.handler.request is not None:
+            parameters[0] = request.replace(annotation=Optional[self.handler.request])
+
+        for name, converter in (self.handler._param_types or {}).items():
+            parameters.append(
+                inspect.Parameter(
+                    name,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=_converter_type(converter),
+                )
+            )
+
+        response = self.handler.response or self.resource.response_model
+        return inspect.Signature(
+            parameters,
+            return_annotation=Response[response] if response is not None else Response,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Operation({self.__name__}: "
+            f"{self.handler.method.value} {self._formatter.template})"
+        )
+
+
+def _converter_type(converter: Converter[Any]) -> Any:
+    for base in getattr(type(converter), "__orig_bases__", ()):
+        if args := get_args(base):
+            return args[0]
+    return Any
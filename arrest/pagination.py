@@ -0,0 +1,151 @@
+import abc
+from collections.abc import Sequence
+from typing import Any, Mapping, get_args, get_origin
+
+from arrest.response import Response
+
+# what `next_page` returns: query params for the next page, the absolute url
+# of the next page, or `None` once there are no more pages
+NextPage = Mapping[str, Any] | str | None
+
+
+def lookup(data: Any, path: str | None) -> Any:
+    """follows a dotted `path` (e.g. ``"meta.next_cursor"``) into a json document,
+    returns `None` if any part of it is missing"""
+    if not path:
+        return data
+
+    for part in path.split("."):
+        if not isinstance(data, Mapping):
+            return None
+        data = data.get(part)
+    return data
+
+
+def item_type_of(response_type: Any) -> Any:
+    """the item type of a list response type (``list[User]`` -> ``User``),
+    `None` if it is not a sequence"""
+    origin = get_origin(response_type)
+    if isinstance(origin, type) and issubclass(origin, Sequence):
+        args = get_args(response_type)
+        return args[0] if args else None
+    return None
+
+
+class Pagination(abc.ABC):
+    """Base class of the pagination strategies used by `Resource.paginate`.
+
+    A strategy tells which query params to send for the first page, where the
+    items are in a page (``items``, a dotted path into the json body, the body
+    itself by default) and how to get to the next page.
+    """
+
+    def __init__(self, items: str | None = None) -> None:
+        self.items_path = items
+
+    def first_page(self) -> Mapping[str, Any]:
+        """query params of the first page"""
+        return {}
+
+    def items(self, response: Response[Any]) -> list[Any]:
+        """the items of a page"""
+        items = lookup(response.data, self.items_path)
+        return items if isinstance(items, list) else []
+
+    @abc.abstractmethod
+    def next_page(
+        self,
+        response: Response[Any],
+        items: list[Any],
+        params: Mapping[str, Any],
+    ) -> NextPage:
+        """the next page to fetch after `response`, requested with `params`"""
+
+
+class CursorPagination(Pagination):
+    """Pages linked by an opaque cursor returned in the body (at the dotted
+    path ``cursor``) and sent back as the ``cursor_param`` query param."""
+
+    def __init__(
+        self,
+        *,
+        cursor: str = "next_cursor",
+        cursor_param: str = "cursor",
+        items: str | None = "items",
+    ) -> None:
+        super().__init__(items)
+        self.cursor_path = cursor
+        self.cursor_param = cursor_param
+
+    def next_page(self, response, items, params) -> NextPage:
+        cursor = lookup(response.data, self.cursor_path)
+        if cursor in (None, "") or not items:
+            return None
+        return {**params, self.cursor_param: cursor}
+
+
+class OffsetPagination(Pagination):
+    """``offset`` / ``limit`` pagination, stops at the first page holding
+    less than ``limit`` items."""
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        start: int = 0,
+        items: str | None = None,
+    ) -> None:
+        super().__init__(items)
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.start = start
+
+    def first_page(self) -> Mapping[str, Any]:
+        return {self.offset_param: self.start, self.limit_param: self.limit}
+
+    def next_page(self, response, items, params) -> NextPage:
+        if len(items) < self.limit:
+            return None
+        offset = int(params[self.offset_param]) + len(items)
+        return {**params, self.offset_param: offset}
+
+
+class PagePagination(Pagination):
+    """Page-number pagination, stops at the first empty page, or at the first
+    page holding less than ``size`` items if a page size is given."""
+
+    def __init__(
+        self,
+        *,
+        page_param: str = "page",
+        start: int = 1,
+        size: int | None = None,
+        size_param: str = "per_page",
+        items: str | None = None,
+    ) -> None:
+        super().__init__(items)
+        self.page_param = page_param
+        self.start = start
+        self.size = size
+        self.size_param = size_param
+
+    def first_page(self) -> Mapping[str, Any]:
+        params: dict[str, Any] = {self.page_param: self.start}
+        if self.size is not None:
+            params[self.size_param] = self.size
+        return params
+
+    def next_page(self, response, items, params) -> NextPage:
+        if not items or (self.size is not None and len(items) < self.size):
+            return None
+        return {**params, self.page_param: int(params[self.page_param]) + 1}
+
+
+class LinkPagination(Pagination):
+    """Follows the ``rel="next"`` url of the `Link` response header (RFC 8288)."""
+
+    def next_page(self, response, items, params) -> NextPage:
+        return response.raw.links.get("next", {}).get("url")
@@ -73,6 +73,33 @@ class RequestArgs:
         self.content_type = content_type
 
 
+class RequestPlan:
+    """Where each field of a request model goes, computed once per model class.
+
+    ``query``, ``header`` and ``body`` hold the serialized (aliased) keys,
+    ``files`` holds the field names of ``File()`` fields.
+    """
+
+    __slots__ = ("query", "header", "body", "files", "is_json_body", "is_form_body")
+
+    def __init__(
+        self,
+        *,
+        query: tuple[str, ...] = (),
+        header: tuple[str, ...] = (),
+        body: tuple[str, ...] = (),
+        files: tuple[str, ...] = (),
+        is_json_body: bool = False,
+        is_form_body: bool = False,
+    ) -> None:
+        self.query = query
+        self.header = header
+        self.body = body
+        self.files = files
+        self.is_json_body = is_json_body
+        self.is_form_body = is_form_body
+
+
 # Public API
 
 
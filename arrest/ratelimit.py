@@ -0,0 +1,77 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """the delay in seconds of a `Retry-After` header, given either as a
+    number of seconds or as an http date"""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimit:
+    """A token bucket limiting the rate of requests sent.
+
+    Usage:
+        ```python
+        >>> ArrestConfig(rate_limit=RateLimit(rps=200, burst=50))
+        ```
+
+    Up to ``burst`` requests go out at once, after which requests are spaced
+    out to ``rps`` per second. Waiting requests are let through in the order
+    they arrived.
+
+    The limit is shared by every request whose merged config holds this
+    instance, so one set on a `Service` applies to all of its resources
+    together. A `429 Too Many Requests` response with a `Retry-After` header
+    holds back every request until the delay is over.
+    """
+
+    def __init__(self, rps: float, burst: int = 1) -> None:
+        if rps <= 0:
+            raise ValueError("rps must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rps = rps
+        self.burst = burst
+        self._interval = 1 / rps
+        self._tolerance = (burst - 1) * self._interval
+        # the "theoretical arrival time" of the generic cell rate algorithm:
+        # when the bucket is full again if no request was sent meanwhile
+        self._tat = 0.0
+
+    def reserve(self) -> float:
+        """take a token, returns how long to wait before using it"""
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        self._tat = tat + self._interval
+        return max(0.0, tat - self._tolerance - now)
+
+    async def acquire(self) -> None:
+        """wait for a token, callers are served in order of arrival"""
+        # the slot is booked before waiting, so no lock is needed for fairness
+        if (delay := self.reserve()) > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """let no request through for the next `seconds`"""
+        resume_at = time.monotonic() + seconds
+        self._tat = max(self._tat, resume_at + self._tolerance)
+
+    def __repr__(self) -> str:
+        return f"RateLimit(rps={self.rps}, burst={self.burst})"
@@ -1,9 +1,25 @@
 # pylint: disable=W0707
+import asyncio
 import functools
 import inspect
 import json
+import keyword
+from contextlib import asynccontextmanager
 from functools import cached_property
-from typing import Any, Mapping, Optional, TypeAlias, TypeVar, Union, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Mapping,
+    Optional,
+    TypeAlias,
+    TypeVar,
+    Union,
+    cast,
+)
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -11,11 +27,19 @@ from httpx import QueryParams
 from pydantic import BaseModel, ValidationError
 from pydantic_xml import BaseXmlModel
 
+from arrest._coalesce import SAFE_METHODS, SingleFlight, coalesce_key
 from arrest._config import ArrestConfig
-from arrest.converters import compile_path
-from arrest.defaults import ROOT_RESOURCE
+from arrest._pool import ClientPool
+from arrest._router import RouteIndex
+from arrest.batch import Call, gather
+from arrest.cache import CacheEntry, cache_key
+from arrest.converters import PathFormatter, compile_path, compile_path_prefix
+from arrest.deadline import deadline as deadline_scope
+from arrest.deadline import remaining, within_deadline
+from arrest.defaults import DEFAULT_CONCURRENCY, ROOT_RESOURCE
 from arrest.exceptions import (
     ArrestHTTPException,
+    DeadlineExceeded,
     HandlerNotFound,
     RequestError,
     ResponseError,
@@ -23,22 +47,35 @@ from arrest.exceptions import (
 from arrest.handler import HandlerKey, ResourceHandler
 from arrest.http import Methods
 from arrest.logging import logger
+from arrest.operation import Operation
+from arrest.pagination import Pagination, item_type_of
+from arrest.ratelimit import parse_retry_after
 from arrest.params import RequestArgs
 from arrest.response import Response
+from arrest.retry import RetryPolicy
+from arrest.streaming import StreamResponse
 from arrest.types import ExceptionHandlers
 from arrest.utils import (
     build_body_kwargs,
     extract_request_params,
     extract_resource_and_suffix,
+    is_json_invalid,
     join_url,
     lookup_exception_handler,
+    validate_json,
     validate_model,
 )
-from arrest.utils import retry as arrest_retry
 
 T = TypeVar("T")
 ResourceHandlerType: TypeAlias = ResourceHandler | Mapping[str, Any] | tuple[Any, ...]
 
+_DEFAULT_CONFIG = ArrestConfig()
+
+
+def _decode_mode(config: ArrestConfig) -> bool | str:
+    """how the body of a response is decoded, `True` unless set otherwise"""
+    return True if config.decode is None else config.decode
+
 
 class Resource:
     """
@@ -58,6 +95,8 @@ class Resource:
 
     If provided as a tuple, at minimum 2 entries `(method, route)` or a maximum of 5 entries
     (method, route, request, response, callback) can be defined.
+
+    Handlers with a `name` are also bound as methods of the resource, see `Operation`.
     """
 
     def __init__(
@@ -89,10 +128,16 @@ class Resource:
         self.name = self.get_resource_name(name=name)
         self.response_model = response_model
         self.routes: dict[HandlerKey, ResourceHandler] = {}
+        self.operations: dict[str, Operation] = {}
+        # per resource, a handler object may be bound to several resources
+        self._formatters: dict[HandlerKey, PathFormatter] = {}
+        self._route_index = RouteIndex()
+        self._in_flight = SingleFlight()
 
         self.config = config
 
         self._exception_handlers = None
+        self._pool: ClientPool | None = None  # set once bound to a service
 
         # initialize default GET handler
         self._bind_handler(
@@ -155,6 +200,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -190,6 +237,14 @@ class Resource:
             raise_for_status:
                 If True, non-2xx responses raise ``ArrestHTTPException``
                 instead of returning a ``Response`` (legacy behaviour).
+            deadline:
+                Seconds the whole call may take, retries, backoff waits and
+                the callback included. Each attempt's timeout is cut down to
+                the time left. See `arrest.deadline.deadline`.
+            decode:
+                ``False`` to leave the body undecoded (``data`` is ``None``),
+                ``"lazy"`` to parse and validate it on the first access to
+                ``data``.
             **kwargs:
                 Keyword-arguments matching the path params, if any
 
@@ -200,85 +255,484 @@ class Resource:
                 Callbacks receive and may return ``Response[Any]``.
         """
 
+        handler, url, path_query_params = self._resolve(method, path, kwargs)
+
+        return await self._send(
+            method,
+            handler,
+            url,
+            path_query_params,
+            base_config=self._handler_config(handler),
+            request=request,
+            headers=headers,
+            query=query,
+            cookies=cookies,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
+        )
+
+    def call(self, method: Methods | str, path: str, **kwargs: Any) -> Call:
+        """
+        Builds a `Call` bound to this resource, to be run with
+        [gather][arrest.resource.Resource.gather] or `Service.gather`
+
+        Takes the same arguments as [request][arrest.resource.Resource.request]
+        """
+        call = Call(method, path, **kwargs)
+        call.resource = self
+        return call
+
+    async def gather(
+        self,
+        calls: Iterable[Call],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = True,
+    ) -> list[Response[Any] | Exception]:
+        """
+        Makes many requests concurrently on the pooled clients
+
+        Usage:
+            ```python
+            >>> await user_resource.gather(
+            ...     [Call("GET", f"/{user_id}") for user_id in user_ids],
+            ...     concurrency=16,
+            ... )
+            ```
+
+        Parameters:
+            calls:
+                The requests to make, calls not bound to a resource
+                are made against this one
+            concurrency:
+                Maximum number of requests in flight at once
+            return_exceptions:
+                If True, a failing call leaves its exception in the results,
+                otherwise the remaining calls are cancelled and it is raised
+
+        Returns:
+            list:
+                The ``Response`` (or exception) of each call, in order
+        """
+        return await gather(
+            calls,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+            resource=self,
+        )
+
+    async def paginate(
+        self,
+        path: str,
+        strategy: Pagination,
+        *,
+        method: Methods = Methods.GET,
+        item_type: Any = None,
+        request: Union[BaseModel, Mapping[str, Any], None] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        query: Optional[Mapping[str, str]] = None,
+        cookies: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterates over the items of a paginated endpoint
+
+        The next page is fetched while the items of the current one are
+        consumed, and items are validated one at a time as they are yielded.
+
+        Usage:
+            ```python
+            >>> from arrest.pagination import CursorPagination
+
+            >>> async for user in user_resource.paginate(
+            ...     "/", CursorPagination(cursor="meta.next", items="data")
+            ... ):
+            ...     ...
+            ```
+
+        Parameters:
+            path:
+                Path to a handler specified in the resource
+            strategy:
+                One of the `arrest.pagination` strategies, telling where the
+                items are in a page and how to get to the next one
+            method:
+                The HTTP method of the pages, ``GET`` by default
+            item_type:
+                A python type to validate each item to, by default the item
+                type of the handler's response type if it is a ``list[T]``
+            deadline:
+                Seconds each page may take, retries included
+            **kwargs:
+                The other arguments of
+                [request][arrest.resource.Resource.request], sent with every page
+
+        Yields:
+            Any:
+                The items of every page, in order
+        """
+        handler, url, path_query_params = self._resolve(method, path, kwargs)
+        base_config = self._handler_config(handler)
+        if item_type is None:
+            item_type = item_type_of(handler.response or self.response_model)
+
+        def fetch(page: Mapping[str, Any] | str) -> asyncio.Future[Response[Any]]:
+            page_url, page_query_params, page_query = url, path_query_params, page
+            if isinstance(page, str):
+                # a url (from a `Link` header) carries its own query params
+                page_query_params, page_url = self._extract_query_params(page)
+                page_query = None
+
+            return asyncio.ensure_future(
+                self._send(
+                    method,
+                    handler,
+                    page_url,
+                    page_query_params,
+                    base_config=base_config,
+                    request=request,
+                    headers=headers,
+                    query=page_query,
+                    cookies=cookies,
+                    timeout=timeout,
+                    follow_redirects=follow_redirects,
+                    raise_for_status=True,
+                    deadline=deadline,
+                    # the strategy reads the page, whatever the configured decoding
+                    decode=True,
+                    typed=False,
+                )
+            )
+
+        params: Mapping[str, Any] = {**dict(query or {}), **strategy.first_page()}
+        task: asyncio.Future[Response[Any]] | None = fetch(params)
+        try:
+            while task is not None:
+                response = await task
+                items = strategy.items(response)
+
+                # prefetch the next page while this one is consumed
+                next_page = strategy.next_page(response, items, params)
+                task = None if next_page is None else fetch(next_page)
+                if isinstance(next_page, Mapping):
+                    params = next_page
+
+                for item in items:
+                    if item_type is not None:
+                        item = validate_model(item_type, item)
+                    yield item
+        finally:
+            # the consumer stopped early, drop the page being prefetched
+            if task is not None:
+                task.cancel()
+                task.add_done_callback(
+                    lambda done: done.cancelled() or done.exception()
+                )
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: Methods,
+        path: str,
+        request: Union[BaseModel, Mapping[str, Any], None] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        query: Optional[Mapping[str, str]] = None,
+        cookies: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: Optional[bool] = None,
+        raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[StreamResponse]:
+        """
+        Makes an HTTP request without reading the response body upfront
+
+        Usage:
+            ```python
+            >>> async with user_resource.stream("GET", "/export") as response:
+            ...     async for user in response.iter_records():
+            ...         ...
+            ```
+
+        The body is read chunk by chunk through the `StreamResponse` methods
+        (`iter_bytes`, `iter_lines`, `iter_records` for NDJSON and
+        `iter_events` for server-sent events), so memory use does not grow
+        with its size. Streamed requests are never retried, coalesced, cached
+        or passed to the handler callback. With a `deadline`, the timeouts of
+        the request, reading the body included, are cut down to the time left.
+
+        Takes the same arguments as [request][arrest.resource.Resource.request],
+        except `decode`
+
+        Yields:
+            StreamResponse:
+                the response, its body is left unread
+        """
+        handler, url, path_query_params = self._resolve(method, path, kwargs)
+        final_config, args = self._prepare(
+            handler,
+            path_query_params,
+            base_config=self._handler_config(handler),
+            request=request,
+            headers=headers,
+            query=query,
+            cookies=cookies,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            raise_for_status=raise_for_status,
+            deadline=deadline,
+        )
+        response_type = handler.response or self.response_model
+
+        with deadline_scope(final_config.deadline):
+            if final_config.rate_limit is not None:
+                await within_deadline(final_config.rate_limit.acquire())
+
+            try:
+                async with (
+                    self._open_client(final_config) as client,
+                    client.stream(
+                        **self._request_kwargs(
+                            url=url, method=method, args=args, config=final_config
+                        )
+                    ) as raw,
+                ):
+                    logger.info(
+                        f"{method!s} {url} returned with status code {raw.status_code!s}"
+                    )
+                    if final_config.raise_for_status and not raw.is_success:
+                        await raw.aread()
+                        raise ArrestHTTPException(
+                            status_code=raw.status_code,
+                            data=self._decode_body(raw) if raw.content else None,
+                        )
+
+                    yield StreamResponse(
+                        raw, item_type=item_type_of(response_type) or response_type
+                    )
+
+            except (httpx.TimeoutException, httpx.RequestError) as exc:
+                if (left := remaining()) is not None and left <= 0:
+                    raise DeadlineExceeded() from exc
+                if isinstance(exc, httpx.TimeoutException):
+                    raise RequestError("request timed out") from exc
+                raise RequestError("error occurred while making request") from exc
+
+    def _resolve(
+        self, method: Methods, path: str, path_params: Mapping[str, Any]
+    ) -> tuple[ResourceHandler, str, QueryParams]:
+        """(private) finds the handler for a request, returns it along with
+        the resolved url and the query params embedded in `path`"""
         path_query_params, path = self._extract_query_params(path)
 
-        if not (match := self.get_matching_handler(method=method, path=path, **kwargs)):
+        if not (
+            match := self.get_matching_handler(method=method, path=path, **path_params)
+        ):
             logger.warning("no matching handler found for request")
             raise HandlerNotFound(message="no matching handler found for request")
 
         handler, url = match
+        return handler, url, path_query_params
 
-        # Merge: resource config → handler headers → per-call config
-        final_headers = {}
-        final_headers.update(handler.headers or {})  # merge handler headers
-        final_headers.update(headers or {})  # merge per-call headers
+    @property
+    def config(self) -> ArrestConfig | None:
+        return self._config
+
+    @config.setter
+    def config(self, config: ArrestConfig | None) -> None:
+        self._config = config
+        self._handler_configs: dict[int, tuple[ResourceHandler, ArrestConfig]] = {}
+
+    def _handler_config(self, handler: ResourceHandler) -> ArrestConfig:
+        """(private) the resource config merged with the handler config,
+        merged once per handler"""
+        entry = self._handler_configs.get(id(handler))
+        if entry is not None and entry[0] is handler:
+            return entry[1]
+
+        if self.config is None:
+            config = handler.config or _DEFAULT_CONFIG
+        else:
+            config = self.config.merge(handler.config)
+        self._handler_configs[id(handler)] = (handler, config)
+        return config
 
-        final_config = ArrestConfig(
-            headers=dict(final_headers),
-            cookies=cookies or {},
-            params={**path_query_params, **dict(query or {})},
+    def _prepare(
+        self,
+        handler: ResourceHandler,
+        path_query_params: QueryParams,
+        *,
+        base_config: ArrestConfig | None,
+        request: Union[BaseModel, Mapping[str, Any], None] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        query: Optional[Mapping[str, str]] = None,
+        cookies: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: Optional[bool] = None,
+        raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
+    ) -> tuple[ArrestConfig, RequestArgs]:
+        """(private) merges the config of a request and extracts its params"""
+        # Merge: resource config → handler config → per-call config, where the
+        # first two are merged once and a call without overrides copies nothing
+        if handler.headers:
+            headers = {**handler.headers, **headers} if headers else handler.headers
+        if path_query_params:
+            query = {**path_query_params, **query} if query else path_query_params
+
+        final_config = (base_config or _DEFAULT_CONFIG).overlay(
+            headers=headers,
+            cookies=cookies,
+            params=query,
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
         )
-        if self.config:
-            final_config = self.config.merge(final_config)
 
         args = extract_request_params(
             request_type=handler.request,
             request_data=request,
             headers=final_config.headers,
             query=final_config.params,
+            custom_encoder=final_config.json_encoders,
         )
+        return final_config, args
 
-        response_type = handler.response or self.response_model or None
+    async def _send(
+        self,
+        method: Methods,
+        handler: ResourceHandler,
+        url: str,
+        path_query_params: QueryParams,
+        *,
+        base_config: ArrestConfig | None,
+        request: Union[BaseModel, Mapping[str, Any], None] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        query: Optional[Mapping[str, str]] = None,
+        cookies: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        follow_redirects: Optional[bool] = None,
+        raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
+        typed: bool = True,
+    ) -> Response[Any]:
+        """(private) makes the request to a resolved handler
 
-        retry_count = final_config.max_retries
+        With `typed=False` the response is neither validated against the
+        handler's response type nor passed to its callback.
+        """
+        final_config, args = self._prepare(
+            handler,
+            path_query_params,
+            base_config=base_config,
+            request=request,
+            headers=headers,
+            query=query,
+            cookies=cookies,
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
+        )
+
+        response_type = (handler.response or self.response_model) if typed else None
+
+        retry = final_config.retry
+        if retry is None and final_config.max_retries:
+            retry = RetryPolicy.from_max_retries(final_config.max_retries)
 
-        fn_make_request = (
-            arrest_retry(
-                max_retries=retry_count,
-                exceptions=(httpx.TimeoutException, httpx.RequestError),
-            )(self.make_request)
-            if retry_count
-            else self.make_request
+        fn_make_request: Callable[..., Awaitable[Response[Any]]] = self.make_request
+        if retry is not None and retry.applies_to(method):
+            fn_make_request = functools.partial(self._retry, retry)
+
+        call = functools.partial(
+            self._fetch,
+            fn_make_request,
+            url=url,
+            method=method,
+            args=args,
+            response_type=response_type,
+            config=final_config,
         )
 
-        try:
-            response = await fn_make_request(
-                url=url,
-                method=method,
-                args=args,
-                response_type=response_type,
-                config=final_config,
-            )
+        handler_key = HandlerKey(
+            method,
+            self._formatters[HandlerKey(method, handler._path_format)].template,
+        )
 
-        except (httpx.TimeoutException, httpx.RequestError) as exc:
-            # transport errors: retries exhausted or no retry configured
-            if isinstance(exc, httpx.TimeoutException):
-                raise RequestError("request timed out") from exc
-            raise RequestError("error occurred while making request") from exc
+        if (
+            final_config.hedge is not None
+            and method in SAFE_METHODS
+            and not (args.body or args.files)
+        ):
+            # race a second request against a slow one
+            call = functools.partial(final_config.hedge.call, handler_key, call)
 
-        # custom exception handling
-        except Exception as exc:
-            exc_handler = lookup_exception_handler(self.exception_handlers or {}, exc)
-            if not exc_handler:
-                raise exc
+        if (breaker := final_config.circuit_breaker) is not None:
+            # inside the coalescing, one outcome per upstream call
+            call = functools.partial(breaker.call, handler_key, call)
 
-            response = exc_handler(exc)
+        if final_config.coalesce and (
+            key := coalesce_key(method, url, args, final_config)
+        ):
+            # share the response of an identical request already in flight,
+            # with the callers expecting its body decoded the same way
+            call = functools.partial(
+                self._in_flight.do, (key, typed, _decode_mode(final_config)), call
+            )
 
-        if handler.callback:
+        # the deadline covers every attempt, backoff wait and the callback
+        with deadline_scope(final_config.deadline):
             try:
-                if inspect.iscoroutinefunction(handler.callback):
-                    callback_response = await handler.callback(response)
-                else:
-                    callback_response = handler.callback(response)
-            except Exception:
-                logger.warning("something went wrong during callback", exc_info=True)
-                raise
-            return callback_response
+                response = await within_deadline(call())
+                self._settle(response, final_config)
+
+            except (httpx.TimeoutException, httpx.RequestError) as exc:
+                # transport errors: retries exhausted or no retry configured
+                if (left := remaining()) is not None and left <= 0:
+                    raise DeadlineExceeded() from exc
+                if isinstance(exc, httpx.TimeoutException):
+                    raise RequestError("request timed out") from exc
+                raise RequestError("error occurred while making request") from exc
+
+            # custom exception handling
+            except Exception as exc:
+                exc_handler = lookup_exception_handler(
+                    self.exception_handlers or {}, exc
+                )
+                if not exc_handler:
+                    raise exc
 
-        return response
+                response = exc_handler(exc)
+
+            if handler.callback and typed:
+                try:
+                    if inspect.iscoroutinefunction(handler.callback):
+                        # nested calls made by the callback inherit the deadline
+                        callback_response = await within_deadline(
+                            handler.callback(response)
+                        )
+                    else:
+                        callback_response = handler.callback(response)
+                except Exception:
+                    logger.warning(
+                        "something went wrong during callback", exc_info=True
+                    )
+                    raise
+                return callback_response
+
+            return response
 
     async def get(
         self,
@@ -290,6 +744,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -307,6 +763,8 @@ class Resource:
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
             **kwargs,
         )
 
@@ -320,6 +778,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -337,6 +797,8 @@ class Resource:
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
             **kwargs,
         )
 
@@ -350,6 +812,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -367,6 +831,8 @@ class Resource:
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
             **kwargs,
         )
 
@@ -380,6 +846,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -397,6 +865,8 @@ class Resource:
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
             **kwargs,
         )
 
@@ -410,6 +880,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -427,6 +899,8 @@ class Resource:
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
             **kwargs,
         )
 
@@ -440,6 +914,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -457,6 +933,8 @@ class Resource:
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
             **kwargs,
         )
 
@@ -470,6 +948,8 @@ class Resource:
         timeout: Optional[float] = None,
         follow_redirects: Optional[bool] = None,
         raise_for_status: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        decode: Union[bool, Literal["lazy"], None] = None,
         **kwargs,
     ) -> Response[Any]:
         """
@@ -487,6 +967,8 @@ class Resource:
             timeout=timeout,
             follow_redirects=follow_redirects,
             raise_for_status=raise_for_status,
+            deadline=deadline,
+            decode=decode,
             **kwargs,
         )
 
@@ -499,8 +981,8 @@ class Resource:
         config: ArrestConfig,
     ) -> Response[Any]:
         """
-        (private) prepares and makes a http request,
-        parses the response and raises appropriate exceptions
+        (private) prepares and makes a http request, the response body is
+        left to be decoded on the first access to `data`
 
         Parameters:
             url:
@@ -516,12 +998,16 @@ class Resource:
 
         Returns:
             Response[Any]:
-                a ``Response[T]`` wrapping parsed data, status code,
+                a ``Response[T]`` wrapping the data, status code,
                 and the raw ``httpx.Response``.
         """
-        client = config.client
+        if config.rate_limit is not None:
+            await config.rate_limit.acquire()
 
-        if client:
+        async with (
+            self._limit_concurrency(config) as sample,
+            self._open_client(config) as client,
+        ):
             raw = await self.__make_request(
                 client=client,
                 url=url,
@@ -529,82 +1015,214 @@ class Resource:
                 args=args,
                 config=config,
             )
-        else:
-            async with httpx.AsyncClient(
-                base_url=self.base_url,
-                **config.httpx_args(),
-            ) as client:
-                raw = await self.__make_request(
-                    client=client,
-                    url=url,
-                    method=method,
-                    args=args,
-                    config=config,
-                )
+            if sample is not None:
+                sample.dropped = raw.is_server_error
 
         status_code = raw.status_code
+        if (
+            status_code == 429
+            and config.rate_limit is not None
+            and (delay := parse_retry_after(raw.headers.get("retry-after")))
+        ):
+            # the remote asks to slow down, hold back everything sharing the limit
+            config.rate_limit.pause(delay)
         logger.info(f"{method!s} {url} returned with status code {status_code!s}")
 
-        if not raw.content:
-            # elapsed may not be set on empty-body responses (204, etc.)
-            try:
-                elapsed = raw.elapsed
-            except RuntimeError:  # pragma: no cover
-                elapsed = None
-            resp = Response(
-                data=None,
+        # elapsed is only available after the response body is consumed,
+        # and may not be set on empty-body responses (204, etc.)
+        try:
+            elapsed = raw.elapsed
+        except RuntimeError:  # pragma: no cover
+            elapsed = None
+
+        if raw.content and _decode_mode(config):
+            # parsed and validated on the first access to `data`, so retries,
+            # the circuit breaker and the cache judge the response by its
+            # status alone, see `_settle`
+            return Response.lazy(
+                functools.partial(self._decode_data, raw, response_type),
                 status_code=status_code,
                 url=raw.url,
                 elapsed=elapsed,
                 raw=raw,
                 request=raw.request,
             )
-            if config.raise_for_status and not resp.is_success:
-                raise ArrestHTTPException(
-                    status_code=resp.status_code,
-                    data=resp.data,
-                )
-            return resp
 
-        try:
-            body = raw.json()
-        except json.JSONDecodeError:
-            try:
-                body = raw.content.decode("utf-8", errors="strict")
-            except UnicodeDecodeError:
-                raise ResponseError("Could not parse HTTP response")
+        return Response(
+            data=None,
+            status_code=status_code,
+            url=raw.url,
+            elapsed=elapsed,
+            raw=raw,
+            request=raw.request,
+        )
+
+    @staticmethod
+    def _settle(response: Response[Any], config: ArrestConfig) -> None:
+        """(private) decodes the final response of a call, unless it is
+        decoded lazily, and raises for its status if asked to
 
+        Raises:
+            ArrestHTTPException: with `raise_for_status`, if the response is
+                not a success
+        """
+        if _decode_mode(config) is True:
+            response.data  # decoded here, any validation error raised
+        if config.raise_for_status and not response.is_success:
+            raise ArrestHTTPException(
+                status_code=response.status_code,
+                data=response.data,
+            )
+
+    @classmethod
+    def _decode_data(cls, raw: httpx.Response, response_type: Any) -> Any:
+        """(private) parses a response body, validated against
+        `response_type` if there is one"""
         if (
             response_type
             and isinstance(response_type, type)
             and issubclass(response_type, BaseXmlModel)
         ):
-            data = response_type.from_xml(raw.content)
-        else:
-            data = validate_model(response_type, body) if response_type else body
+            return response_type.from_xml(raw.content)
+        if response_type:
+            try:
+                # parse and validate straight from the raw bytes, in one pass
+                return validate_json(response_type, raw.content)
+            except ValidationError as exc:
+                if not is_json_invalid(exc):
+                    raise
+                return validate_model(response_type, cls._decode_text(raw))
+        return cls._decode_body(raw)
+
+    async def _retry(
+        self,
+        policy: RetryPolicy,
+        *,
+        url: str,
+        method: Methods,
+        args: RequestArgs,
+        response_type: Any,
+        config: ArrestConfig,
+    ) -> Response[Any]:
+        """(private) makes the request, retried as `policy` allows"""
+        return await policy.call(
+            functools.partial(
+                self.make_request,
+                url=url,
+                method=method,
+                args=args,
+                response_type=response_type,
+                config=config,
+            )
+        )
 
-        # elapsed is only available after the response body is consumed.
-        try:
-            elapsed = raw.elapsed
-        except RuntimeError:
-            elapsed = None
+    async def _fetch(
+        self,
+        fn_make_request: Callable[..., Awaitable[Response[Any]]],
+        *,
+        url: str,
+        method: Methods,
+        args: RequestArgs,
+        response_type: Any,
+        config: ArrestConfig,
+    ) -> Response[Any]:
+        """(private) makes the request through `config.cache`, if any.
 
-        resp = Response(
-            data=data,
-            status_code=status_code,
-            url=raw.url,
-            elapsed=elapsed,
-            raw=raw,
-            request=raw.request,
+        Fresh cached responses are returned without a request, stale ones
+        are revalidated with a conditional request and a `304 Not Modified`
+        is turned back into the cached response.
+        """
+        cache = config.cache
+        if cache is None or (key := cache_key(method, url, args, config)) is None:
+            return await fn_make_request(
+                url=url,
+                method=method,
+                args=args,
+                response_type=response_type,
+                config=config,
+            )
+
+        # a response is cached as it was validated and decoded, typed and
+        # untyped (e.g. paginated) requests to the same url must not share it,
+        # nor requests decoding the body differently
+        key = (key, response_type is not None, _decode_mode(config))
+        entry = await cache.get(key)
+        if entry is not None and not entry.matches(args.header):
+            entry = None
+
+        if entry is not None:
+            if entry.is_fresh():
+                return entry.response
+            entry.add_validators(args.header)
+
+        response = await fn_make_request(
+            url=url,
+            method=method,
+            args=args,
+            response_type=response_type,
+            config=config,
         )
 
-        if config.raise_for_status and not resp.is_success:
-            raise ArrestHTTPException(
-                status_code=resp.status_code,
-                data=resp.data,
-            )
+        if entry is not None and response.status_code == 304:
+            await cache.set(key, entry.revalidated(response.raw.headers))
+            return entry.response
+
+        if new_entry := CacheEntry.from_response(response, args.header):
+            if _decode_mode(config) is True:
+                # only a response that decodes and validates is cached
+                response.data
+            await cache.set(key, new_entry)
+        elif entry is not None:
+            await cache.delete(key)
 
-        return resp
+        return response
+
+    @classmethod
+    def _decode_body(cls, raw: httpx.Response) -> Any:
+        """(private) json-decodes an untyped response body,
+        falling back to plain text"""
+        try:
+            return raw.json()
+        except json.JSONDecodeError:
+            return cls._decode_text(raw)
+
+    @staticmethod
+    def _decode_text(raw: httpx.Response) -> str:
+        try:
+            return raw.content.decode("utf-8", errors="strict")
+        except UnicodeDecodeError:
+            raise ResponseError("Could not parse HTTP response")
+
+    @asynccontextmanager
+    async def _limit_concurrency(self, config: ArrestConfig) -> AsyncIterator[Any]:
+        """(private) holds a slot of `config.adaptive_limit`, if any"""
+        if config.adaptive_limit is None:
+            yield None
+        else:
+            async with config.adaptive_limit.limit(self.base_url) as sample:
+                yield sample
+
+    @asynccontextmanager
+    async def _open_client(
+        self, config: ArrestConfig
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """(private) yields the client to make a request with.
+
+        An explicit ``config.client`` always wins, otherwise the client is
+        leased from the service's pool. Resources that are not bound to a
+        service fall back to a throwaway client.
+        """
+        if config.client:
+            yield config.client
+        elif self._pool is not None:
+            async with self._pool.lease(config) as client:
+                yield client
+        else:
+            async with httpx.AsyncClient(
+                base_url=self.base_url,
+                **config.httpx_args(),
+            ) as client:
+                yield client
 
     async def __make_request(
         self,
@@ -627,6 +1245,15 @@ class Resource:
             httpx.Response
         """
 
+        return await client.request(
+            **self._request_kwargs(url=url, method=method, args=args, config=config)
+        )
+
+    @staticmethod
+    def _request_kwargs(
+        url: str, method: Methods, args: RequestArgs, config: ArrestConfig
+    ) -> dict[str, Any]:
+        """(private) the keyword-arguments of `httpx.AsyncClient.request`"""
         header_params, query_params, body_params, file_params, content_type = (
             args.header,
             args.query,
@@ -642,45 +1269,36 @@ class Resource:
                 merged_headers[key] = value
 
         request_kwargs: dict[str, Any] = dict(
+            method=method,
             url=url,
             headers=merged_headers,
             params=query_params,
             cookies=config.cookies or None,
             timeout=config.timeout,
         )
+        if (left := remaining()) is not None:
+            if left <= 0:
+                raise DeadlineExceeded()
+            # an attempt may not outlast the deadline of the call
+            timeout = config.timeout
+            request_kwargs["timeout"] = left if timeout is None else min(timeout, left)
         if config.follow_redirects is not None:
             request_kwargs["follow_redirects"] = config.follow_redirects
         if config.auth is not None:
             request_kwargs["auth"] = config.auth
 
-        body_kwargs = build_body_kwargs(body_params, file_params, content_type)
-
-        match method:
-            case Methods.GET:
-                response = await client.get(**request_kwargs)
-            case Methods.POST:
-                response = await client.post(**request_kwargs, **body_kwargs)
-            case Methods.PUT:
-                response = await client.put(**request_kwargs, **body_kwargs)
-            case Methods.PATCH:
-                response = await client.patch(**request_kwargs, **body_kwargs)
-            case Methods.DELETE:
-                response = await client.delete(**request_kwargs)
-            case Methods.HEAD:
-                response = await client.head(**request_kwargs)
-            case Methods.OPTIONS:
-                response = await client.options(**request_kwargs)
+        # only methods with a request body send one
+        if method in (Methods.POST, Methods.PUT, Methods.PATCH):
+            request_kwargs |= build_body_kwargs(body_params, file_params, content_type)
+            if content_type == "application/json" and body_params:
+                merged_headers.setdefault("Content-Type", "application/json")
 
-        return response
+        return request_kwargs
 
     def get_matching_handler(
         self, method: Methods, path: str, **kwargs
     ) -> tuple[ResourceHandler, str] | None:
-        for handler in self.routes.values():
-            parsed_path = handler.parse_path(method=method, path=path, **kwargs)
-            if parsed_path is not None:
-                url = join_url(self.route, parsed_path)
-                return handler, url
+        return self._route_index.match(method, path, **kwargs)
 
     def _bind_handler(
         self, base_url: str | None = None, *, handler: ResourceHandler
@@ -697,8 +1315,41 @@ class Resource:
         handler._path_regex, handler._path_format, handler._param_types = compile_path(
             handler.route
         )
+        handler._path_prefix_regex = compile_path_prefix(handler.route)
+        handler._path_formatter = PathFormatter(
+            handler._path_format, handler._param_types
+        )
+
+        key = HandlerKey(*(handler.method, handler._path_format))
+        formatter = PathFormatter(
+            handler._path_format, handler._param_types, prefix=self.route
+        )
+        self.routes[key] = handler
+        self._formatters[key] = formatter
+        self._route_index.add(key, handler, formatter)
+
+        if handler.name:
+            self._bind_operation(handler, formatter)
+
+    def _bind_operation(
+        self, handler: ResourceHandler, formatter: PathFormatter
+    ) -> None:
+        """
+        expose a named handler as a method of the resource.
+        Note: a later handler with the same name takes its place, a name
+        already taken by an attribute of the resource is an error.
+        """
+        name = cast(str, handler.name)
+        if name not in self.operations:
+            check_operation_name(name)
+            if name in vars(self):  # e.g. set by the `handler` decorator
+                raise ValueError(
+                    f"operation name {name!r} clashes with a resource attribute"
+                )
 
-        self.routes[HandlerKey(*(handler.method, handler._path_format))] = handler
+        operation = Operation(self, handler, formatter)
+        self.operations[name] = operation
+        setattr(self, name, operation)
 
     def _extract_query_params(self, url: str) -> tuple[QueryParams, str]:
         url_parsed = urlparse(url)
@@ -772,3 +1423,21 @@ class Resource:
     @exception_handlers.setter
     def exception_handlers(self, exc_handlers: ExceptionHandlers):
         self._exception_handlers = exc_handlers
+
+
+@functools.cache
+def _resource_attributes() -> frozenset[str]:
+    # the attributes set by `__init__` too, e.g. `route` or `routes`
+    return frozenset(dir(Resource)) | frozenset(vars(Resource(route=None)))
+
+
+def check_operation_name(name: str) -> None:
+    """
+    Raises:
+        ValueError: if `name` cannot be the name of an operation of a resource,
+            as it is not an identifier or is taken by an attribute of `Resource`
+    """
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"invalid operation name: {name!r}")
+    if name.startswith("_") or name in _resource_attributes():
+        raise ValueError(f"operation name {name!r} clashes with a resource attribute")
@@ -1,21 +1,72 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import timedelta
-from typing import Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 import httpx
 
 T = TypeVar("T")
 
 
+class _LazyData:
+    """`Response.data`, kept in the `_data` slot and returned by the decoder
+    of a lazy response on first access.
+
+    A descriptor-typed dataclass field, it raises `AttributeError` on class
+    access so the field has no default.
+    """
+
+    def __get__(self, response: Any, owner: Any = None) -> Any:
+        if response is None:
+            raise AttributeError("data")
+        if (decoder := response._decoder) is not None:
+            object.__setattr__(response, "_data", decoder())
+            object.__setattr__(response, "_decoder", None)
+        return response._data
+
+    def __set__(self, response: Any, value: Any) -> None:
+        object.__setattr__(response, "_data", value)
+        object.__setattr__(response, "_decoder", None)
+
+
 @dataclass(frozen=True)
 class Response(Generic[T]):
-    data: T
+    """The response of a request, with its body parsed into `data`.
+
+    A response made with ``decode="lazy"`` (see `Response.lazy`) holds a
+    decoder instead, the body is parsed and validated on the first access to
+    `data` and kept. Comparing, copying, pickling or replacing a lazy
+    response decodes it.
+    """
+
+    __slots__ = ("_data", "_decoder", "status_code", "url", "elapsed", "raw", "request")
+
+    data: T = _LazyData()  # type: ignore[assignment]
     status_code: int
     url: httpx.URL
     elapsed: timedelta | None
     raw: httpx.Response
     request: httpx.Request | None
 
+    @classmethod
+    def lazy(
+        cls,
+        decoder: Callable[[], T],
+        status_code: int,
+        url: httpx.URL,
+        elapsed: timedelta | None,
+        raw: httpx.Response,
+        request: httpx.Request | None,
+    ) -> "Response[T]":
+        """a response whose `data` is returned by `decoder` on first access"""
+        response: Response[T] = cls(None, status_code, url, elapsed, raw, request)  # type: ignore[arg-type]
+        object.__setattr__(response, "_decoder", decoder)
+        return response
+
+    @property
+    def is_decoded(self) -> bool:
+        """whether `data` holds the parsed body, always true unless lazy"""
+        return self._decoder is None
+
     @property
     def is_success(self) -> bool:
         return 200 <= self.status_code < 300
@@ -31,3 +82,18 @@ class Response(Generic[T]):
     @property
     def is_server_error(self) -> bool:
         return 500 <= self.status_code < 600
+
+    def __repr__(self) -> str:
+        data = "<not decoded>" if self._decoder is not None else repr(self.data)
+        return (
+            f"{self.__class__.__name__}(data={data}, status_code={self.status_code!r}, "
+            f"url={self.url!r}, elapsed={self.elapsed!r}, raw={self.raw!r}, "
+            f"request={self.request!r})"
+        )
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, f.name) for f in fields(self))
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
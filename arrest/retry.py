@@ -0,0 +1,156 @@
+import asyncio
+import functools
+import random
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+import httpx
+
+from arrest.deadline import remaining
+from arrest.logging import logger
+from arrest.ratelimit import parse_retry_after
+from arrest.response import Response
+
+T = TypeVar("T")
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# idempotent methods, retrying a `POST` or `PATCH` may repeat its side-effects
+DEFAULT_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """Retries requests that failed for a reason worth trying again.
+
+    Usage:
+        ```python
+        >>> ArrestConfig(retry=RetryPolicy(attempts=3, statuses={429, 503}))
+        ```
+
+    A request is retried, up to ``attempts`` tries in total, when it raises
+    one of ``exceptions`` (transport errors and timeouts by default) or is
+    answered with one of ``statuses``. Waits between tries grow
+    exponentially from ``backoff`` up to ``max_backoff`` seconds, with full
+    jitter. A ``Retry-After`` header is honoured, a response asking for a
+    longer wait than ``max_backoff`` is not retried.
+
+    Only requests with idempotent ``methods`` are retried by default, add
+    ``POST`` or ``PATCH`` to them (or pass ``None`` for every method) to
+    retry requests that are safe to repeat.
+
+    Retries are limited by a budget shared by every request holding the
+    policy: each request earns ``budget`` of a retry and each retry spends a
+    whole one, on top of a reserve of ``budget_reserve`` retries. When a whole
+    upstream degrades, retries stop at that share of the traffic instead of
+    multiplying it.
+    """
+
+    def __init__(
+        self,
+        *,
+        attempts: int = 3,
+        statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        exceptions: tuple[type[BaseException], ...] = (
+            httpx.TimeoutException,
+            httpx.TransportError,
+        ),
+        methods: Iterable[str] | None = DEFAULT_RETRY_METHODS,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        budget: float | None = 0.2,
+        budget_reserve: int = 10,
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        if backoff < 0 or max_backoff < backoff:
+            raise ValueError("expected 0 <= backoff <= max_backoff")
+        if budget is not None and not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+
+        self.attempts = attempts
+        self.statuses = frozenset(statuses)
+        self.exceptions = exceptions
+        self.methods = None if methods is None else frozenset(methods)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.budget = budget
+        self.budget_reserve = budget_reserve
+        self._tokens = float(budget_reserve)
+
+    @classmethod
+    @functools.cache
+    def from_max_retries(cls, max_retries: int) -> "RetryPolicy":
+        """the policy behind `ArrestConfig.max_retries`: transport errors only,
+        random exponential waits up to a minute and no budget"""
+        return cls(
+            attempts=max_retries,
+            statuses=(),
+            exceptions=(httpx.TimeoutException, httpx.RequestError),
+            methods=None,
+            backoff=1,
+            max_backoff=60,
+            budget=None,
+        )
+
+    def applies_to(self, method: str) -> bool:
+        """whether requests with `method` are retried at all"""
+        return self.attempts > 1 and (self.methods is None or method in self.methods)
+
+    def wait(self, retry: int, retry_after: float | None = None) -> float | None:
+        """seconds to wait before the `retry`-th retry, `None` to give up"""
+        delay = min(self.max_backoff, self.backoff * 2 ** (retry - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            if retry_after > self.max_backoff:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """make a call, retrying it as the policy allows"""
+        if self.budget is not None:
+            self._tokens = min(self._tokens + self.budget, self.budget_reserve)
+
+        retry = 0
+        while True:
+            retry += 1
+            try:
+                result = await fn()
+            except self.exceptions as exc:
+                if (delay := self._next_wait(retry, None)) is None:
+                    raise
+                reason = type(exc).__name__
+            else:
+                if (
+                    not isinstance(result, Response)
+                    or result.status_code not in self.statuses
+                ):
+                    return result
+                retry_after = parse_retry_after(result.raw.headers.get("retry-after"))
+                if (delay := self._next_wait(retry, retry_after)) is None:
+                    return result
+                reason = f"status code {result.status_code}"
+
+            logger.info(
+                f"retrying in {delay:.2f}s after {reason} "
+                f"(attempt {retry} of {self.attempts})"
+            )
+            await asyncio.sleep(delay)
+
+    def _next_wait(self, retry: int, retry_after: float | None) -> float | None:
+        if retry >= self.attempts:
+            return None
+        if (delay := self.wait(retry, retry_after)) is None:
+            return None
+        if (left := remaining()) is not None and delay >= left:
+            return None  # the next attempt would start past the deadline
+        if self.budget is not None:
+            if self._tokens < 1:
+                logger.warning("retry budget exhausted, not retrying")
+                return None
+            self._tokens -= 1
+        return delay
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(attempts={self.attempts})"
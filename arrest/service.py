@@ -1,8 +1,12 @@
 import itertools
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 
 from arrest._config import ArrestConfig
+from arrest._pool import ClientPool
+from arrest.batch import Call, gather
+from arrest.defaults import DEFAULT_CONCURRENCY
+from arrest.response import Response
 from arrest.resource import Resource
 from arrest.types import ExceptionHandlers
 
@@ -23,6 +27,11 @@ class Service:
         Contains a base url for the main HTTP service.
         Resources can be added to a service.
 
+        Resources added to the service share pooled `httpx.AsyncClient`
+        instances, created on the first request (one per distinct set of
+        client-level settings). Use the service as an async context manager
+        (or call `aclose()`) to release them.
+
         Parameters:
             name:
                 Name of the service
@@ -42,6 +51,7 @@ class Service:
         self.resources: dict[str, Resource] = {}
 
         self.config = config
+        self._pool = ClientPool(base_url=url)
 
         self._exception_handlers = (
             {} if exception_handlers is None else exception_handlers
@@ -68,10 +78,38 @@ class Service:
         )
 
         resource.exception_handlers = self._exception_handlers
+        resource._pool = self._pool
 
         self.resources[resource.name] = resource
         setattr(self, resource.name, resource)
 
+    async def gather(
+        self,
+        calls: Iterable[Call],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = True,
+    ) -> list[Response[Any] | Exception]:
+        """
+        Makes requests to several resources concurrently, with at most
+        `concurrency` in flight. Calls have to be built with `Resource.call`.
+
+        see [gather][arrest.resource.Resource.gather]
+        """
+        return await gather(
+            calls, concurrency=concurrency, return_exceptions=return_exceptions
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled clients shared by the resources of this service."""
+        await self._pool.aclose()
+
+    async def __aenter__(self) -> "Service":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def __getattr__(self, key: str) -> Resource:  # pragma: no cover
         if hasattr(self, key):
             return getattr(self, key)
@@ -0,0 +1,278 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator
+
+import httpx
+import orjson
+
+from arrest.utils import validate_json, validate_model
+
+# the C scanner of the stdlib parses a json value and finds where it ends in
+# a single call
+_scan = json.JSONDecoder().raw_decode
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_DELIMITERS = frozenset(" \t\r\n,]")
+# what moves the scan of an element cut across chunks, see `JSONArrayDecoder`
+_STRUCTURE = re.compile(r'[\[\]{}"]')
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[ \t\r\n,\]]")
+
+
+class ServerSentEvent:
+    """A single event of a `text/event-stream` response."""
+
+    __slots__ = ("event", "data", "id", "retry")
+
+    def __init__(
+        self,
+        event: str = "message",
+        data: str = "",
+        id: str | None = None,
+        retry: int | None = None,
+    ) -> None:
+        self.event = event
+        self.data = data
+        self.id = id
+        self.retry = retry
+
+    def json(self) -> Any:
+        return orjson.loads(self.data)
+
+    def __repr__(self) -> str:
+        return f"ServerSentEvent(event={self.event!r}, data={self.data!r})"
+
+
+class JSONArrayDecoder:
+    """Splits a top-level json array into its elements as its bytes arrive.
+
+    Each element is handed back parsed, only the element being read is
+    buffered, so the array itself is never held in memory. An element cut
+    by the end of a chunk is scanned on, from where the last chunk ended,
+    until it is complete, then parsed once.
+    """
+
+    def __init__(self) -> None:
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self._started = False
+        self._after_value = False
+        self._empty = True
+        self.done = False
+        # the pieces of a cut element, `None` between elements, and where
+        # the scan of it stands
+        self._pieces: list[str] | None = None
+        self._scalar = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """consume a chunk, returns the elements it completes"""
+        if self.done:
+            return []
+
+        text = self._decode(chunk)
+        pos = 0
+        elements: list[Any] = []
+        while True:
+            if self._pieces is not None:
+                end = self._scan_on(text, pos)
+                if end < 0:
+                    self._pieces.append(text[pos:])
+                    return elements
+                self._pieces.append(text[pos:end])
+                elements.append(json.loads("".join(self._pieces)))
+                self._pieces = None
+                self._after_value = True
+                self._empty = False
+                pos = end
+                continue
+
+            if (pos := _WHITESPACE.match(text, pos).end()) == len(text):
+                return elements
+            char = text[pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError("expected a json array")
+                self._started = True
+                pos += 1
+                continue
+
+            if self._after_value:
+                if char not in ",]":
+                    raise ValueError(f"unexpected {char!r} in json array")
+                self._after_value = False
+                pos += 1
+                if char == "]":
+                    self.done = True
+                    return elements
+                continue
+
+            if char == "]" and self._empty:
+                self.done = True
+                return elements
+
+            try:
+                element, end = _scan(text, pos)
+            except json.JSONDecodeError:
+                end = -1  # cut by the end of the chunk, or invalid
+            if end < 0 or (
+                char in "-0123456789"
+                and (end == len(text) or text[end] not in _DELIMITERS)
+            ):
+                # scanned on with the next chunks (`12` may be `12.5`)
+                self._pieces = []
+                self._scalar = char not in '[{"'
+                self._depth = 0
+                self._in_string = self._escape = False
+                continue
+
+            elements.append(element)
+            self._after_value = True
+            self._empty = False
+            pos = end
+
+    def _scan_on(self, text: str, pos: int) -> int:
+        """scan the cut element on from `pos`, returns where it ends or -1"""
+        if self._scalar:
+            match = _SCALAR_END.search(text, pos)
+            return match.start() if match else -1
+
+        while True:
+            if self._in_string:
+                if self._escape:
+                    if pos == len(text):
+                        return -1
+                    self._escape = False
+                    pos += 1
+                if (match := _STRING_END.search(text, pos)) is None:
+                    return -1
+                pos = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                    continue
+                self._in_string = False
+                if self._depth == 0:
+                    return pos
+                continue
+
+            if (match := _STRUCTURE.search(text, pos)) is None:
+                return -1
+            pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return pos
+
+    def close(self) -> None:
+        if not self.done:
+            raise ValueError("truncated json array")
+
+
+class StreamResponse:
+    """A response whose body is read incrementally, as returned by
+    [stream][arrest.resource.Resource.stream].
+
+    The body can only be iterated once, with one of the `iter_*` methods,
+    and only while the `stream` context is open.
+    """
+
+    __slots__ = ("raw", "item_type")
+
+    def __init__(self, raw: httpx.Response, item_type: Any = None) -> None:
+        self.raw = raw
+        self.item_type = item_type
+
+    @property
+    def status_code(self) -> int:
+        return self.raw.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self.raw.headers
+
+    @property
+    def url(self) -> httpx.URL:
+        return self.raw.url
+
+    @property
+    def is_success(self) -> bool:
+        return self.raw.is_success
+
+    async def iter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        """the decoded (e.g. gunzipped) body, chunk by chunk"""
+        async for chunk in self.raw.aiter_bytes(chunk_size):
+            yield chunk
+
+    async def iter_lines(self) -> AsyncIterator[str]:
+        """the body as text, line by line, without line endings"""
+        async for line in self.raw.aiter_lines():
+            yield line
+
+    async def iter_records(self, item_type: Any = None) -> AsyncIterator[Any]:
+        """the records of a newline-delimited json (NDJSON) body
+
+        Each record is validated against `item_type`, by default the
+        response type of the handler (or its item type for ``list[T]``).
+        """
+        item_type = item_type or self.item_type
+        async for line in self.iter_lines():
+            if not line.strip():
+                continue
+            if item_type is None:
+                yield orjson.loads(line)
+            else:
+                yield validate_json(item_type, line)
+
+    async def iter_items(self, item_type: Any = None) -> AsyncIterator[Any]:
+        """the elements of a body holding a single json array, decoded as
+        they arrive
+
+        Each element is validated against `item_type`, by default the item
+        type of the handler's ``list[T]`` response type.
+        """
+        item_type = item_type or self.item_type
+        decoder = JSONArrayDecoder()
+        async for chunk in self.raw.aiter_bytes():
+            for element in decoder.feed(chunk):
+                if item_type is None:
+                    yield element
+                else:
+                    # parsed by the decoder already, only left to validate
+                    yield validate_model(item_type, element)
+            if decoder.done:
+                break
+        decoder.close()
+
+    async def iter_events(self) -> AsyncIterator[ServerSentEvent]:
+        """the events of a `text/event-stream` (server-sent events) body"""
+        event = ServerSentEvent()
+        data: list[str] = []
+
+        async for line in self.iter_lines():
+            if not line:
+                # a blank line dispatches the event
+                if data:
+                    event.data = "\n".join(data)
+                    yield event
+                event, data = ServerSentEvent(id=event.id), []
+                continue
+
+            if line.startswith(":"):  # comment
+                continue
+
+            name, _, value = line.partition(":")
+            value = value.removeprefix(" ")
+            if name == "event":
+                event.event = value
+            elif name == "data":
+                data.append(value)
+            elif name == "id" and "\0" not in value:
+                event.id = value
+            elif name == "retry" and value.isdigit():
+                event.retry = int(value)
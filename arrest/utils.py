@@ -5,23 +5,25 @@ import logging
 import posixpath
 import re
 from collections import deque
-from functools import wraps
+from functools import lru_cache, partial, wraps
 from types import GeneratorType
-from typing import Any, Optional, TypeVar
+from typing import Any, Callable, Mapping, Optional, TypeAlias, TypeVar
 
 import orjson
 import tenacity
 from httpx import Headers, QueryParams
 from httpx._types import FileTypes
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from pydantic_xml import BaseXmlModel
 
 from arrest.logging import logger
-from arrest.params import ParamTypes, RequestArgs, _File, _Param
+from arrest.params import ParamTypes, RequestArgs, RequestPlan, _File, _Param
 from arrest.types import ExceptionHandler, ExceptionHandlers, UploadFile
 
 T = TypeVar("T")
 
+JSONEncoders: TypeAlias = Mapping[type, Callable[[Any], Any]]
+
 
 def sanitize_name(name: str) -> str:
     name = name.lower().replace(" ", "_")
@@ -63,6 +65,97 @@ def jsonify(obj: Any) -> Any:
     return orjson.loads(orjson.dumps(obj))
 
 
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset, deque, GeneratorType)):
+        return list(obj)
+    try:
+        return vars(obj)
+    except TypeError:
+        raise TypeError(f"{type(obj).__name__} is not JSON serializable") from None
+
+
+def _custom_lookup(
+    custom_encoder: JSONEncoders,
+) -> Callable[[type], Callable[[Any], Any] | None]:
+    """the custom encoder of a type, the first one along its mro, looked up
+    once per type"""
+    resolved: dict[type, Callable[[Any], Any] | None] = {}
+
+    def lookup(type_: type) -> Callable[[Any], Any] | None:
+        if type_ not in resolved:
+            resolved[type_] = next(
+                (custom_encoder[t] for t in type_.__mro__ if t in custom_encoder),
+                None,
+            )
+        return resolved[type_]
+
+    return lookup
+
+
+def _json_key(key: Any) -> bytes:
+    # a non-str key as `OPT_NON_STR_KEYS` writes it, out of `{key:null}`
+    return orjson.dumps({key: None}, option=orjson.OPT_NON_STR_KEYS)[1:-6]
+
+
+def _write_json(obj: Any) -> bytes:
+    """write out a json-compatible object, as `jsonable_encoder` returns it,
+    without recursing, for payloads nested deeper than orjson goes"""
+    parts: list[bytes] = []
+    # bytes on the stack are written out as they are, the rest are values
+    stack: list[Any] = [obj]
+    while stack:
+        value = stack.pop()
+        if type(value) is bytes:
+            parts.append(value)
+        elif isinstance(value, dict):
+            parts.append(b"{")
+            stack.append(b"}")
+            for idx, (key, val) in reversed(list(enumerate(value.items()))):
+                stack.append(val)
+                stack.append((b"," if idx else b"") + _json_key(key) + b":")
+        elif isinstance(value, list):
+            parts.append(b"[")
+            stack.append(b"]")
+            for idx in range(len(value) - 1, -1, -1):
+                stack.append(value[idx])
+                if idx:
+                    stack.append(b",")
+        else:
+            parts.append(orjson.dumps(value))
+    return b"".join(parts)
+
+
+def dump_json(obj: Any, custom_encoder: JSONEncoders | None = None) -> bytes:
+    """serialize a request body to json bytes in a single pass
+
+    pydantic models are serialized by pydantic, anything else by orjson,
+    which handles dataclasses, datetimes, UUIDs and enums natively. Other
+    types supported by `jsonable_encoder` (sets, nested models, plain
+    objects) are converted as orjson meets them, by the first encoder of
+    `custom_encoder` along their mro if there is one. Payloads nested deeper
+    than orjson supports are encoded by `jsonable_encoder` instead.
+    """
+    default: Callable[[Any], Any] = _json_default
+    if custom_encoder:
+        custom = _custom_lookup(custom_encoder)
+
+        def default(value: Any) -> Any:
+            fn = custom(type(value))
+            return fn(value) if fn is not None else _json_default(value)
+
+    elif isinstance(obj, BaseModel):
+        return obj.model_dump_json().encode()
+
+    try:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as exc:
+        if str(exc) != "Recursion limit reached":
+            raise
+    return _write_json(jsonable_encoder(obj, custom_encoder))
+
+
 def validate_model(type_: T, obj: Any) -> T:  # pragma: no cover
     """generic type validator / parser for validating / parsing any python object
     to a given python type.
@@ -74,8 +167,44 @@ def validate_model(type_: T, obj: Any) -> T:  # pragma: no cover
     Returns:
         T: type converted python object
     """
-    type_adapter = TypeAdapter(type_)
-    return type_adapter.validate_python(obj)
+    return get_type_adapter(type_).validate_python(obj)
+
+
+def validate_json(type_: T, data: bytes | str) -> T:
+    """parses a raw json document and validates it against a given python type
+    in a single pass, without building an intermediate python object.
+
+    Args:
+        type_ (Any): A valid python type
+        data (bytes | str): A json document
+
+    Returns:
+        T: type converted python object
+    """
+    return get_type_adapter(type_).validate_json(data)
+
+
+def is_json_invalid(exc: ValidationError) -> bool:
+    """checks whether a `ValidationError` was raised because the document
+    itself is not valid json"""
+    return any(error["type"] == "json_invalid" for error in exc.errors())
+
+
+@lru_cache(maxsize=512)
+def _cached_type_adapter(type_: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(type_)
+
+
+def get_type_adapter(type_: Any) -> TypeAdapter[Any]:
+    """return a `TypeAdapter` for `type_`, building its core schema only once
+    per type. Unhashable types (e.g. `Annotated` with unhashable metadata)
+    are not cached.
+    """
+    try:
+        hash(type_)
+    except TypeError:
+        return TypeAdapter(type_)
+    return _cached_type_adapter(type_)
 
 
 def is_rootmodel(obj: Any):
@@ -83,68 +212,159 @@ def is_rootmodel(obj: Any):
     return hasattr(obj, "root")
 
 
-def jsonable_encoder(obj: Any) -> Any:
-    """a json-compatible encoder that works similar to fastapi's `jsonable_encoder`
-    for the most part.
+# what an encoder makes of a value: a json-compatible leaf, key-value pairs
+# and items to encode in turn, or another value to encode in its place
+_LEAF, _PAIRS, _ITEMS, _AGAIN = range(4)
 
-    See: https://github.com/tiangolo/fastapi/blob/master/fastapi/encoders.py#L102
+_SCALARS = (str, int, float, type(None))
+_PLAIN = frozenset({str, int, float, bool, type(None)})
+_SEQUENCES = (list, set, frozenset, GeneratorType, tuple, deque)
 
-    Following things are unsupported
-    1. custom_encoders
-    2. include & exclude fields
-    3. sqlalchemy safe
+Encoder: TypeAlias = Callable[[Any], tuple[int, Any]]
 
-    Args:
-        obj (Any): python object to be json-serialized
 
-    Returns:
-        Any: json-serialized object
-    """
-    if isinstance(obj, BaseModel):
-        obj_dict = obj.model_dump()
-        return jsonable_encoder(obj_dict)
+def _encode_leaf(obj: Any) -> tuple[int, Any]:
+    return _LEAF, obj
+
+
+def _encode_enum(obj: enum.Enum) -> tuple[int, Any]:
+    return _LEAF, obj.value
 
-    if dataclasses.is_dataclass(obj):
-        return jsonable_encoder(dataclasses.asdict(obj))  # type: ignore[arg-type]
 
-    if isinstance(obj, enum.Enum):
-        return obj.value
+def _encode_model(obj: BaseModel) -> tuple[int, Any]:
+    return _AGAIN, obj.model_dump()
 
-    # if isinstance(obj, PurePath):
-    #     return str(obj)
 
-    if isinstance(obj, (str, int, float, type(None))):
-        return obj
+def _encode_dataclass(obj: Any) -> tuple[int, Any]:
+    return _PAIRS, [(f.name, getattr(obj, f.name)) for f in dataclasses.fields(obj)]
 
-    if isinstance(obj, dict):
-        encoded_dict = {}
-        for key, val in obj.items():
-            encoded_key = jsonable_encoder(key)
-            encoded_value = jsonable_encoder(val)
 
-            encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
+def _encode_dict(obj: dict) -> tuple[int, Any]:
+    return _PAIRS, obj.items()
 
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple, deque)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(jsonable_encoder(item))
 
-        return encoded_list
+def _encode_sequence(obj: Any) -> tuple[int, Any]:
+    return _ITEMS, obj
 
-    # fallback
+
+def _encode_fallback(obj: Any) -> tuple[int, Any]:
     try:
-        data = jsonify(obj)  # use orjson parser
+        return _LEAF, jsonify(obj)  # use orjson parser
     except Exception as e:
-        errors: list[Exception] = []
-        errors.append(e)
+        errors: list[Exception] = [e]
         try:
-            data = vars(obj)  # try parsing __dict__
+            return _PAIRS, vars(obj).items()  # try parsing __dict__
         except Exception as e:
             errors.append(e)
             raise ValueError(errors) from e
 
-    return jsonable_encoder(data)
+
+def _encode_custom(fn: Callable[[Any], Any], obj: Any) -> tuple[int, Any]:
+    encoded = fn(obj)
+    if type(encoded) is type(obj):
+        # e.g. a `str` encoder, its own result must not go through it again
+        return _encoder_for(type(encoded))(encoded)
+    return _AGAIN, encoded
+
+
+_encoders: dict[type, Encoder] = {}
+
+
+def _encoder_for(type_: type) -> Encoder:
+    """the encoder of a type, looked up once per type"""
+    if (encoder := _encoders.get(type_)) is not None:
+        return encoder
+
+    if issubclass(type_, BaseModel):
+        encoder = _encode_model
+    elif dataclasses.is_dataclass(type_):
+        encoder = _encode_dataclass
+    elif issubclass(type_, enum.Enum):
+        encoder = _encode_enum
+    elif issubclass(type_, _SCALARS):
+        encoder = _encode_leaf
+    elif issubclass(type_, dict):
+        encoder = _encode_dict
+    elif issubclass(type_, _SEQUENCES):
+        encoder = _encode_sequence
+    else:
+        encoder = _encode_fallback
+
+    _encoders[type_] = encoder
+    return encoder
+
+
+def jsonable_encoder(
+    obj: Any,
+    custom_encoder: JSONEncoders | None = None,
+) -> Any:
+    """a json-compatible encoder that works similar to fastapi's `jsonable_encoder`
+    for the most part.
+
+    See: https://github.com/tiangolo/fastapi/blob/master/fastapi/encoders.py#L102
+
+    The object is walked iteratively, so deeply nested payloads do not hit
+    the recursion limit, and the way to encode a type is looked up once.
+
+    Following things are unsupported
+    1. include & exclude fields
+    2. sqlalchemy safe
+
+    Usage:
+        ```python
+        >>> jsonable_encoder({"price": Decimal("1.5")}, custom_encoder={Decimal: str})
+        {'price': '1.5'}
+        ```
+
+    Args:
+        obj (Any): python object to be json-serialized
+        custom_encoder (Mapping[type, Callable]): encoders by type, used for
+            instances of the type and its subclasses before the default ones.
+            What they return is encoded in turn.
+
+    Returns:
+        Any: json-serialized object
+    """
+    # values of these types are json-compatible as they are, and are not
+    # pushed onto the stack unless a custom encoder takes them over
+    plain = _PLAIN
+    custom = _custom_lookup(custom_encoder) if custom_encoder else None
+    if custom is not None:
+        plain = frozenset(t for t in _PLAIN if custom(t) is None)
+
+    def encoder_for(type_: type) -> Encoder:
+        if custom is not None and (fn := custom(type_)) is not None:
+            return partial(_encode_custom, fn)
+        return _encoder_for(type_)
+
+    root: list[Any] = [obj]
+    # (value, container, slot): `value` encoded goes into `container[slot]`
+    stack: list[tuple[Any, Any, Any]] = [(obj, root, 0)]
+    while stack:
+        value, container, slot = stack.pop()
+        kind, payload = encoder_for(type(value))(value)
+
+        if kind == _LEAF:
+            container[slot] = payload
+        elif kind == _AGAIN:
+            stack.append((payload, container, slot))
+        elif kind == _PAIRS:
+            encoded_dict: dict[Any, Any] = {}
+            for key, val in payload:
+                if type(key) not in plain:
+                    key = jsonable_encoder(key, custom_encoder)
+                encoded_dict[key] = val
+                if type(val) not in plain:
+                    stack.append((val, encoded_dict, key))
+            container[slot] = encoded_dict
+        else:
+            encoded_list = list(payload)
+            for index, item in enumerate(encoded_list):
+                if type(item) not in plain:
+                    stack.append((item, encoded_list, index))
+            container[slot] = encoded_list
+
+    return root[0]
 
 
 def retry(*, max_retries: int, exceptions: tuple[type[Exception], ...]):
@@ -230,18 +450,85 @@ def lookup_exception_handler(
             return exc_handlers[cls]
 
 
+@lru_cache(maxsize=1024)
+def _field_names(model: type[BaseModel]) -> set[str] | None:
+    """the fields of `model` to dump, `None` for all of them unless it has
+    computed fields, which are never part of a request"""
+    if not model.model_computed_fields:
+        return None
+    return set(model.model_fields)
+
+
+@lru_cache(maxsize=1024)
+def compile_request_plan(model: type[BaseModel]) -> RequestPlan:
+    """Sort the fields of a request model into query, header, body and file
+    params, keyed by the name pydantic serializes them under.
+
+    Raises:
+        ValueError: if JSON body fields are mixed with form / file fields
+    """
+    query: list[str] = []
+    header: list[str] = []
+    body: list[str] = []
+    files: list[str] = []
+    is_json_body = False
+    is_form_body = False
+
+    for field_name, field_info in model.model_fields.items():
+        # `Query(alias=...)` only sets `.alias`, which `by_alias` dumps ignore
+        key = field_info.serialization_alias or field_name
+        if not isinstance(field_info, _Param):
+            body.append(key)
+            is_json_body = True
+            continue
+
+        match field_info._param_type:
+            case ParamTypes.query:
+                query.append(key)
+            case ParamTypes.header:
+                header.append(key)
+            case ParamTypes.body:
+                body.append(key)
+                is_json_body = True
+            case ParamTypes.form:
+                body.append(key)
+                is_form_body = True
+            case ParamTypes.file:
+                files.append(field_name)
+                is_form_body = True
+
+    if is_json_body and is_form_body:
+        raise ValueError(
+            "Cannot mix JSON body fields (annotated with Body() or unannotated)"
+            " with form fields (annotated with Form() or File()) in the same request model"
+        )
+
+    return RequestPlan(
+        query=tuple(query),
+        header=tuple(header),
+        body=tuple(body),
+        files=tuple(files),
+        is_json_body=is_json_body,
+        is_form_body=is_form_body,
+    )
+
+
 def extract_request_params(
     request_type: Any,
     request_data: Any,
     headers: dict[str, str] | None = None,
     query: dict[str, Any] | None = None,
+    custom_encoder: JSONEncoders | None = None,
 ) -> RequestArgs:
-    header_params: dict[str, str] = headers or {}
-    query_params: dict[str, Any] = query or {}
+    # copied, the dicts of a shared config must not pick up request fields
+    header_params: dict[str, str] = dict(headers) if headers else {}
+    query_params: dict[str, Any] = dict(query) if query else {}
     body_params: dict[str, Any] = {}
     file_params: dict[str, FileTypes] = {}
 
-    if request_type:
+    if request_type and not (
+        isinstance(request_type, type) and isinstance(request_data, request_type)
+    ):
         # perform type validation on `request_data`
         request_data = validate_model(type_=request_type, obj=request_data)
 
@@ -258,42 +545,42 @@ def extract_request_params(
         return RequestArgs(
             header=Headers(header_params),
             query=QueryParams(query_params),
-            body=jsonable_encoder(request_data),
+            body=dump_json(request_data, custom_encoder),
             content_type="application/json",
         )
 
     if isinstance(request_data, BaseModel):
-        model_fields = request_data.__class__.model_fields
-        is_json_body = False
-        is_form_body = False
-
-        for field_name, field_info in model_fields.items():
-            if not isinstance(field_info, _Param):
-                body_params |= extract_model_field(request_data, field_name)
-                is_json_body = True
-            else:
-                match field_info._param_type:
-                    case ParamTypes.query:
-                        query_params |= extract_model_field(request_data, field_name)
-                    case ParamTypes.header:
-                        header_params |= extract_model_field(request_data, field_name)
-                    case ParamTypes.body:
-                        body_params |= extract_model_field(request_data, field_name)
-                        is_json_body = True
-                    case ParamTypes.form:
-                        is_form_body = True
-                        body_params |= extract_model_field(request_data, field_name)
-                    case ParamTypes.file:
-                        is_form_body = True
-                        file_params |= extract_file_params(request_data, field_name)
-
-        if is_json_body and is_form_body:
-            raise ValueError(
-                "Cannot mix JSON body fields (annotated with Body() or unannotated)"
-                " with form fields (annotated with Form() or File()) in the same request model"
+        plan = compile_request_plan(request_data.__class__)
+        if plan.body and not (
+            plan.query or plan.header or plan.files or plan.is_form_body
+        ):
+            # the whole model is the body, serialized by pydantic straight to json
+            return RequestArgs(
+                header=Headers(header_params),
+                query=QueryParams(query_params),
+                body=request_data.model_dump_json(
+                    include=_field_names(request_data.__class__), by_alias=True
+                ).encode(),
+                content_type="application/json",
             )
 
-        if is_form_body:
+        dumped = request_data.model_dump(
+            mode="json", by_alias=True, exclude=set(plan.files) or None
+        )
+
+        for key in plan.query:
+            if key in dumped:
+                query_params[key] = dumped[key]
+        for key in plan.header:
+            if key in dumped:
+                header_params[key] = dumped[key]
+        for key in plan.body:
+            if key in dumped:
+                body_params[key] = dumped[key]
+        for field_name in plan.files:
+            file_params |= extract_file_params(request_data, field_name)
+
+        if plan.is_form_body:
             if file_params:
                 return RequestArgs(
                     header=Headers(header_params),
@@ -310,10 +597,11 @@ def extract_request_params(
                 content_type="application/x-www-form-urlencoded",
             )
 
+        # already json-compatible, dumped with `mode="json"`
         return RequestArgs(
             header=Headers(header_params),
             query=QueryParams(query_params),
-            body=jsonable_encoder(body_params) if body_params else None,
+            body=orjson.dumps(body_params) if body_params else None,
             files=file_params if file_params else None,
             content_type="application/json" if body_params else None,
         )
@@ -323,7 +611,7 @@ def extract_request_params(
     return RequestArgs(
         header=Headers(header_params),
         query=QueryParams(query_params),
-        body=jsonable_encoder(body_params) if body_params else None,
+        body=dump_json(body_params, custom_encoder) if body_params else None,
         files=file_params if file_params else None,
         content_type="application/json" if body_params else None,
     )
@@ -341,6 +629,5 @@ def build_body_kwargs(
         return {"data": body, "files": files}
     if content_type == "application/x-www-form-urlencoded":
         return {"data": body}
-    if content_type == "application/xml":
-        return {"content": body}
-    return {"json": body} if body else {}
+    # xml and json bodies are serialized already
+    return {"content": body} if body else {}
@@ -1,6 +1,10 @@
+import inspect
+
+import httpx
 import pytest
 import respx
 
+from arrest._config import ArrestConfig
 from arrest.service import Service
 from tests import TEST_DEFAULT_SERVICE_NAME, TEST_DEFAULT_SERVICE_URL
 
@@ -15,3 +19,42 @@ def mock_httpx():
 def service():
     service_ = Service(name=TEST_DEFAULT_SERVICE_NAME, url=TEST_DEFAULT_SERVICE_URL)
     return service_
+
+
+@pytest.fixture(scope="function")
+def calls() -> list[httpx.Request]:
+    """the requests answered by the responder of `make_service`"""
+    return []
+
+
+@pytest.fixture(scope="function")
+def make_service(calls):
+    """
+    builds a `Service` with `resources`, configured with `config`.
+
+    With a `responder`, a function (sync or async) of the `httpx.Request`
+    returning an `httpx.Response`, requests are answered in-process through
+    an `httpx.MockTransport` and recorded in `calls`. Without one, they go
+    through httpx as usual, e.g. to `mock_httpx`.
+    """
+
+    def make_service_(resources, responder=None, **config) -> Service:
+        if responder is not None:
+
+            async def handler(request: httpx.Request) -> httpx.Response:
+                calls.append(request)
+                response = responder(request)
+                if inspect.isawaitable(response):
+                    response = await response
+                return response
+
+            config["transport"] = httpx.MockTransport(handler)
+
+        return Service(
+            name=TEST_DEFAULT_SERVICE_NAME,
+            url=TEST_DEFAULT_SERVICE_URL,
+            config=ArrestConfig(**config),
+            resources=resources,
+        )
+
+    return make_service_
@@ -1,12 +1,12 @@
-from arrest import Resource
+from arrest import H, Resource
 from .models import Pet, Pets
 
 pets = Resource(
     name="pets",
     route="/pets",
     handlers=[
-        ("GET", "", None, Pets),
-        ("POST", "", None, None),
-        ("GET", "/{petId}", None, Pet),
+        H("GET", "", None, Pets, name="list_pets"),
+        H("POST", "", None, None, name="create_pets"),
+        H("GET", "/{petId}", None, Pet, name="show_pet_by_id"),
     ]
 )
@@ -1,11 +1,11 @@
-from arrest import Resource
+from arrest import H, Resource
 from .models import Pet, Pets
 
 root = Resource(
     name="root",
     route="",
     handlers=[
-        ("GET", "/", None, None),
+        H("GET", "/", None, None, name="get_root"),
     ]
 )
 
@@ -13,7 +13,7 @@ health = Resource(
     name="health",
     route="/health",
     handlers=[
-        ("GET", "", None, None),
+        H("GET", "", None, None, name="get_health"),
     ]
 )
 
@@ -21,8 +21,8 @@ pets = Resource(
     name="pets",
     route="/pets",
     handlers=[
-        ("GET", "", None, Pets),
-        ("POST", "", None, None),
-        ("GET", "/{petId}", None, Pet),
+        H("GET", "", None, Pets, name="list_pets"),
+        H("POST", "", None, None, name="create_pets"),
+        H("GET", "/{petId}", None, Pet, name="show_pet_by_id"),
     ]
 )
@@ -1,18 +1,18 @@
-from arrest import Resource
+from arrest import H, Resource
 from .models import ApiResponse, Order, Pet, User
 
 pet = Resource(
     name="pet",
     route="/pet",
     handlers=[
-        ("POST", "", Pet, Pet),
-        ("PUT", "", Pet, Pet),
-        ("GET", "/findByStatus", None, None),
-        ("GET", "/findByTags", None, None),
-        ("GET", "/{petId}", None, Pet),
-        ("POST", "/{petId}", None, None),
-        ("DELETE", "/{petId}", None, None),
-        ("POST", "/{petId}/uploadImage", None, ApiResponse),
+        H("POST", "", Pet, Pet, name="add_pet"),
+        H("PUT", "", Pet, Pet, name="update_pet"),
+        H("GET", "/findByStatus", None, None, name="find_pets_by_status"),
+        H("GET", "/findByTags", None, None, name="find_pets_by_tags"),
+        H("GET", "/{petId}", None, Pet, name="get_pet_by_id"),
+        H("POST", "/{petId}", None, None, name="update_pet_with_form"),
+        H("DELETE", "/{petId}", None, None, name="delete_pet"),
+        H("POST", "/{petId}/uploadImage", None, ApiResponse, name="upload_file"),
     ]
 )
 
@@ -20,10 +20,10 @@ store = Resource(
     name="store",
     route="/store",
     handlers=[
-        ("GET", "/inventory", None, None),
-        ("POST", "/order", Order, Order),
-        ("GET", "/order/{orderId}", None, Order),
-        ("DELETE", "/order/{orderId}", None, None),
+        H("GET", "/inventory", None, None, name="get_inventory"),
+        H("POST", "/order", Order, Order, name="place_order"),
+        H("GET", "/order/{orderId}", None, Order, name="get_order_by_id"),
+        H("DELETE", "/order/{orderId}", None, None, name="delete_order"),
     ]
 )
 
@@ -31,12 +31,12 @@ user = Resource(
     name="user",
     route="/user",
     handlers=[
-        ("POST", "", User, None),
-        ("POST", "/createWithList", None, User),
-        ("GET", "/login", None, None),
-        ("GET", "/logout", None, None),
-        ("GET", "/{username}", None, User),
-        ("PUT", "/{username}", User, None),
-        ("DELETE", "/{username}", None, None),
+        H("POST", "", User, None, name="create_user"),
+        H("POST", "/createWithList", None, User, name="create_users_with_list_input"),
+        H("GET", "/login", None, None, name="login_user"),
+        H("GET", "/logout", None, None, name="logout_user"),
+        H("GET", "/{username}", None, User, name="get_user_by_name"),
+        H("PUT", "/{username}", User, None, name="update_user"),
+        H("DELETE", "/{username}", None, None, name="delete_user"),
     ]
 )
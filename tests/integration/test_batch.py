@@ -0,0 +1,162 @@
+import asyncio
+
+import httpx
+import pytest
+
+from arrest import Call, Resource
+from arrest.exceptions import ArrestHTTPException, DeadlineExceeded, HandlerNotFound
+
+
+def resources() -> list[Resource]:
+    return [
+        Resource(route="/user", handlers=[("GET", "/{user_id:int}")]),
+        Resource(route="/post", handlers=[("GET", "/{post_id}")]),
+    ]
+
+
+def responder(in_flight: list | None = None):
+    active = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal active
+        active += 1
+        if in_flight is not None:
+            in_flight.append(active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if request.url.path.endswith("/404"):
+            return httpx.Response(404, json={"detail": "not found"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    return respond
+
+
+@pytest.mark.asyncio
+async def test_gather_ordered_and_bounded(make_service, calls):
+    in_flight: list[int] = []
+    service = make_service(resources(), responder(in_flight))
+
+    async with service:
+        responses = await service.user.gather(
+            [Call("GET", f"/{user_id}") for user_id in range(20)], concurrency=4
+        )
+
+    assert [resp.data["path"] for resp in responses] == [
+        f"/user/{user_id}" for user_id in range(20)
+    ]
+    assert len(calls) == 20
+    assert max(in_flight) == 4
+
+
+@pytest.mark.asyncio
+async def test_gather_path_params_and_options(make_service, calls):
+    service = make_service(resources(), responder())
+
+    async with service:
+        responses = await service.user.gather(
+            [
+                Call("GET", "/", user_id=1, query={"q": "a"}),
+                Call("GET", "/", user_id=2, headers={"x-id": "2"}),
+                Call("GET", "/", user_id=1, query={"q": "b"}),
+            ]
+        )
+
+    assert [resp.data["path"] for resp in responses] == [
+        "/user/1",
+        "/user/2",
+        "/user/1",
+    ]
+    assert calls[0].url.params["q"] == "a"
+    assert calls[1].headers["x-id"] == "2"
+    assert calls[2].url.params["q"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_gather_deadline_and_decode(make_service):
+    service = make_service(resources(), responder())
+
+    async with service:
+        raw, late = await service.user.gather(
+            [Call("GET", "/1", decode=False), Call("GET", "/2", deadline=0.001)]
+        )
+
+    assert raw.data is None
+    assert raw.raw.json() == {"path": "/user/1"}
+    assert isinstance(late, DeadlineExceeded)
+
+
+@pytest.mark.asyncio
+async def test_gather_per_item_exceptions(make_service):
+    service = make_service(resources(), responder())
+
+    async with service:
+        responses = await service.user.gather(
+            [
+                Call("GET", "/1"),
+                Call("GET", "/404", raise_for_status=True),
+                Call("POST", "/1"),
+                Call("GET", "/2"),
+            ]
+        )
+
+    assert responses[0].data == {"path": "/user/1"}
+    assert isinstance(responses[1], ArrestHTTPException)
+    assert responses[1].status_code == 404
+    assert isinstance(responses[2], HandlerNotFound)
+    assert responses[3].data == {"path": "/user/2"}
+
+
+@pytest.mark.asyncio
+async def test_gather_raises_first_exception(make_service, calls):
+    service = make_service(resources(), responder())
+
+    async with service:
+        with pytest.raises(ArrestHTTPException):
+            await service.user.gather(
+                [Call("GET", "/404", raise_for_status=True)]
+                + [Call("GET", f"/{user_id}") for user_id in range(20)],
+                concurrency=2,
+                return_exceptions=False,
+            )
+
+    assert len(calls) < 21
+
+
+@pytest.mark.asyncio
+async def test_gather_resolves_each_route_once(mocker, make_service):
+    service = make_service(resources(), responder())
+    resolve = mocker.spy(service.user, "_resolve")
+
+    async with service:
+        responses = await service.user.gather(
+            [Call("GET", "/1") for _ in range(10)] + [Call("GET", "/2")]
+        )
+
+    assert all(resp.status_code == 200 for resp in responses)
+    assert resolve.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_service_gather_across_resources(make_service):
+    service = make_service(resources(), responder())
+
+    async with service:
+        responses = await service.gather(
+            [
+                service.user.call("GET", "/1"),
+                service.post.call("GET", "/", post_id="abc"),
+            ]
+        )
+        with pytest.raises(ValueError):
+            await service.gather([Call("GET", "/1")], return_exceptions=False)
+
+    assert [resp.data["path"] for resp in responses] == ["/user/1", "/post/abc"]
+
+
+@pytest.mark.asyncio
+async def test_gather_invalid_concurrency(make_service):
+    service = make_service(resources(), responder())
+
+    with pytest.raises(ValueError):
+        await service.user.gather([Call("GET", "/1")], concurrency=0)
+    assert await service.user.gather([]) == []
@@ -0,0 +1,104 @@
+import inspect
+import uuid
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from arrest import H, Resource, Response
+from arrest.exceptions import ConversionError
+from tests import TEST_DEFAULT_SERVICE_URL
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+class UserRequest(BaseModel):
+    name: str
+
+
+def user_resources() -> list[Resource]:
+    return [
+        Resource(
+            route="/users",
+            handlers=[
+                H("GET", "/{user_id:int}", None, User, name="get_user"),
+                H("POST", "/", UserRequest, User, name="create_user"),
+                H("GET", "/{org_id:uuid}/{user_id:int}", name="get_org_user"),
+            ],
+        )
+    ]
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    user_id = request.url.path.rsplit("/", 1)[-1]
+    return httpx.Response(200, json={"id": user_id or 0, "name": "alice"})
+
+
+@pytest.mark.asyncio
+async def test_operation_call(monkeypatch, make_service, calls):
+    service = make_service(user_resources(), respond)
+    users = service.users
+
+    def fail(*args, **kwargs):
+        raise AssertionError("operations do not match routes")
+
+    monkeypatch.setattr(users, "get_matching_handler", fail)
+
+    async with service:
+        response = await users.get_user(user_id=1, query={"expand": "all"})
+        created = await users.create_user(UserRequest(name="alice"))
+
+    assert response.data == User(id=1, name="alice")
+    assert created.data == User(id=0, name="alice")
+    assert str(calls[0].url) == f"{TEST_DEFAULT_SERVICE_URL}/users/1?expand=all"
+    assert calls[1].method == "POST"
+    assert calls[1].content == b'{"name":"alice"}'
+
+
+@pytest.mark.asyncio
+async def test_operation_path_params(make_service):
+    service = make_service(user_resources(), respond)
+    users = service.users
+
+    with pytest.raises(TypeError, match="missing path params: org_id"):
+        await users.get_org_user(user_id=1)
+    with pytest.raises(TypeError, match="unexpected path params: name"):
+        await users.get_user(user_id=1, name="alice")
+    with pytest.raises(ConversionError):
+        await users.get_user(user_id="alice")
+
+
+def test_operation_signature(make_service):
+    users = make_service(user_resources()).users
+
+    assert set(users.operations) == {"get_user", "create_user", "get_org_user"}
+    signature = inspect.signature(users.get_org_user)
+    assert signature.parameters["org_id"].annotation is uuid.UUID
+    assert signature.parameters["user_id"].annotation is int
+    assert signature.parameters["user_id"].kind is inspect.Parameter.KEYWORD_ONLY
+    assert signature.return_annotation is Response
+
+    signature = inspect.signature(users.create_user)
+    assert signature.parameters["request"].annotation == UserRequest | None
+    assert signature.return_annotation == Response[User]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "get",
+        "routes",
+        "route",
+        "base_url",
+        "operations",
+        "_pool",
+        "not a name",
+        "class",
+    ],
+)
+def test_operation_invalid_name(name):
+    with pytest.raises(ValueError):
+        Resource(route="/users", handlers=[H("GET", "/", name=name)])
@@ -0,0 +1,187 @@
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from arrest import Resource
+from arrest.exceptions import ArrestHTTPException
+from arrest.pagination import (
+    CursorPagination,
+    LinkPagination,
+    OffsetPagination,
+    PagePagination,
+)
+from tests import TEST_DEFAULT_SERVICE_URL
+
+USERS = [{"id": idx, "name": f"user{idx}"} for idx in range(25)]
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+def user_resources() -> list[Resource]:
+    return [Resource(route="/users", handlers=[("GET", "/", None, list[User])])]
+
+
+def offset_responder(request: httpx.Request) -> httpx.Response:
+    offset = int(request.url.params["offset"])
+    limit = int(request.url.params["limit"])
+    return httpx.Response(200, json=USERS[offset : offset + limit])
+
+
+@pytest.mark.asyncio
+async def test_paginate_offset_validates_items(make_service, calls):
+    service = make_service(user_resources(), offset_responder)
+
+    async with service:
+        users = [
+            user
+            async for user in service.users.paginate(
+                "/", OffsetPagination(limit=10), query={"sort": "id"}
+            )
+        ]
+
+    assert users == [User(**user) for user in USERS]
+    assert [request.url.params["offset"] for request in calls] == ["0", "10", "20"]
+    assert all(request.url.params["sort"] == "id" for request in calls)
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursor(make_service, calls):
+    def responder(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params.get("after", 0))
+        page = USERS[start : start + 10]
+        next_cursor = start + 10 if start + 10 < len(USERS) else None
+        return httpx.Response(200, json={"data": page, "meta": {"next": next_cursor}})
+
+    service = make_service(user_resources(), responder)
+
+    async with service:
+        users = [
+            user
+            async for user in service.users.paginate(
+                "/",
+                CursorPagination(
+                    cursor="meta.next", cursor_param="after", items="data"
+                ),
+                item_type=dict,
+            )
+        ]
+
+    assert users == USERS
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_paginate_page_number(make_service, calls):
+    def responder(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=USERS[(page - 1) * 10 : page * 10])
+
+    service = make_service(user_resources(), responder)
+
+    async with service:
+        users = [user async for user in service.users.paginate("/", PagePagination())]
+
+    assert [user.id for user in users] == list(range(25))
+    # an empty page ends the iteration
+    assert [request.url.params["page"] for request in calls] == ["1", "2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_paginate_link_header(make_service, calls):
+    def responder(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        headers = {}
+        if page < 3:
+            headers["Link"] = (
+                f'<{TEST_DEFAULT_SERVICE_URL}/users/?page={page + 1}>; rel="next"'
+            )
+        return httpx.Response(
+            200, json=USERS[(page - 1) * 10 : page * 10], headers=headers
+        )
+
+    service = make_service(user_resources(), responder)
+
+    async with service:
+        users = [user async for user in service.users.paginate("/", LinkPagination())]
+
+    assert len(users) == 25
+    assert [str(request.url) for request in calls] == [
+        f"{TEST_DEFAULT_SERVICE_URL}/users/",
+        f"{TEST_DEFAULT_SERVICE_URL}/users/?page=2",
+        f"{TEST_DEFAULT_SERVICE_URL}/users/?page=3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetches_next_page(make_service, calls):
+    service = make_service(user_resources(), offset_responder)
+
+    async with service:
+        pages = service.users.paginate("/", OffsetPagination(limit=10))
+        await anext(pages)
+        await asyncio.sleep(0.01)
+        # the second page is requested while the first one is consumed
+        assert len(calls) == 2
+        await pages.aclose()
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_paginate_raises_on_error_page(make_service):
+    def responder(request: httpx.Request) -> httpx.Response:
+        if request.url.params["offset"] == "10":
+            return httpx.Response(500, json={"detail": "boom"})
+        return offset_responder(request)
+
+    service = make_service(user_resources(), responder)
+
+    async with service:
+        users = []
+        with pytest.raises(ArrestHTTPException):
+            async for user in service.users.paginate("/", OffsetPagination(limit=10)):
+                users.append(user)
+
+    assert len(users) == 10
+
+
+@pytest.mark.asyncio
+async def test_paginate_deadline(make_service):
+    timeouts = []
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"]["read"])
+        return offset_responder(request)
+
+    service = make_service(user_resources(), responder)
+
+    async with service:
+        users = [
+            user
+            async for user in service.users.paginate(
+                "/", OffsetPagination(limit=10), deadline=5
+            )
+        ]
+
+    assert len(users) == len(USERS)
+    assert len(timeouts) == 3
+    assert all(0 < timeout <= 5 for timeout in timeouts)
+
+
+@pytest.mark.parametrize("decode", [False, "lazy"])
+@pytest.mark.asyncio
+async def test_paginate_decodes_pages_whatever_the_config(decode, make_service):
+    service = make_service(user_resources(), offset_responder, decode=decode)
+
+    async with service:
+        users = [
+            user
+            async for user in service.users.paginate("/", OffsetPagination(limit=10))
+        ]
+
+    assert users == [User(**user) for user in USERS]
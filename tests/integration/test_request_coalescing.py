@@ -0,0 +1,171 @@
+import asyncio
+
+import httpx
+import pytest
+
+from arrest import Resource
+from arrest._config import ArrestConfig
+from arrest.exceptions import ArrestHTTPException
+from arrest.handler import H
+from arrest.http import Methods
+
+
+async def respond(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.05)
+    status = int(request.url.params.get("status", 200))
+    return httpx.Response(status, json={"path": request.url.path})
+
+
+def user_resource(config: ArrestConfig, handlers: list) -> list[Resource]:
+    return [Resource(route="/user", handlers=handlers, config=config)]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_identical_get_requests(make_service, calls):
+    service = make_service(
+        user_resource(ArrestConfig(coalesce=True), [("GET", "/{id}")]), respond
+    )
+
+    async with service:
+        responses = await asyncio.gather(
+            *(service.user.get("/1") for _ in range(10)),
+            service.user.get("/2"),
+            service.user.get("/1", query={"page": 2}),
+        )
+
+    assert len(calls) == 3
+    assert all(resp is responses[0] for resp in responses[:10])
+    assert responses[10].data == {"path": "/user/2"}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_split_by_decode(make_service, calls):
+    service = make_service(
+        user_resource(ArrestConfig(coalesce=True), [("GET", "/{id}")]), respond
+    )
+
+    async with service:
+        raw, decoded = await asyncio.gather(
+            service.user.get("/1", decode=False), service.user.get("/1")
+        )
+
+    assert len(calls) == 2
+    assert raw.data is None
+    assert decoded.data == {"path": "/user/1"}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_raise_for_status_per_caller(make_service, calls):
+    service = make_service(
+        user_resource(ArrestConfig(coalesce=True), [("GET", "/{id}")]), respond
+    )
+
+    async with service:
+        raised, response = await asyncio.gather(
+            service.user.get("/1", query={"status": 404}, raise_for_status=True),
+            service.user.get("/1", query={"status": 404}, raise_for_status=False),
+            return_exceptions=True,
+        )
+
+    assert len(calls) == 1
+    assert isinstance(raised, ArrestHTTPException)
+    assert raised.status_code == 404
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_coalesce_split_by_follow_redirects(make_service, calls):
+    service = make_service(
+        user_resource(ArrestConfig(coalesce=True), [("GET", "/{id}")]), respond
+    )
+
+    async with service:
+        await asyncio.gather(
+            service.user.get("/1", follow_redirects=True),
+            service.user.get("/1", follow_redirects=False),
+        )
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_disabled_by_default(make_service, calls):
+    service = make_service(user_resource(ArrestConfig(), [("GET", "/{id}")]), respond)
+
+    async with service:
+        await asyncio.gather(*(service.user.get("/1") for _ in range(5)))
+
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_coalesce_skips_non_idempotent_methods(make_service, calls):
+    service = make_service(
+        user_resource(ArrestConfig(coalesce=True), [("POST", "/{id}")]), respond
+    )
+
+    async with service:
+        await asyncio.gather(*(service.user.post("/1") for _ in range(3)))
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_selected_headers(make_service, calls):
+    service = make_service(
+        user_resource(
+            ArrestConfig(coalesce=True, coalesce_headers=("authorization",)),
+            [("GET", "/{id}")],
+        ),
+        respond,
+    )
+
+    async with service:
+        await asyncio.gather(
+            service.user.get("/1", headers={"x-request-id": "a"}),
+            service.user.get("/1", headers={"x-request-id": "b"}),
+            service.user.get("/1", headers={"authorization": "Bearer other"}),
+        )
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_per_handler_config(make_service, calls):
+    service = make_service(
+        user_resource(
+            ArrestConfig(),
+            [
+                H(Methods.GET, "/config", config=ArrestConfig(coalesce=True)),
+                H(Methods.GET, "/profile"),
+            ],
+        ),
+        respond,
+    )
+
+    async with service:
+        await asyncio.gather(
+            *(service.user.get("/config") for _ in range(4)),
+            *(service.user.get("/profile") for _ in range(4)),
+        )
+
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_coalesce_caller_cancellation_does_not_cancel_others(make_service, calls):
+    service = make_service(
+        user_resource(ArrestConfig(coalesce=True), [("GET", "/{id}")]), respond
+    )
+
+    async with service:
+        first = asyncio.create_task(service.user.get("/1"))
+        second = asyncio.create_task(service.user.get("/1"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        response = await second
+
+    assert first.cancelled()
+    assert response.data == {"path": "/user/1"}
+    assert len(calls) == 1
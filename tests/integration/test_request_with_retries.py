@@ -1,9 +1,11 @@
 import httpx
 import pytest
+from pydantic import BaseModel
 
 from arrest import Resource, Service
 from arrest._config import ArrestConfig
-from arrest.exceptions import RequestError
+from arrest.exceptions import ArrestHTTPException, RequestError
+from arrest.retry import RetryPolicy
 from tests import TEST_DEFAULT_SERVICE_NAME, TEST_DEFAULT_SERVICE_URL
 
 
@@ -83,3 +85,177 @@ async def test_request_with_manual_retry(mock_httpx):
         await get_with_retry()
 
     assert mock_httpx["http_request"].call_count == 3
+
+
+def user_resources(response=None) -> list[Resource]:
+    return [
+        Resource(
+            route="/user",
+            handlers=[("GET", "", None, response), ("POST", ""), ("PUT", "")],
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_retries_status_codes(mock_httpx, make_service):
+    route = mock_httpx.get(url__regex="/user", name="http_request").mock(
+        side_effect=[
+            httpx.Response(503),
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"id": 1}),
+        ]
+    )
+    service = make_service(
+        user_resources(),
+        retry=RetryPolicy(attempts=3, backoff=0),
+        raise_for_status=True,
+    )
+
+    response = await service.user.get("")
+
+    assert response.data == {"id": 1}
+    assert route.call_count == 3
+
+
+class User(BaseModel):
+    id: int
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_retries_typed_error_bodies(mock_httpx, make_service):
+    route = mock_httpx.get(url__regex="/user", name="http_request").mock(
+        side_effect=[
+            httpx.Response(503, json={"error": "unavailable"}),
+            httpx.Response(200, json={"id": 1}),
+        ]
+    )
+    service = make_service(
+        user_resources(User), retry=RetryPolicy(attempts=3, backoff=0)
+    )
+
+    # the error body is not a `User`, it is only validated once retried
+    response = await service.user.get("")
+
+    assert response.data == User(id=1)
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_raises_once_retries_are_exhausted(mock_httpx, make_service):
+    route = mock_httpx.get(url__regex="/user", name="http_request").mock(
+        return_value=httpx.Response(502, json={"detail": "bad gateway"})
+    )
+    service = make_service(
+        user_resources(),
+        retry=RetryPolicy(attempts=2, backoff=0),
+        raise_for_status=True,
+    )
+
+    with pytest.raises(ArrestHTTPException) as exc:
+        await service.user.get("")
+
+    assert exc.value.status_code == 502
+    assert exc.value.data == {"detail": "bad gateway"}
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_does_not_retry_other_errors(mock_httpx, make_service):
+    route = mock_httpx.get(url__regex="/user", name="http_request").mock(
+        return_value=httpx.Response(500)
+    )
+    service = make_service(
+        user_resources(),
+        retry=RetryPolicy(attempts=3, backoff=0),
+        raise_for_status=True,
+    )
+
+    with pytest.raises(ArrestHTTPException):
+        await service.user.get("")
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_long_retry_after(mock_httpx, make_service):
+    route = mock_httpx.get(url__regex="/user", name="http_request").mock(
+        return_value=httpx.Response(503, headers={"Retry-After": "120"})
+    )
+    service = make_service(
+        user_resources(),
+        retry=RetryPolicy(attempts=3, backoff=0, max_backoff=10),
+        raise_for_status=True,
+    )
+
+    with pytest.raises(ArrestHTTPException):
+        await service.user.get("")
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_methods(mock_httpx, make_service):
+    route = mock_httpx.post(url__regex="/user", name="http_request").mock(
+        side_effect=httpx.ConnectError("connection refused")
+    )
+    service = make_service(
+        user_resources(),
+        retry=RetryPolicy(attempts=3, backoff=0, methods={"GET"}),
+        raise_for_status=True,
+    )
+
+    with pytest.raises(RequestError):
+        await service.user.post("", request={})
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_default_methods(mock_httpx, make_service):
+    post = mock_httpx.post(url__regex="/user", name="post").mock(
+        side_effect=httpx.ConnectError("connection refused")
+    )
+    put = mock_httpx.put(url__regex="/user", name="put").mock(
+        side_effect=httpx.ConnectError("connection refused")
+    )
+    service = make_service(
+        user_resources(),
+        retry=RetryPolicy(attempts=3, backoff=0),
+        raise_for_status=True,
+    )
+
+    with pytest.raises(RequestError):
+        await service.user.post("", request={})
+    with pytest.raises(RequestError):
+        await service.user.put("", request={})
+
+    assert post.call_count == 1
+    assert put.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_policy_budget(mock_httpx, make_service):
+    route = mock_httpx.get(url__regex="/user", name="http_request").mock(
+        side_effect=httpx.ConnectError("connection refused")
+    )
+    service = make_service(
+        user_resources(),
+        retry=RetryPolicy(attempts=3, backoff=0, budget=0.5, budget_reserve=2),
+        raise_for_status=True,
+    )
+
+    for _ in range(3):
+        with pytest.raises(RequestError):
+            await service.user.get("")
+
+    # two retries from the reserve, then half a retry earned per request
+    assert route.call_count == 3 + 1 + 2
+
+
+def test_retry_policy_wait():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+
+    assert [policy.wait(n) for n in range(1, 5)] == [1, 2, 4, 5]
+    assert policy.wait(1, retry_after=3) == 3
+    assert policy.wait(1, retry_after=6) is None
+    assert RetryPolicy.from_max_retries(3) is RetryPolicy.from_max_retries(3)
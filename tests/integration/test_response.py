@@ -1,3 +1,6 @@
+import copy
+import dataclasses
+import pickle
 from datetime import datetime
 from uuid import uuid4
 
@@ -80,6 +83,35 @@ async def test_list_response_type(service, mock_httpx):
     assert response.data[1] == UserResponse(**res_2)
 
 
+@pytest.mark.asyncio
+async def test_typed_response_validated_from_bytes(service, mocker, mock_httpx):
+    service.add_resource(
+        Resource(route="/user", handlers=[(Methods.GET, "/", None, list[int])])
+    )
+    mock_httpx.get(url__regex="/user/*", name="http_request").mock(
+        return_value=httpx.Response(200, json=[1, "2", 3])
+    )
+    json_spy = mocker.spy(httpx.Response, "json")
+
+    response = await service.user.get("/")
+
+    assert response.data == [1, 2, 3]
+    assert json_spy.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_typed_response_plain_text_fallback(service, mock_httpx):
+    service.add_resource(
+        Resource(route="/user", handlers=[(Methods.GET, "/", None, str)])
+    )
+    mock_httpx.get(url__regex="/user/*", name="http_request").mock(
+        return_value=httpx.Response(200, text="hello world")
+    )
+
+    response = await service.user.get("/")
+    assert response.data == "hello world"
+
+
 @pytest.mark.asyncio
 async def test_response_type_invalid_type(service, mock_httpx):
     service.add_resource(
@@ -171,3 +203,130 @@ def test_response_status_properties(
     assert resp.is_redirect == redirect
     assert resp.is_client_error == client_err
     assert resp.is_server_error == server_err
+
+
+@pytest.mark.asyncio
+async def test_response_lazy_decode(service, mock_httpx, mocker):
+    from pydantic import ValidationError
+
+    service.add_resource(
+        Resource(route="/user", handlers=[(Methods.GET, "/", None, UserResponse)])
+    )
+    mock_httpx.get(url__regex="/user/*", name="http_request").mock(
+        return_value=httpx.Response(200, json={"user_id": "1"})
+    )
+    spy = mocker.spy(Resource, "_decode_data")
+
+    response = await service.user.get("/", decode="lazy")
+
+    assert not response.is_decoded
+    assert "<not decoded>" in repr(response)
+    assert spy.call_count == 0
+    with pytest.raises(ValidationError):
+        response.data
+
+
+@pytest.mark.asyncio
+async def test_response_lazy_decode_memoised(service, mock_httpx, mocker):
+    service.add_resource(Resource(route="/user", handlers=[(Methods.GET, "/")]))
+    mock_httpx.get(url__regex="/user/*", name="http_request").mock(
+        return_value=httpx.Response(200, json={"id": 1})
+    )
+    spy = mocker.spy(Resource, "_decode_data")
+
+    response = await service.user.get("/", decode="lazy")
+
+    assert response.data == {"id": 1}
+    assert response.data is response.data
+    assert response.is_decoded
+    assert spy.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_response_skip_decode(service, mock_httpx):
+    from arrest._config import ArrestConfig
+
+    service.add_resource(
+        Resource(
+            route="/user",
+            handlers=[(Methods.GET, "/", None, UserResponse)],
+            config=ArrestConfig(decode=False),
+        )
+    )
+    mock_httpx.get(url__regex="/user/*", name="http_request").mock(
+        return_value=httpx.Response(200, content=b"not json")
+    )
+
+    response = await service.user.get("/")
+
+    assert response.data is None
+    assert response.raw.content == b"not json"
+
+    with pytest.raises(ValueError):
+        await service.user.get("/", decode=True)
+
+
+def test_response_is_frozen():
+    from dataclasses import FrozenInstanceError
+
+    from arrest.response import Response
+
+    resp = Response(
+        data={"id": 1},
+        status_code=200,
+        url=httpx.URL("http://x"),
+        elapsed=None,
+        raw=httpx.Response(200),
+        request=None,
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        resp.data = None
+    assert not hasattr(resp, "__dict__")
+    assert resp == Response({"id": 1}, 200, resp.url, None, resp.raw, None)
+
+
+def test_response_copy_and_replace():
+    from arrest.response import Response
+
+    raw = httpx.Response(200, json={"id": 1}, request=httpx.Request("GET", "http://x"))
+    resp = Response({"id": 1}, 200, raw.url, None, raw, raw.request)
+
+    assert copy.copy(resp) == resp
+    assert copy.deepcopy(resp).data == {"id": 1}
+    assert pickle.loads(pickle.dumps(resp)).data == {"id": 1}
+    assert dataclasses.replace(resp, data={"id": 2}).data == {"id": 2}
+
+    lazy = Response.lazy(lambda: {"id": 3}, 200, raw.url, None, raw, raw.request)
+    assert dataclasses.replace(lazy, status_code=201).data == {"id": 3}
+    assert copy.deepcopy(lazy).data == {"id": 3}
+    assert lazy.is_decoded
+
+
+@pytest.mark.parametrize(
+    "copy_response",
+    [
+        copy.copy,
+        lambda resp: dataclasses.replace(resp, status_code=201),
+        lambda resp: pickle.loads(pickle.dumps(resp)),
+    ],
+)
+def test_response_copy_decodes_lazy_response(copy_response):
+    from arrest.response import Response
+
+    decoded = []
+
+    def decoder():
+        decoded.append(True)
+        return {"id": 1}
+
+    raw = httpx.Response(200, request=httpx.Request("GET", "http://x"))
+    lazy = Response.lazy(decoder, 200, raw.url, None, raw, raw.request)
+
+    copied = copy_response(lazy)
+
+    assert lazy.is_decoded and copied.is_decoded
+    assert copied.data == lazy.data == {"id": 1}
+    assert decoded == [True]
+    with pytest.raises(AttributeError):
+        Response.data
@@ -0,0 +1,215 @@
+import httpx
+import pytest
+
+from arrest import Resource
+from arrest._config import ArrestConfig
+from arrest.cache import MemoryCache
+from arrest.exceptions import ArrestHTTPException
+
+
+def users() -> list[Resource]:
+    return [Resource(route="/user", handlers=[("GET", "/{id}")])]
+
+
+@pytest.mark.asyncio
+async def test_fresh_response_served_from_cache(make_service, calls):
+    service = make_service(
+        users(),
+        lambda request: httpx.Response(
+            200,
+            json={"path": request.url.path},
+            headers={"Cache-Control": "max-age=60"},
+        ),
+        cache=MemoryCache(),
+    )
+
+    async with service:
+        first = await service.user.get("/1")
+        second = await service.user.get("/1")
+        other = await service.user.get("/2")
+
+    assert len(calls) == 2
+    assert second is first
+    assert other.data == {"path": "/user/2"}
+
+
+@pytest.mark.asyncio
+async def test_stale_response_revalidated_with_etag(make_service, calls):
+    def responder(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(
+            200,
+            json={"name": "john"},
+            headers={"ETag": '"v1"', "Cache-Control": "no-cache"},
+        )
+
+    service = make_service(users(), responder, cache=MemoryCache())
+
+    async with service:
+        first = await service.user.get("/1", raise_for_status=True)
+        second = await service.user.get("/1", raise_for_status=True)
+
+    assert len(calls) == 2
+    assert "if-none-match" not in calls[0].headers
+    assert calls[1].headers["if-none-match"] == '"v1"'
+    assert second is first
+    assert second.data == {"name": "john"}
+
+
+@pytest.mark.asyncio
+async def test_changed_response_replaces_entry(make_service, calls):
+    versions = iter(["v1", "v2"])
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        version = next(versions)
+        return httpx.Response(
+            200,
+            json={"version": version},
+            headers={"ETag": f'"{version}"', "Cache-Control": "max-age=0"},
+        )
+
+    cache = MemoryCache()
+    service = make_service(users(), responder, cache=cache)
+
+    async with service:
+        await service.user.get("/1")
+        second = await service.user.get("/1")
+
+    assert calls[1].headers["if-none-match"] == '"v1"'
+    assert second.data == {"version": "v2"}
+    (entry,) = cache._entries.values()
+    assert entry.etag == '"v2"'
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_responses_not_stored(make_service, calls):
+    cache = MemoryCache()
+    service = make_service(
+        users(),
+        lambda request: httpx.Response(
+            200, json={}, headers={"Cache-Control": "no-store, max-age=60"}
+        ),
+        cache=cache,
+    )
+
+    async with service:
+        await service.user.get("/1")
+        await service.user.get("/1")
+        await service.user.get("/1", headers={"Cache-Control": "no-cache"})
+
+    assert len(calls) == 3
+    assert not cache._entries
+
+
+@pytest.mark.asyncio
+async def test_cache_split_by_authorization_and_vary(make_service, calls):
+    service = make_service(
+        users(),
+        lambda request: httpx.Response(
+            200,
+            json={},
+            headers={"Cache-Control": "max-age=60", "Vary": "Accept-Language"},
+        ),
+        cache=MemoryCache(),
+    )
+
+    async with service:
+        await service.user.get("/1", headers={"Authorization": "Bearer a"})
+        await service.user.get("/1", headers={"Authorization": "Bearer b"})
+        await service.user.get("/1", headers={"Accept-Language": "en"})
+        await service.user.get("/1", headers={"Accept-Language": "en"})
+        await service.user.get("/1", headers={"Accept-Language": "fr"})
+
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_split_by_cookies_and_auth(make_service, calls):
+    service = make_service(
+        users(),
+        lambda request: httpx.Response(
+            200,
+            json={"cookie": request.headers.get("cookie")},
+            headers={"Cache-Control": "max-age=60"},
+        ),
+        cache=MemoryCache(),
+    )
+
+    async with service:
+        alice = await service.user.get("/me", cookies={"session": "alice"})
+        bob = await service.user.get("/me", cookies={"session": "bob"})
+        await service.user.get("/me", cookies={"session": "alice"})
+        service.user.config = service.user.config.merge(
+            ArrestConfig(auth=httpx.BasicAuth("alice", "secret"))
+        )
+        await service.user.get("/me", cookies={"session": "alice"})
+
+    assert alice.data == {"cookie": "session=alice"}
+    assert bob.data == {"cookie": "session=bob"}
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_split_by_decode(make_service, calls):
+    service = make_service(
+        users(),
+        lambda request: httpx.Response(
+            200, json={"id": 1}, headers={"Cache-Control": "max-age=60"}
+        ),
+        cache=MemoryCache(),
+    )
+
+    async with service:
+        raw = await service.user.get("/me", decode=False)
+        decoded = await service.user.get("/me")
+        cached = await service.user.get("/me")
+
+    assert raw.data is None
+    assert decoded.data == cached.data == {"id": 1}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_error_after_revalidation_still_raises(make_service, calls):
+    statuses = iter([200, 500])
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={}, headers={"ETag": '"v1"'})
+
+    cache = MemoryCache()
+    service = make_service(users(), responder, cache=cache)
+
+    async with service:
+        await service.user.get("/1", raise_for_status=True)
+        with pytest.raises(ArrestHTTPException) as exc:
+            await service.user.get("/1", raise_for_status=True)
+
+    assert exc.value.status_code == 500
+    assert not cache._entries
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_bounded(make_service, calls):
+    cache = MemoryCache(max_entries=2)
+    service = make_service(
+        users(),
+        lambda request: httpx.Response(
+            200, json={}, headers={"Cache-Control": "max-age=60"}
+        ),
+        cache=cache,
+    )
+
+    async with service:
+        for user_id in (1, 2, 1, 3):
+            await service.user.get(f"/{user_id}")
+        await service.user.get("/1")
+        await service.user.get("/2")
+
+    assert len(cache._entries) == 2
+    assert [request.url.path for request in calls] == [
+        "/user/1",
+        "/user/2",
+        "/user/3",
+        "/user/2",
+    ]
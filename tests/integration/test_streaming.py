@@ -0,0 +1,178 @@
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from arrest import Resource
+from arrest.exceptions import ArrestHTTPException, RequestError
+
+
+class Record(BaseModel):
+    id: int
+
+
+class ChunkStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+def export_resources() -> list[Resource]:
+    return [
+        Resource(
+            route="/export",
+            handlers=[
+                ("GET", "/records", None, list[Record]),
+                ("GET", "/events"),
+                ("POST", "/raw"),
+            ],
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_bytes_lazily(make_service):
+    stream = ChunkStream([b"abc", b"def", b"ghi"])
+    service = make_service(
+        export_resources(), lambda request: httpx.Response(200, stream=stream)
+    )
+
+    async with service:
+        async with service.export.stream("POST", "/raw") as response:
+            assert response.status_code == 200
+            assert stream.sent == 0
+
+            chunks = []
+            async for chunk in response.iter_bytes():
+                chunks.append(chunk)
+                assert stream.sent == len(chunks)
+
+    assert chunks == [b"abc", b"def", b"ghi"]
+
+
+@pytest.mark.asyncio
+async def test_stream_ndjson_records(make_service):
+    stream = ChunkStream([b'{"id": 1}\n{"id"', b": 2}\n\n", b'{"id": 3}'])
+    service = make_service(
+        export_resources(), lambda request: httpx.Response(200, stream=stream)
+    )
+
+    async with service:
+        async with service.export.stream("GET", "/records") as response:
+            records = [record async for record in response.iter_records()]
+
+    assert records == [Record(id=1), Record(id=2), Record(id=3)]
+
+
+@pytest.mark.asyncio
+async def test_stream_json_array_items(make_service):
+    stream = ChunkStream([b'[{"id": 1}, {"i', b'd": 2},', b' {"id": 3}]'])
+    service = make_service(
+        export_resources(), lambda request: httpx.Response(200, stream=stream)
+    )
+
+    async with service:
+        async with service.export.stream("GET", "/records") as response:
+            records = [record async for record in response.iter_items()]
+        async with service.export.stream("GET", "/events") as response:
+            untyped = [record async for record in response.iter_items()]
+
+    assert records == [Record(id=1), Record(id=2), Record(id=3)]
+    assert untyped == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.asyncio
+async def test_stream_untyped_lines_and_records(make_service):
+    service = make_service(
+        export_resources(),
+        lambda request: httpx.Response(200, content=b'{"a": 1}\r\n{"b": 2}\n'),
+    )
+
+    async with service:
+        async with service.export.stream("GET", "/events") as response:
+            lines = [line async for line in response.iter_lines()]
+        async with service.export.stream("GET", "/events") as response:
+            records = [record async for record in response.iter_records()]
+
+    assert lines == ['{"a": 1}', '{"b": 2}']
+    assert records == [{"a": 1}, {"b": 2}]
+
+
+@pytest.mark.asyncio
+async def test_stream_server_sent_events(make_service):
+    body = (
+        b": keep-alive\n\n"
+        b'event: update\ndata: {"id": 1}\nid: 1\n\n'
+        b"data: first line\ndata:second line\nretry: 3000\n\n"
+        b"data: incomplete"
+    )
+    stream = ChunkStream([body[:20], body[20:45], body[45:]])
+    service = make_service(
+        export_resources(),
+        lambda request: httpx.Response(
+            200, stream=stream, headers={"content-type": "text/event-stream"}
+        ),
+    )
+
+    async with service:
+        async with service.export.stream("GET", "/events") as response:
+            events = [event async for event in response.iter_events()]
+
+    assert [(event.event, event.data, event.id) for event in events] == [
+        ("update", '{"id": 1}', "1"),
+        ("message", "first line\nsecond line", "1"),
+    ]
+    assert events[0].json() == {"id": 1}
+    assert events[1].retry == 3000
+
+
+@pytest.mark.asyncio
+async def test_stream_raise_for_status(make_service):
+    service = make_service(
+        export_resources(),
+        lambda request: httpx.Response(404, json={"detail": "not found"}),
+    )
+
+    async with service:
+        with pytest.raises(ArrestHTTPException) as exc:
+            async with service.export.stream("GET", "/events", raise_for_status=True):
+                pass  # pragma: no cover
+
+        async with service.export.stream("GET", "/events") as response:
+            assert response.status_code == 404
+
+    assert exc.value.data == {"detail": "not found"}
+
+
+@pytest.mark.asyncio
+async def test_stream_transport_error(make_service):
+    def responder(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused")
+
+    service = make_service(export_resources(), responder)
+
+    async with service:
+        with pytest.raises(RequestError):
+            async with service.export.stream("GET", "/events"):
+                pass  # pragma: no cover
+
+
+@pytest.mark.asyncio
+async def test_stream_deadline(make_service):
+    timeouts = []
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, content=b"ok")
+
+    service = make_service(export_resources(), responder)
+
+    async with service:
+        async with service.export.stream("POST", "/raw", deadline=5) as response:
+            assert [chunk async for chunk in response.iter_bytes()] == [b"ok"]
+
+    assert 0 < timeouts[0]["read"] <= 5
@@ -207,3 +207,41 @@ def test_build_handlers_none_path_item():
     gen = OpenAPIGenerator(url="https://example.com/openapi.json", output_path="/tmp")
     result = gen._build_handlers(route="/users", path_item=None)
     assert result == []
+
+
+def test_generate_resources_operation_names():
+    generator = OpenAPIGenerator(url=MagicMock(), output_path=MagicMock())
+
+    openapi = OpenAPI(
+        info=Info(title="api", version="0.1"),
+        paths={
+            "/user/{userId}": PathItem(
+                get=Operation(operationId="getUserById"),
+                put=Operation(operationId="update-user"),
+                delete=Operation(operationId="delete"),  # Resource.delete
+                post=Operation(operationId="route"),  # set by Resource.__init__
+            ),
+            "/user/items": PathItem(
+                get=Operation(operationId="listItems"),
+                post=Operation(operationId="listItems"),
+                patch=Operation(operationId="class"),
+                head=Operation(),
+            ),
+        },
+    )
+
+    (resource,) = generator._build_arrest_resources(openapi=openapi)
+    names = {
+        (handler.method, handler.route): handler.name for handler in resource.handlers
+    }
+
+    assert names == {
+        ("GET", "/{userId}"): "get_user_by_id",
+        ("PUT", "/{userId}"): "update_user",
+        ("DELETE", "/{userId}"): None,
+        ("POST", "/{userId}"): None,
+        ("GET", "/items"): None,
+        ("POST", "/items"): None,
+        ("PATCH", "/items"): None,
+        ("HEAD", "/items"): None,
+    }
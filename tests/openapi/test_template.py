@@ -104,3 +104,37 @@ def test_root_resource_template():
             "    ]\n"
             ")\n"
         )
+
+
+def test_resource_template_named_handlers():
+    resource = ResourceSchema(
+        name="user",
+        route="/user",
+        handlers=[
+            HandlerSchema(
+                method="GET", route="/{userId}", response="User", name="get_user"
+            ),
+            HandlerSchema(method="GET", route="/"),
+        ],
+    )
+
+    with TemporaryDirectory() as tmpdir:
+        content = ResourceTemplate(
+            schema_module="models",
+            resources=[resource],
+            destination_path=Path(tmpdir),
+        ).render()
+
+        assert content == (
+            "from arrest import H, Resource\n"
+            "from .models import User\n"
+            "\n"
+            "user = Resource(\n"
+            '    name="user",\n'
+            '    route="/user",\n'
+            "    handlers=[\n"
+            '        H("GET", "/{userId}", None, User, name="get_user"),\n'
+            '        ("GET", "/", None, None),\n'
+            "    ]\n"
+            ")\n"
+        )
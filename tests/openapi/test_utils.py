@@ -3,7 +3,7 @@ from typing import Any
 import pytest
 
 from arrest.openapi.spec import Reference
-from arrest.openapi.utils import get_ref_schema
+from arrest.openapi.utils import get_ref_schema, to_snake
 from arrest.utils import sanitize_name
 
 
@@ -26,3 +26,17 @@ def test_get_ref_schema(ref: Any, expected_name: str):
 )
 def test_sanitize_name(name: str, sanitized: str):
     assert sanitize_name(name) == sanitized
+
+
+@pytest.mark.parametrize(
+    "name, snake",
+    [
+        ("getPetById", "get_pet_by_id"),
+        ("GetPetById", "get_pet_by_id"),
+        ("getHTTPStatus", "get_http_status"),
+        ("create-user", "create_user"),
+        ("list_users", "list_users"),
+    ],
+)
+def test_to_snake(name: str, snake: str):
+    assert to_snake(name) == snake
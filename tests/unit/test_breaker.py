@@ -0,0 +1,203 @@
+import asyncio
+
+import httpx
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from arrest import Resource
+from arrest.breaker import CircuitBreaker, CircuitState
+from arrest.exceptions import ArrestHTTPException, CircuitOpenError, RequestError
+from arrest.handler import HandlerKey
+from arrest.http import Methods
+
+USER_KEY = HandlerKey(Methods.GET, "/user/{id}")
+
+
+class User(BaseModel):
+    id: int
+
+
+def user_resources(response=None) -> list[Resource]:
+    return [Resource(route="/user", handlers=[("GET", "/{id}", None, response)])]
+
+
+def responder(outcomes: list):
+    async def respond(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.001)
+        outcome = outcomes.pop(0) if outcomes else 200
+        if outcome == "down":
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(outcome, json={})
+
+    return respond
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_consecutive_failures(make_service, calls):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    service = make_service(
+        user_resources(),
+        responder(["down", 500, 200, "down", 503, "down"]),
+        circuit_breaker=breaker,
+    )
+
+    async with service:
+        for _ in range(6):
+            try:
+                await service.user.get("/1")
+            except RequestError:
+                pass
+        assert breaker.state(USER_KEY) == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError) as exc:
+            await service.user.get("/2")
+
+    assert len(calls) == 6
+    assert exc.value.key == USER_KEY
+    assert 0 < exc.value.retry_after <= 60
+    assert breaker.states() == {
+        USER_KEY: CircuitState.OPEN,
+    }
+    assert breaker.state(HandlerKey(Methods.GET, "/user")) == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_server_errors_raised_for_status_open_circuit(make_service, calls):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    service = make_service(
+        user_resources(),
+        responder([500, 502, 503]),
+        circuit_breaker=breaker,
+        raise_for_status=True,
+    )
+
+    async with service:
+        for _ in range(3):
+            with pytest.raises(ArrestHTTPException):
+                await service.user.get("/1")
+
+        assert breaker.state(USER_KEY) == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await service.user.get("/1")
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_server_errors_with_invalid_bodies_open_circuit(make_service, calls):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    service = make_service(
+        user_resources(User), responder([500, 500, 500]), circuit_breaker=breaker
+    )
+
+    async with service:
+        for _ in range(3):
+            # the error body `{}` is not a `User`
+            with pytest.raises(ValidationError):
+                await service.user.get("/1")
+
+        assert breaker.state(USER_KEY) == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await service.user.get("/1")
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_calls_record_one_outcome(make_service, calls):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    service = make_service(
+        user_resources(), responder([500]), circuit_breaker=breaker, coalesce=True
+    )
+
+    async with service:
+        responses = await asyncio.gather(*(service.user.get("/1") for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(resp.status_code == 500 for resp in responses)
+    assert breaker.state(USER_KEY) == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_on_failure_rate(make_service):
+    breaker = CircuitBreaker(failure_threshold=None, failure_rate=0.5, window=4)
+    service = make_service(
+        user_resources(), responder([500, 200, 500, 200]), circuit_breaker=breaker
+    )
+
+    async with service:
+        for _ in range(3):
+            await service.user.get("/1")
+        assert breaker.state(USER_KEY) == CircuitState.CLOSED
+        await service.user.get("/1")
+
+    assert breaker.state(USER_KEY) == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_circuit_half_open_trial(make_service, calls):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    service = make_service(
+        user_resources(), responder([500, 500, 200]), circuit_breaker=breaker
+    )
+
+    async with service:
+        with pytest.raises(ArrestHTTPException):
+            await service.user.get("/1", raise_for_status=True)
+        assert breaker.state(USER_KEY) == CircuitState.OPEN
+
+        await asyncio.sleep(0.02)
+        assert breaker.state(USER_KEY) == CircuitState.HALF_OPEN
+        await service.user.get("/1")  # failed trial
+        assert breaker.state(USER_KEY) == CircuitState.OPEN
+
+        await asyncio.sleep(0.02)
+        await service.user.get("/1")  # successful trial
+
+    assert breaker.state(USER_KEY) == CircuitState.CLOSED
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_circuit_half_open_limits_trials(make_service):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    service = make_service(
+        user_resources(), responder(["down"]), circuit_breaker=breaker
+    )
+
+    async with service:
+        with pytest.raises(RequestError):
+            await service.user.get("/1")
+        await asyncio.sleep(0.02)
+
+        results = await asyncio.gather(
+            service.user.get("/1"), service.user.get("/1"), return_exceptions=True
+        )
+
+    assert results[0].status_code == 200
+    assert isinstance(results[1], CircuitOpenError)
+    assert breaker.state(USER_KEY) == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_circuit(make_service):
+    breaker = CircuitBreaker(failure_threshold=1)
+    service = make_service(
+        user_resources(), responder([404, 422]), circuit_breaker=breaker
+    )
+
+    async with service:
+        await service.user.get("/1")
+        with pytest.raises(ArrestHTTPException):
+            await service.user.get("/1", raise_for_status=True)
+
+    assert breaker.state(USER_KEY) == CircuitState.CLOSED
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"failure_threshold": None}, {"failure_rate": 0}, {"failure_rate": 1.5}],
+)
+def test_circuit_breaker_invalid(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
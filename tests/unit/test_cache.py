@@ -0,0 +1,94 @@
+import time
+
+import httpx
+import pytest
+
+from arrest.cache import CacheEntry, _expires_at, parse_cache_control
+from arrest.response import Response
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, {}),
+        ("", {}),
+        ("max-age=60", {"max-age": "60"}),
+        (
+            'Public, Max-Age="30", no-cache',
+            {"public": None, "max-age": "30", "no-cache": None},
+        ),
+    ],
+)
+def test_parse_cache_control(value, expected):
+    assert parse_cache_control(value) == expected
+
+
+@pytest.mark.parametrize(
+    "headers, ttl",
+    [
+        ({"cache-control": "max-age=60"}, 60),
+        ({"cache-control": "max-age=60", "age": "20"}, 40),
+        (
+            {
+                "date": "Wed, 21 Oct 2015 07:28:00 GMT",
+                "expires": "Wed, 21 Oct 2015 07:29:00 GMT",
+            },
+            60,
+        ),
+        ({"cache-control": "max-age=60, no-cache"}, None),
+        ({"cache-control": "max-age=abc"}, None),
+        ({"cache-control": "max-age=0"}, None),
+        ({"expires": "Wed, 21 Oct 2015 07:29:00 GMT"}, None),
+    ],
+)
+def test_expires_at(headers, ttl):
+    headers = httpx.Headers(headers)
+    expires_at = _expires_at(headers, parse_cache_control(headers.get("cache-control")))
+    if ttl is None:
+        assert expires_at is None
+    else:
+        assert expires_at == pytest.approx(time.monotonic() + ttl, abs=1)
+
+
+def make_response(status_code: int = 200, **headers: str) -> Response:
+    raw = httpx.Response(
+        status_code,
+        content=b"{}",
+        headers={name.replace("_", "-"): value for name, value in headers.items()},
+    )
+    return Response(
+        data={},
+        status_code=status_code,
+        url=httpx.URL("http://example.com"),
+        elapsed=None,
+        raw=raw,
+        request=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        make_response(404, cache_control="max-age=60"),
+        make_response(cache_control="no-store, max-age=60"),
+        make_response(cache_control="max-age=60", vary="*"),
+        make_response(),
+    ],
+)
+def test_cache_entry_not_stored(response):
+    assert CacheEntry.from_response(response, httpx.Headers()) is None
+
+
+def test_cache_entry_revalidated():
+    response = make_response(etag='"v1"', cache_control="no-cache")
+    entry = CacheEntry.from_response(response, httpx.Headers())
+    assert not entry.is_fresh()
+
+    headers = httpx.Headers()
+    entry.add_validators(headers)
+    assert headers["if-none-match"] == '"v1"'
+
+    refreshed = entry.revalidated(httpx.Headers({"cache-control": "max-age=60"}))
+    assert refreshed.is_fresh()
+    assert refreshed.response is response
+    assert refreshed.etag == '"v1"'
@@ -8,10 +8,10 @@ from arrest.converters import (
     Converter,
     FloatConverter,
     IntegerConverter,
+    PathFormatter,
     StrConverter,
     UUIDConverter,
     add_converter,
-    replace_params,
 )
 from arrest.exceptions import ConversionError
 
@@ -98,7 +98,7 @@ class DatetimeConverter(Converter[datetime]):
         ),
     ],
 )
-def test_converters_convert_and_replace_params(
+def test_converters_convert_and_format_path(
     path: str,
     path_params: dict,
     param_types: dict,
@@ -108,9 +108,7 @@ def test_converters_convert_and_replace_params(
     add_converter(DatetimeConverter(), "datetime")
 
     with exception:
-        ret, _ = replace_params(
-            path=path, path_params=path_params, param_types=param_types
-        )
+        ret = PathFormatter(path, param_types or {}).format(path_params)
         assert ret == returned_path
 
 
@@ -141,7 +139,7 @@ def test_converters_convert_and_replace_params(
 )
 def test_converters_type_error(path, path_params, param_types):
     with pytest.raises(ConversionError):
-        replace_params(path=path, path_params=path_params, param_types=param_types)
+        PathFormatter(path, param_types).format(path_params)
 
 
 @pytest.mark.parametrize(
@@ -165,3 +163,41 @@ def test_compile_path_invalid_converter():
 
     with pytest.raises(AssertionError):
         compile_path("/users/{id:unknown}")
+
+
+def test_path_formatter():
+    from arrest.converters import PathFormatter
+
+    formatter = PathFormatter(
+        "/posts/{post_id}/comments/{comment_id}/",
+        {"post_id": IntegerConverter(), "comment_id": StrConverter()},
+    )
+
+    assert formatter.format({"post_id": "12", "comment_id": 34}) == (
+        "/posts/12/comments/34/"
+    )
+    with pytest.raises(ConversionError):
+        formatter.format({"post_id": "abc", "comment_id": 34})
+    with pytest.raises(KeyError):
+        formatter.format({"post_id": 12})
+
+
+@pytest.mark.parametrize(
+    "prefix, path, url, template",
+    [
+        ("/users", "/{user_id:int}", "/users/12", "/users/{user_id:int}"),
+        ("/users", "/{user_id:int}/", "/users/12/", "/users/{user_id:int}/"),
+        ("/users/", "{user_id:int}", "/users/12", "/users/{user_id:int}"),
+        ("", "/{user_id:int}", "12", "{user_id:int}"),
+    ],
+)
+def test_path_formatter_prefix(prefix, path, url, template):
+    from arrest.converters import PathFormatter
+    from arrest.utils import join_url
+
+    formatter = PathFormatter(path, {"user_id": IntegerConverter()}, prefix=prefix)
+
+    # same urls as joining the formatted path to the prefix at request time
+    assert formatter.format({"user_id": 12}) == url
+    assert formatter.template == template == join_url(prefix, path)
+    assert formatter.join("/12") == join_url(prefix, "/12")
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from arrest import Resource
+from arrest.deadline import deadline, remaining
+from arrest.exceptions import ArrestHTTPException, DeadlineExceeded, RequestError
+from arrest.retry import RetryPolicy
+
+
+def user_resources(callback=None) -> list[Resource]:
+    return [
+        Resource(
+            route="/user",
+            handlers=[("GET", "/"), ("GET", "/{id}", None, None, callback)],
+        )
+    ]
+
+
+def test_deadline_nesting():
+    assert remaining() is None
+
+    with deadline(1):
+        outer = remaining()
+        assert 0 < outer <= 1
+        with deadline(10):
+            assert remaining() <= outer
+        with deadline(None):
+            assert remaining() <= outer
+        with deadline(0.1):
+            assert remaining() <= 0.1
+
+    assert remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_slow_request(make_service):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200)
+
+    service = make_service(user_resources(), handler)
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        await service.user.get("/", deadline=0.05)
+    assert time.monotonic() - start < 0.5
+    assert issubclass(DeadlineExceeded, RequestError)
+
+
+@pytest.mark.asyncio
+async def test_deadline_shrinks_attempt_timeout(make_service):
+    timeouts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200)
+
+    service = make_service(user_resources(), handler, timeout=30, deadline=2)
+
+    await service.user.get("/")
+    await service.user.get("/", timeout=1)
+    await service.user.get("/", deadline=None)
+
+    assert 1.5 < timeouts[0] <= 2
+    assert timeouts[1] == 1
+    assert 1.5 < timeouts[2] <= 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_stops_retries(make_service, calls):
+    service = make_service(
+        user_resources(),
+        lambda request: httpx.Response(503),
+        retry=RetryPolicy(attempts=5, backoff=0.2, jitter=False),
+        raise_for_status=True,
+    )
+
+    with pytest.raises(ArrestHTTPException):
+        await service.user.get("/", deadline=0.1)
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_is_inherited_by_callbacks(make_service):
+    left = []
+
+    async def callback(response):
+        left.append(remaining())
+        await service.user.get("/")
+        return response
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        left.append(remaining())
+        return httpx.Response(200)
+
+    service = make_service(user_resources(callback), handler)
+
+    with deadline(5):
+        await service.user.get("/1", deadline=1)
+
+    assert len(left) == 3
+    assert all(0 < value <= 1 for value in left)
+    assert remaining() is None
@@ -0,0 +1,160 @@
+import asyncio
+import gc
+import time
+
+import httpx
+import pytest
+
+from arrest import Resource
+from arrest.handler import HandlerKey
+from arrest.hedging import HedgePolicy
+from arrest.http import Methods
+
+
+def user_resources() -> list[Resource]:
+    return [Resource(route="/user", handlers=[("GET", "/"), ("POST", "/")])]
+
+
+def responder(delays: list[float], cancelled: list[int] | None = None):
+    sent = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        idx, sent = sent, sent + 1
+        try:
+            await asyncio.sleep(delays[idx] if idx < len(delays) else 0)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(idx)
+            raise
+        return httpx.Response(200, json={"call": idx})
+
+    return respond
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_wins_over_slow_one(make_service, calls):
+    cancelled: list[int] = []
+    service = make_service(
+        user_resources(),
+        responder([1, 0], cancelled),
+        hedge=HedgePolicy(percentile=None, delay=0.02, max_ratio=1),
+    )
+
+    async with service:
+        start = time.monotonic()
+        response = await service.user.get("/")
+        elapsed = time.monotonic() - start
+        await asyncio.sleep(0)
+
+    assert response.data == {"call": 1}
+    assert elapsed < 0.5
+    assert len(calls) == 2
+    assert cancelled == [0]
+
+
+@pytest.mark.asyncio
+async def test_hedging_skips_fast_and_unsafe_requests(make_service, calls):
+    service = make_service(
+        user_resources(),
+        responder([0, 0.05]),
+        hedge=HedgePolicy(percentile=None, delay=0.02, max_ratio=1),
+    )
+
+    async with service:
+        await service.user.get("/")
+        response = await service.user.post("/")
+
+    assert response.data == {"call": 1}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_hedging_budget(make_service, calls):
+    service = make_service(
+        user_resources(),
+        responder([0.05] * 10),
+        hedge=HedgePolicy(percentile=None, delay=0.01, max_ratio=0.5),
+    )
+
+    async with service:
+        await service.user.get("/")  # half a token, not hedged
+        assert len(calls) == 1
+        await service.user.get("/")  # hedged
+        assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_from_percentile(make_service, calls):
+    hedge = HedgePolicy(percentile=0.5, min_samples=5)
+    key = HandlerKey(Methods.GET, "/user/")
+    service = make_service(
+        user_resources(), responder([0.001, 0.002, 0.003, 0.004, 0.02]), hedge=hedge
+    )
+
+    async with service:
+        for _ in range(4):
+            await service.user.get("/")
+        assert hedge.hedge_delay(key) is None
+        await service.user.get("/")
+
+    assert 0.002 <= hedge.hedge_delay(key) < 0.01
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_hedge_failure_waits_for_other_request():
+    policy = HedgePolicy(percentile=None, delay=0.01, max_ratio=1)
+    attempts = 0
+
+    async def call() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(0.02)
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.03)
+        return "ok"
+
+    assert await policy.call("key", call) == "ok"
+
+    async def fail() -> str:
+        await asyncio.sleep(0.02)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await policy.call("other", fail)
+
+
+@pytest.mark.asyncio
+async def test_hedge_loser_exception_retrieved():
+    loop = asyncio.get_running_loop()
+    errors: list[dict] = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    policy = HedgePolicy(percentile=None, delay=0.01, max_ratio=1)
+    attempts = 0
+
+    async def call() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                # the losing request fails while it is being cancelled
+                raise RuntimeError("boom") from None
+        return "ok"
+
+    assert await policy.call("key", call) == "ok"
+    await asyncio.sleep(0)
+    gc.collect()
+    assert errors == []
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"percentile": None}, {"percentile": 1}, {"max_ratio": 0}],
+)
+def test_hedge_policy_invalid(kwargs):
+    with pytest.raises(ValueError):
+        HedgePolicy(**kwargs)
@@ -270,3 +270,70 @@ def test_client_instance_identity(svc_client, res_client, expected):
         expected_client = clients[expected]
         assert merged_client is expected_client
         assert merged_client is expected_client  # same object, not a copy
+
+
+def test_arrest_config_client_args_excludes_request_fields():
+    """client_args() keeps only fields fixed at httpx.AsyncClient construction."""
+    from arrest._config import ArrestConfig
+
+    limits = httpx.Limits(max_connections=10)
+    cfg = ArrestConfig(
+        headers={"x": "1"},
+        cookies={"c": "2"},
+        timeout=30.0,
+        follow_redirects=False,
+        max_retries=2,
+        verify=False,
+        limits=limits,
+    )
+    assert cfg.client_args() == {"verify": False, "limits": limits}
+
+
+def test_arrest_config_overlay():
+    """overlay() layers per-call fields and copies nothing without overrides."""
+    from arrest._config import ArrestConfig
+    from arrest._pool import client_key
+
+    cfg = ArrestConfig(headers={"x": "1"}, timeout=5.0, verify=False)
+    assert cfg.overlay(headers=None, cookies={}, timeout=None) is cfg
+
+    key = client_key(cfg)
+    call_cfg = cfg.overlay(headers={"y": "2"}, timeout=1.0, raise_for_status=False)
+    assert call_cfg.headers == {"x": "1", "y": "2"}
+    assert call_cfg.timeout == 1.0
+    assert call_cfg.raise_for_status is False
+    assert call_cfg.verify is False
+    assert cfg.headers == {"x": "1"} and cfg.timeout == 5.0
+    assert client_key(call_cfg) is key
+
+    with pytest.raises(TypeError):
+        cfg.overlay(verify=True)
+
+
+@pytest.mark.asyncio
+async def test_handler_config_merged_once():
+    """the service → resource → handler config is merged once per handler"""
+    from arrest._config import ArrestConfig
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=dict(request.headers))
+
+    svc = Service(
+        name="test",
+        url="http://example.com",
+        config=ArrestConfig(
+            headers={"x-service": "1"}, transport=httpx.MockTransport(handler)
+        ),
+        resources=[Resource(route="/abc", handlers=[("GET", "/")])],
+    )
+    h = svc.abc.routes[next(iter(svc.abc.routes))]
+
+    base = svc.abc._handler_config(h)
+    assert svc.abc._handler_config(h) is base
+
+    response = await svc.abc.get("/", headers={"x-call": "2"})
+    assert response.data["x-call"] == "2"
+    assert base.headers == {"x-service": "1"}
+
+    svc.abc.config = ArrestConfig(headers={"x-resource": "3"})
+    assert svc.abc._handler_config(h).headers == {"x-resource": "3"}
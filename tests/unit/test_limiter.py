@@ -0,0 +1,109 @@
+import asyncio
+
+import httpx
+import pytest
+
+from arrest import Resource
+from arrest.exceptions import RequestError
+from arrest.limiter import AdaptiveLimit
+from tests import TEST_DEFAULT_SERVICE_URL
+
+
+async def hold(limiter: AdaptiveLimit, delay: float, dropped: bool = False) -> None:
+    async with limiter.limit("http://a") as sample:
+        await asyncio.sleep(delay)
+        sample.dropped = dropped
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_queues_over_limit():
+    limiter = AdaptiveLimit(initial_limit=2, max_limit=2)
+
+    tasks = [asyncio.ensure_future(hold(limiter, 0.02)) for _ in range(5)]
+    await asyncio.sleep(0.005)
+
+    stats = limiter.stats()["http://a"]
+    assert (stats.limit, stats.in_flight, stats.queued) == (2, 2, 3)
+
+    await asyncio.gather(*tasks)
+    stats = limiter.stats()["http://a"]
+    assert (stats.in_flight, stats.queued) == (0, 0)
+    assert stats.queue_delay > 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_grows_while_latency_is_flat():
+    limiter = AdaptiveLimit(initial_limit=4)
+
+    for _ in range(10):
+        await asyncio.gather(*(hold(limiter, 0.001) for _ in range(4)))
+
+    assert limiter.stats()["http://a"].limit > 4
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_backs_off():
+    limiter = AdaptiveLimit(initial_limit=10, backoff=0.5)
+
+    await hold(limiter, 0.001)
+    await hold(limiter, 0.05)  # latency rose
+    assert limiter.stats()["http://a"].limit == 5
+
+    await hold(limiter, 0.001, dropped=True)
+    assert limiter.stats()["http://a"].limit == 2
+
+    with pytest.raises(RuntimeError):
+        async with limiter.limit("http://a"):
+            raise RuntimeError
+    assert limiter.stats()["http://a"].limit == 1
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_cancelled_waiter():
+    limiter = AdaptiveLimit(initial_limit=1, max_limit=1)
+
+    first = asyncio.ensure_future(hold(limiter, 0.02))
+    second = asyncio.ensure_future(hold(limiter, 0))
+    await asyncio.sleep(0.005)
+    second.cancel()
+    await first
+
+    stats = limiter.stats()["http://a"]
+    assert (stats.in_flight, stats.queued) == (0, 0)
+    await asyncio.wait_for(hold(limiter, 0), 0.1)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"initial_limit": 0}, {"min_limit": 5, "initial_limit": 2}, {"backoff": 1}],
+)
+def test_adaptive_limit_invalid(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveLimit(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_on_requests(make_service):
+    statuses = iter([200, 503])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/user/down":
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(next(statuses), json={})
+
+    limiter = AdaptiveLimit(initial_limit=8, backoff=0.5)
+    service = make_service(
+        [Resource(route="/user", handlers=[("GET", "/{id}")])],
+        handler,
+        adaptive_limit=limiter,
+    )
+
+    async with service:
+        await service.user.get("/1")
+        await service.user.get("/2")  # 503
+        with pytest.raises(RequestError):
+            await service.user.get("/down")
+
+    stats = limiter.stats()[TEST_DEFAULT_SERVICE_URL]
+    assert stats.limit == 2
+    assert stats.in_flight == 0
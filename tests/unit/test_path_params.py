@@ -242,3 +242,161 @@ def test_path_params_fstrings_multiple_handlers(
         assert result[0].route == expected_handler_route
     else:
         assert result is expected_handler_route
+
+
+def test_matching_handler_first_bound_wins(service):
+    service.add_resource(
+        Resource(
+            route="/user",
+            handlers=[
+                (Methods.GET, "/posts/{slug}"),
+                (Methods.GET, "/posts/latest"),
+                (Methods.GET, "/posts/{post_id:int}/comments"),
+            ],
+        )
+    )
+
+    handler, parsed_path = service.user.get_matching_handler(
+        method="GET", path="/posts/latest"
+    )
+    assert handler.route == "/posts/{slug}"
+    assert parsed_path == f"{base_url}/posts/latest"
+
+    handler, _ = service.user.get_matching_handler(
+        method="GET", path="/posts/123/comments"
+    )
+    assert handler.route == "/posts/{post_id:int}/comments"
+
+
+def test_matching_handler_only_checks_candidates(service, mocker):
+    handlers = [(Methods.GET, f"/items{idx}/{{item_id:int}}") for idx in range(50)]
+    handlers.append((Methods.GET, "/items/{item_id:int}"))
+    service.add_resource(Resource(route="/user", handlers=handlers))
+
+    from arrest.handler import ResourceHandler
+
+    spy = mocker.spy(ResourceHandler, "_parse_path")
+    handler, parsed_path = service.user.get_matching_handler(
+        method="GET", path="/items/42"
+    )
+
+    assert handler.route == "/items/{item_id:int}"
+    assert parsed_path == f"{base_url}/items/42"
+    assert spy.call_count == 1
+
+
+def test_matching_handler_kwargs_only_checks_candidates(service, mocker):
+    handlers = [(Methods.GET, f"/items{idx}/{{item_id:int}}") for idx in range(50)]
+    service.add_resource(Resource(route="/user", handlers=handlers))
+
+    from arrest.handler import ResourceHandler
+
+    spy = mocker.spy(ResourceHandler, "_parse_path")
+    for path in ("/items49/{item_id}", "/items49", "/items49/"):
+        handler, parsed_path = service.user.get_matching_handler(
+            method="GET", path=path, item_id=42
+        )
+        assert handler.route == "/items49/{item_id:int}"
+        assert parsed_path == f"{base_url}/items49/42"
+
+    assert spy.call_count == 3
+
+
+def test_matching_handler_custom_converter(service):
+    from arrest.converters import CONVERTER_REGEX, Converter, add_converter
+
+    class PathConverter(Converter[str]):
+        regex = ".+"
+
+        def to_str(self, value: Any) -> str:
+            return str(value)
+
+    add_converter(PathConverter(), "path")
+    try:
+        service.add_resource(
+            Resource(
+                route="/user",
+                handlers=[(Methods.GET, "/files/{file_path:path}")],
+            )
+        )
+        handler, parsed_path = service.user.get_matching_handler(
+            method="GET", path="/files/a/b/c.txt"
+        )
+    finally:
+        CONVERTER_REGEX.pop("path")
+
+    assert handler.route == "/files/{file_path:path}"
+    assert parsed_path == f"{base_url}/files/a/b/c.txt"
+
+
+def test_rebinding_handler_replaces_route(service):
+    resource = Resource(
+        route="/user",
+        handlers=[
+            (Methods.GET, "/posts/{post_id:int}"),
+            (Methods.GET, "/posts/{post_id:uuid}"),
+        ],
+    )
+    service.add_resource(resource)
+
+    assert service.user.get_matching_handler(method="GET", path="/posts/123") is None
+    handler, _ = service.user.get_matching_handler(
+        method="GET", path=f"/posts/{dummy_uuid}"
+    )
+    assert handler.route == "/posts/{post_id:uuid}"
+
+
+def test_handler_shared_between_resources():
+    from arrest import H
+
+    handler = H(Methods.GET, "/{id:int}", name="get_one")
+    users = Resource(route="/users", handlers=[handler])
+    posts = Resource(route="/posts", handlers=[handler])
+
+    assert users.get_matching_handler(method="GET", path="/1") == (handler, "/users/1")
+    assert posts.get_matching_handler(method="GET", path="/1") == (handler, "/posts/1")
+    assert users.get_matching_handler(method="GET", path="", id=2)[1] == "/users/2"
+    assert repr(users.get_one) == "Operation(get_one: GET /users/{id})"
+    assert handler.parse_path(method=Methods.GET, path="/1") == "/1"
+
+
+@pytest.mark.parametrize(
+    "request_path, kwargs, expected_path",
+    [
+        ("/posts", {"foo": 1, "bar": 2}, f"{base_url}/posts/1/comments/2"),
+        ("/posts/1/comments", {"bar": 2}, f"{base_url}/posts/1/comments/2"),
+        ("/posts/1/comments/", {"bar": 2}, f"{base_url}/posts/1/comments/2"),
+        ("/posts/1", {"foo": 3, "bar": 2}, f"{base_url}/posts/3/comments/2"),
+        ("/posts/1/likes", {"bar": 2}, None),
+        ("/posts", {"bar": 2}, None),
+        # the route template itself, with the params as kwargs
+        (
+            "/posts/{foo}/comments/{bar}",
+            {"foo": 1, "bar": 2},
+            f"{base_url}/posts/1/comments/2",
+        ),
+        (
+            "/posts/{foo:int}/comments/{bar:int}",
+            {"foo": 1, "bar": 2},
+            f"{base_url}/posts/1/comments/2",
+        ),
+        ("/posts/1/comments/{bar}", {"bar": 2}, f"{base_url}/posts/1/comments/2"),
+        ("/posts/{foo}/comments/{bar}", {"bar": 2}, None),
+        ("/posts/{baz}/comments", {"foo": 1, "bar": 2}, None),
+    ],
+)
+def test_path_params_kwargs_partial_path(service, request_path, kwargs, expected_path):
+    service.add_resource(
+        Resource(
+            route="/user",
+            handlers=[(Methods.GET, "/posts/{foo:int}/comments/{bar:int}")],
+        )
+    )
+
+    result = service.user.get_matching_handler(
+        method="GET", path=request_path, **kwargs
+    )
+    if expected_path is None:
+        assert result is None
+    else:
+        assert result[1] == expected_path
@@ -3,7 +3,7 @@ from contextlib import nullcontext as noraise
 
 import pytest
 
-from arrest.converters import compile_path, get_converter
+from arrest.converters import compile_path, compile_path_prefix, get_converter
 
 
 @pytest.mark.parametrize(
@@ -70,3 +70,47 @@ def test_compile_path(
             expected_path_format,
             expected_params,
         )
+
+
+@pytest.mark.parametrize(
+    "path, expected_regex",
+    [
+        ("/posts", "^(?:/posts)?/?$"),
+        (
+            "/posts/{post_id:int}",
+            r"^(?:/posts(?:/(?:\{post_id(?::\w+)?\}|(?P<post_id>[0-9]+)))?)?/?$",
+        ),
+        (
+            "/posts/{post_id:int}/",
+            r"^(?:/posts(?:/(?:\{post_id(?::\w+)?\}|(?P<post_id>[0-9]+))(?:/)?)?)?/?$",
+        ),
+        ("/v{version:int}", r"^(?:/v(?:\{version(?::\w+)?\}|(?P<version>[0-9]+)))?/?$"),
+    ],
+)
+def test_compile_path_prefix(path, expected_regex):
+    assert compile_path_prefix(path) == re.compile(expected_regex)
+
+
+@pytest.mark.parametrize(
+    "path, partial_path, groups",
+    [
+        ("/posts/{foo:int}/comments/{bar:int}", "", {}),
+        ("/posts/{foo:int}/comments/{bar:int}", "/posts/", {}),
+        ("/posts/{foo:int}/comments/{bar:int}", "/posts/123", {"foo": "123"}),
+        (
+            "/posts/{foo:int}/comments/{bar:int}",
+            "/posts/123/comments/456/",
+            {"foo": "123", "bar": "456"},
+        ),
+        ("/posts/{foo:int}/comments/{bar:int}", "/posts/abc", None),
+        ("/posts/{foo:int}/comments/{bar:int}", "/posts/{foo}/comments/{bar:int}", {}),
+        ("/posts/{foo:int}/comments/{bar:int}", "/posts/{bar}", None),
+        ("/posts/{foo:int}/comments/{bar:int}", "/comments/123", None),
+    ],
+)
+def test_compile_path_prefix_match(path, partial_path, groups):
+    match = compile_path_prefix(path).fullmatch(partial_path)
+    if groups is None:
+        assert match is None
+    else:
+        assert {k: v for k, v in match.groupdict().items() if v} == groups
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from arrest import Resource
+from arrest._config import ArrestConfig
+from arrest.handler import H
+from arrest.ratelimit import RateLimit, parse_retry_after
+
+
+def test_rate_limit_burst_then_spaced():
+    limit = RateLimit(rps=10, burst=3)
+
+    delays = [limit.reserve() for _ in range(5)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limit_pause():
+    limit = RateLimit(rps=100, burst=10)
+    limit.pause(2)
+
+    assert limit.reserve() == pytest.approx(2, abs=0.01)
+    assert limit.reserve() == pytest.approx(2.01, abs=0.01)
+
+
+@pytest.mark.parametrize("rps, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_rate_limit_invalid(rps, burst):
+    with pytest.raises(ValueError):
+        RateLimit(rps=rps, burst=burst)
+
+
+def test_parse_retry_after():
+    in_a_minute = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(format_datetime(in_a_minute, usegmt=True)) == (
+        pytest.approx(60, abs=2)
+    )
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_fifo():
+    limit = RateLimit(rps=200)
+    order: list[int] = []
+
+    async def call(idx: int) -> None:
+        await limit.acquire()
+        order.append(idx)
+
+    await asyncio.gather(*(call(idx) for idx in range(10)))
+
+    assert order == list(range(10))
+
+
+def user_resources(limit: RateLimit) -> list[Resource]:
+    return [
+        Resource(
+            route="/user",
+            handlers=[("GET", "/"), H("GET", "/fast", config=ArrestConfig())],
+            config=ArrestConfig(rate_limit=limit),
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_enforced_on_requests(make_service, calls):
+    sent: list[float] = []
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        sent.append(time.monotonic())
+        return httpx.Response(200, json={})
+
+    service = make_service(user_resources(RateLimit(rps=50, burst=2)), responder)
+
+    async with service:
+        start = time.monotonic()
+        await asyncio.gather(*(service.user.get("/") for _ in range(6)))
+        await service.user.get("/fast")  # handler config inherits the limit
+
+    assert len(calls) == 7
+    # 2 at once, then one every 20ms
+    assert sent[-1] - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paused_by_429(make_service):
+    limit = RateLimit(rps=1000)
+    service = make_service(
+        user_resources(limit),
+        lambda request: httpx.Response(429, headers={"Retry-After": "30"}),
+    )
+
+    async with service:
+        response = await service.user.get("/")
+
+    assert response.status_code == 429
+    assert limit.reserve() == pytest.approx(30, abs=0.5)
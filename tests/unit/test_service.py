@@ -73,3 +73,150 @@ async def test_make_request_to_root_resource(mock_httpx, mocker):
     assert root__get.call_count == 3
 
     assert resp1.data == resp2.data == resp3.data == resp4.data == {"status": "OK"}
+
+
+@pytest.mark.asyncio
+async def test_service_reuses_pooled_client():
+    from arrest._config import ArrestConfig
+
+    clients = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": "OK"})
+
+    async def on_request(request: httpx.Request) -> None:
+        clients.update(id(entry.client) for entry in service._pool._clients.values())
+
+    service = Service(
+        name="myservice",
+        url=TEST_DEFAULT_SERVICE_URL,
+        config=ArrestConfig(
+            transport=httpx.MockTransport(handler),
+            limits=httpx.Limits(max_connections=5),
+            event_hooks={"request": [on_request]},
+        ),
+        resources=[
+            Resource(route="/users", handlers=[("GET", "/")]),
+            Resource(route="/posts", handlers=[("GET", "/")]),
+        ],
+    )
+
+    async with service:
+        await service.users.get("/")
+        await service.posts.get("/", headers={"x-abc": "123"}, timeout=10)
+        assert len(service._pool._clients) == 1
+        (entry,) = service._pool._clients.values()
+
+    assert len(clients) == 1
+    assert entry.client.is_closed
+    assert len(service._pool._clients) == 0
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_does_not_keep_response_cookies():
+    from arrest._config import ArrestConfig
+
+    sent_cookies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_cookies.append(request.headers.get("cookie"))
+        if request.url.path == "/login/":
+            return httpx.Response(200, headers={"set-cookie": "session=alice; Path=/"})
+        return httpx.Response(200, json={})
+
+    service = Service(
+        name="myservice",
+        url=TEST_DEFAULT_SERVICE_URL,
+        config=ArrestConfig(
+            transport=httpx.MockTransport(handler), cookies={"tenant": "acme"}
+        ),
+        resources=[
+            Resource(route="/login", handlers=[("POST", "/")]),
+            Resource(route="/users", handlers=[("GET", "/me")]),
+        ],
+    )
+
+    async with service:
+        await service.login.post("/")
+        await service.users.get("/me")
+        await service.users.get("/me", cookies={"session": "bob"})
+
+    assert sent_cookies == ["tenant=acme", "tenant=acme", "tenant=acme; session=bob"]
+
+
+@pytest.mark.asyncio
+async def test_service_aclose_recreates_client(service, mock_httpx):
+    mock_httpx.get("/users/").mock(return_value=httpx.Response(200, json={}))
+    service.add_resource(Resource(route="/users", handlers=[("GET", "/")]))
+
+    await service.users.get("/")
+    (first,) = service._pool._clients.values()
+    await service.aclose()
+
+    await service.users.get("/")
+    (second,) = service._pool._clients.values()
+    assert second.client is not first.client
+    assert first.client.is_closed
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_keyed_by_client_config(service, mock_httpx):
+    from arrest._config import ArrestConfig
+
+    mock_httpx.get("/users/").mock(return_value=httpx.Response(200, json={}))
+    mock_httpx.get("/posts/").mock(return_value=httpx.Response(200, json={}))
+    service.add_resource(Resource(route="/users", handlers=[("GET", "/")]))
+    service.add_resource(
+        Resource(
+            route="/posts",
+            handlers=[("GET", "/")],
+            config=ArrestConfig(verify=False, limits=httpx.Limits(max_connections=10)),
+        )
+    )
+
+    for _ in range(3):
+        await service.users.get("/")
+        await service.posts.get("/")
+
+    assert len(service._pool._clients) == 2
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_least_recently_used():
+    from arrest._config import ArrestConfig
+    from arrest._pool import ClientPool
+
+    pool = ClientPool(base_url=TEST_DEFAULT_SERVICE_URL, max_clients=2)
+    configs = [ArrestConfig(verify=False), ArrestConfig(http2=False), ArrestConfig()]
+
+    clients = []
+    for config in configs:
+        async with pool.lease(config) as client:
+            clients.append(client)
+
+    async with pool.lease(configs[2]):
+        pass
+
+    assert len(pool._clients) == 2
+    assert clients[0].is_closed
+    assert not clients[1].is_closed and not clients[2].is_closed
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_idle_clients():
+    from arrest._config import ArrestConfig
+    from arrest._pool import ClientPool
+
+    pool = ClientPool(base_url=TEST_DEFAULT_SERVICE_URL, idle_timeout=0)
+
+    async with pool.lease(ArrestConfig(verify=False)) as idle_client:
+        assert not idle_client.is_closed
+
+    async with pool.lease(ArrestConfig()) as client:
+        assert idle_client.is_closed
+        assert not client.is_closed
+
+    await pool.aclose()
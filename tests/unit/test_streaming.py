@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from arrest.streaming import JSONArrayDecoder
+
+DOCUMENT = [
+    {"id": 1, "name": "a, [b] {c}", "tags": ["x", "y"]},
+    {"id": 2, "quote": 'he said "hi"\\', "nested": {"list": [[], {}]}},
+    "plain, string",
+    12.5,
+    None,
+    [1, [2, 3]],
+    "ünïcødé ✓",
+]
+
+
+def decode(chunks: list[bytes]) -> list:
+    decoder = JSONArrayDecoder()
+    elements = [el for chunk in chunks for el in decoder.feed(chunk)]
+    decoder.close()
+    return elements
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 10_000])
+def test_json_array_decoder_chunks(chunk_size):
+    data = b"  \n" + json.dumps(DOCUMENT, ensure_ascii=False).encode() + b"\n"
+    chunks = [data[idx : idx + chunk_size] for idx in range(0, len(data), chunk_size)]
+
+    assert decode(chunks) == DOCUMENT
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"[]", []),
+        (b"[ ]", []),
+        (b"[1]", [1]),
+        (b'[{"a":1},{"b":2}]', [{"a": 1}, {"b": 2}]),
+    ],
+)
+def test_json_array_decoder_small(data, expected):
+    assert decode([data]) == expected
+
+
+def test_json_array_decoder_keeps_only_current_element():
+    decoder = JSONArrayDecoder()
+    for idx in range(1000):
+        decoder.feed(b"[" if idx == 0 else b",")
+        decoder.feed(json.dumps({"id": idx}).encode())
+        assert sum(map(len, decoder._pieces or ())) < 20
+
+
+def test_json_array_decoder_does_not_rescan_cut_element(monkeypatch):
+    import arrest.streaming
+
+    scans: list[int] = []
+
+    def scan(text: str, pos: int):
+        scans.append(pos)
+        return json.JSONDecoder().raw_decode(text, pos)
+
+    monkeypatch.setattr(arrest.streaming, "_scan", scan)
+    element = {"text": 'a "quoted", [bracketed] {braced} \\ string', "list": [[2]]}
+    data = json.dumps([element] * 1000).encode()
+
+    assert decode([data[idx : idx + 100] for idx in range(0, len(data), 100)]) == (
+        [element] * 1000
+    )
+    # parsed from the start once per element, cut ones are scanned on after that
+    assert len(scans) == 1000
+
+
+@pytest.mark.parametrize("data", [b'{"a": 1}', b"[1, 2", b"[1,,2]"])
+def test_json_array_decoder_invalid(data):
+    with pytest.raises(ValueError):
+        decode([data])
@@ -3,11 +3,18 @@ import typing
 from dataclasses import dataclass
 from datetime import datetime
 
+import orjson
 import pytest
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, Field, RootModel
 
+from arrest.params import Body, File, Form, Header, Query
+from arrest.types import UploadFile
 from arrest.utils import (
+    compile_request_plan,
+    dump_json,
     extract_model_field,
+    extract_request_params,
+    get_type_adapter,
     extract_resource_and_suffix,
     join_url,
     jsonable_encoder,
@@ -54,6 +61,82 @@ def test_extract_model_field():
     assert dct == {}
 
 
+class PlanRequest(BaseModel):
+    limit: int = Query(10)
+    x_user_agent: str = Header("arrest", serialization_alias="x-user-agent")
+    name: str = Body(...)
+    email: str = Field(alias="emailAddress")
+    secret: str = Field("hidden", exclude=True)
+
+
+def test_compile_request_plan():
+    plan = compile_request_plan(PlanRequest)
+
+    assert plan.query == ("limit",)
+    assert plan.header == ("x-user-agent",)
+    assert plan.body == ("name", "emailAddress", "secret")
+    assert plan.files == ()
+    assert plan.is_json_body and not plan.is_form_body
+    assert compile_request_plan(PlanRequest) is plan
+
+
+def test_compile_request_plan_form_and_files():
+    class Upload(BaseModel):
+        user_id: str = Form(...)
+        avatar: UploadFile = File(...)
+
+    plan = compile_request_plan(Upload)
+    assert plan.body == ("user_id",)
+    assert plan.files == ("avatar",)
+    assert plan.is_form_body and not plan.is_json_body
+
+
+def test_compile_request_plan_mixed_raises():
+    class Mixed(BaseModel):
+        name: str
+        token: str = Form(...)
+
+    with pytest.raises(ValueError):
+        compile_request_plan(Mixed)
+
+
+def test_extract_request_params_from_plan():
+    args = extract_request_params(
+        request_type=None,
+        request_data=PlanRequest(name="abc", emailAddress="abc@email.com"),
+        query={"page": 1},
+    )
+
+    assert dict(args.query) == {"page": "1", "limit": "10"}
+    assert args.header["x-user-agent"] == "arrest"
+    assert orjson.loads(args.body) == {"name": "abc", "emailAddress": "abc@email.com"}
+    assert args.content_type == "application/json"
+
+
+def test_extract_request_params_custom_encoder():
+    from decimal import Decimal
+
+    args = extract_request_params(
+        request_type=None,
+        request_data={"price": Decimal("1.5")},
+        custom_encoder={Decimal: str},
+    )
+
+    assert orjson.loads(args.body) == {"price": "1.5"}
+
+
+def test_extract_request_params_aliased_params():
+    class AliasedRequest(BaseModel):
+        page_size: int = Query(10, alias="pageSize")
+        token: str = Header("t", alias="X-Token")
+
+    args = extract_request_params(request_type=None, request_data=AliasedRequest())
+
+    assert dict(args.query) == {"page_size": "10"}
+    assert args.header["token"] == "t"
+    assert args.body is None
+
+
 @pytest.mark.parametrize(
     argnames="parts, url",
     argvalues=[
@@ -163,6 +246,53 @@ def test_validate_model(type_, obj, new_type, member_type):
         assert isinstance(member, member_type)
 
 
+def test_get_type_adapter_cached():
+    assert get_type_adapter(list[MyModel]) is get_type_adapter(list[MyModel])
+    assert get_type_adapter(MyModel) is not get_type_adapter(list[MyModel])
+
+
+def test_get_type_adapter_unhashable_type():
+    type_ = typing.Annotated[int, {"unhashable": "metadata"}]
+
+    adapter = get_type_adapter(type_)
+    assert adapter is not get_type_adapter(type_)
+    assert validate_model(type_, "123") == 123
+
+
+def test_extract_request_params_skips_validation_for_instances(mocker):
+    validate = mocker.patch("arrest.utils.validate_model", side_effect=validate_model)
+
+    extract_request_params(
+        request_type=PlanRequest,
+        request_data=PlanRequest(name="abc", emailAddress="abc@email.com"),
+    )
+    assert validate.call_count == 0
+
+    extract_request_params(
+        request_type=PlanRequest,
+        request_data={"name": "abc", "emailAddress": "abc@email.com"},
+    )
+    assert validate.call_count == 1
+
+
+def test_extract_request_params_skips_computed_fields():
+    from pydantic import computed_field
+
+    class NameRequest(BaseModel):
+        name: str
+        nick: str = Field(alias="nickName")
+
+        @computed_field
+        @property
+        def upper(self) -> str:
+            return self.name.upper()
+
+    args = extract_request_params(
+        request_type=NameRequest, request_data={"name": "n", "nickName": "k"}
+    )
+    assert orjson.loads(args.body) == {"name": "n", "nickName": "k"}
+
+
 @pytest.mark.parametrize(
     argnames="obj, obj_serialized",
     argvalues=[
@@ -234,6 +364,109 @@ def test_jsonable_encoder_object_with_no___dict__():
         jsonable_encoder(obj)
 
 
+def test_jsonable_encoder_deep_payload():
+    deep = current = {}
+    for _ in range(10_000):
+        current["child"] = [{}]
+        current = current["child"][0]
+    current["leaf"] = MyEnum.field
+
+    encoded = jsonable_encoder(deep)
+    for _ in range(10_000):
+        encoded = encoded["child"][0]
+    assert encoded == {"leaf": "field"}
+
+
+def test_jsonable_encoder_custom_encoder():
+    from decimal import Decimal
+
+    class Price(Decimal):
+        pass
+
+    obj = {
+        "price": Decimal("1.5"),
+        "discount": Price("0.5"),
+        "model": MyModel(a="a", b="b", c=1),
+        "dc": MyModelDC(a="a", b="b", c=2),
+    }
+    encoded = jsonable_encoder(
+        obj,
+        custom_encoder={Decimal: str, MyModel: lambda m: {"a": m.a}, str: str.upper},
+    )
+
+    assert encoded == {
+        "PRICE": "1.5",
+        "DISCOUNT": "0.5",
+        "MODEL": {"A": "A"},
+        "DC": {"A": "A", "B": "B", "C": 2},
+    }
+
+    with pytest.raises(ValueError):
+        jsonable_encoder(Decimal("1.5"))
+
+
+class PlainObject:
+    def __init__(self, first: str, second: int) -> None:
+        self.first = first
+        self.second = second
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": [1, 2.5, None, True], "b": MyEnum.field},
+        [MyModel(a="a", b="b", c=123), MyModelDC(a="A", b="B", c=456)],
+        {"when": datetime(year=2023, month=1, day=1), 1: "int key"},
+        {"tags": {"x"}, "nested": {"val": MyModel(a="a", b="b", c=1)}},
+        MyModelRoot(root=[MyModel(a="a", b="b", c=123)]),
+        PlainObject(first="first", second=123),
+    ],
+)
+def test_dump_json(obj):
+    assert orjson.loads(dump_json(obj)) == orjson.loads(
+        orjson.dumps(jsonable_encoder(obj), option=orjson.OPT_NON_STR_KEYS)
+    )
+
+
+def test_dump_json_custom_encoder():
+    from decimal import Decimal
+
+    class Price(Decimal):
+        pass
+
+    obj = {"price": Decimal("1.5"), "discount": Price("0.5"), "tags": {"x"}}
+
+    assert orjson.loads(dump_json(obj, custom_encoder={Decimal: str})) == {
+        "price": "1.5",
+        "discount": "0.5",
+        "tags": ["x"],
+    }
+    assert dump_json(MyModel(a="a", b="b", c=1), {MyModel: lambda m: m.a}) == b'"a"'
+    with pytest.raises(TypeError):
+        dump_json(obj)
+
+
+def test_dump_json_deep_payload():
+    deep = current = {}
+    for _ in range(1_000):
+        current["child"] = [{1: MyEnum.field, "model": MyModel(a="a", b="b", c=1)}]
+        current = current["child"][0]
+
+    encoded = orjson.loads(dump_json(deep))
+    for _ in range(1_000):
+        encoded = encoded["child"][0]
+        assert encoded["1"] == "field"
+        assert encoded["model"] == {"a": "a", "b": "b", "c": 1}
+
+
+def test_dump_json_unsupported():
+    class PlainClass:
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        dump_json(PlainClass())
+
+
 @pytest.mark.asyncio
 async def test_retry_async(mocker):
     class Foo: